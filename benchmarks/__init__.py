@@ -0,0 +1 @@
+"""Benchmark suite of the packet hot path of the controller, run with python -m benchmarks."""
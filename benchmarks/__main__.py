@@ -0,0 +1,116 @@
+"""Entry point of the benchmark suite, run with python -m benchmarks from the root of the repository."""
+
+import argparse
+import json
+import sys
+
+from loguru import logger
+
+from benchmarks.compare import (
+    compare_results,
+    format_comparison,
+    load_results,
+)
+from benchmarks.suite import BenchmarkResult, run_benchmarks
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command line arguments.
+
+    Returns:
+        An argparse namespace object, containing the parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the packet hot path of the controller, and compare the results with a previous run.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        default=None,
+        help="Write the results as JSON to the given path.",
+        metavar="PATH",
+    )
+    parser.add_argument(
+        "--compare",
+        type=str,
+        default=None,
+        help="Compare the results with the JSON results of a previous run, "
+        "exits with status 1 if any benchmark regressed by more than the threshold.",
+        metavar="PATH",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="The allowed relative slowdown of a benchmark when comparing. Defaults to 0.1 (10%%).",
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        type=str,
+        default="",
+        help="Only run the benchmarks of which the name contains the given string.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="The amount of times every benchmark is timed.",
+    )
+    parser.add_argument(
+        "--min_time",
+        type=float,
+        default=0.1,
+        help="The minimum amount of seconds of a timed repeat, used to calibrate the amount of operations.",
+    )
+    return parser.parse_args()
+
+
+def print_result(name: str, result: BenchmarkResult):
+    """
+    Print the result of a benchmark once it is measured.
+
+    Args:
+        name: The name of the benchmark.
+        result: The result of the benchmark.
+    """
+    print(
+        f"{name:<50} {result.median_ns / 1000:>12.3f}us {result.operations_per_second:>14.0f} ops/s",
+        flush=True,
+    )
+
+
+def main(args: argparse.Namespace) -> int:
+    """
+    Main entry point.
+
+    Args:
+        args: Command line arguments.
+
+    Returns:
+        int: The exit status, 1 if a benchmark regressed compared to the baseline.
+    """
+    # The strategies log their configuration at debug level, which would bury the results
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    baseline = load_results(args.compare) if args.compare else None
+    results = run_benchmarks(args.filter, args.repeat, args.min_time, print_result)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if baseline is None:
+        return 0
+    comparisons = compare_results(baseline, results)
+    print()
+    print(format_comparison(comparisons, args.threshold))
+    return 1 if any(c.is_regression(args.threshold) for c in comparisons) else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main(parse_args()))
@@ -0,0 +1,113 @@
+"""Comparison of the results of two benchmark runs, to detect performance regressions."""
+
+import json
+from typing import Any, Dict, List, NamedTuple
+
+
+class Comparison(NamedTuple):
+    """The change of the median time of a benchmark between two runs."""
+
+    name: str
+    baseline_ns: float
+    current_ns: float
+
+    @property
+    def ratio(self) -> float:
+        """The current time divided by the baseline time, above 1 means the benchmark got slower."""
+        return self.current_ns / self.baseline_ns if self.baseline_ns > 0 else 1.0
+
+    def is_regression(self, threshold: float) -> bool:
+        """
+        Check whether the benchmark got slower by more than the threshold.
+
+        Args:
+            threshold: The allowed relative slowdown, e.g. 0.1 for 10%.
+
+        Returns:
+            bool: Whether the benchmark regressed.
+        """
+        return self.ratio > 1 + threshold
+
+
+def load_results(filepath: str) -> Dict[str, Any]:
+    """
+    Load the results of a benchmark run.
+
+    Args:
+        filepath: Path of the JSON file written by python -m benchmarks.
+
+    Returns:
+        Dict[str, Any]: The metadata and results of the run.
+
+    Raises:
+        ValueError: If the file does not contain benchmark results.
+    """
+    with open(filepath) as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or "results" not in data:
+        raise ValueError(f"{filepath} does not contain benchmark results")
+    return data
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: Dict[str, Any]
+) -> List[Comparison]:
+    """
+    Compare the median times of the benchmarks which are in both runs.
+
+    Args:
+        baseline: The results of the baseline run.
+        current: The results of the current run.
+
+    Returns:
+        List[Comparison]: The comparison of every common benchmark, in the order of the current run.
+    """
+    return [
+        Comparison(
+            name,
+            baseline["results"][name]["median_ns"],
+            result["median_ns"],
+        )
+        for name, result in current["results"].items()
+        if name in baseline["results"]
+    ]
+
+
+def format_comparison(comparisons: List[Comparison], threshold: float) -> str:
+    """
+    Format comparisons as a table, marking the regressions.
+
+    Args:
+        comparisons: The comparisons to format.
+        threshold: The allowed relative slowdown.
+
+    Returns:
+        str: The table.
+    """
+    width = max((len(c.name) for c in comparisons), default=9)
+    lines = [
+        f"{'benchmark':<{width}}  {'baseline':>12}  {'current':>12}  {'change':>8}"
+    ]
+    for c in comparisons:
+        marker = "  REGRESSION" if c.is_regression(threshold) else ""
+        lines.append(
+            f"{c.name:<{width}}  {_format_ns(c.baseline_ns):>12}  {_format_ns(c.current_ns):>12}  "
+            f"{(c.ratio - 1) * 100:>+7.1f}%{marker}"
+        )
+    return "\n".join(lines)
+
+
+def _format_ns(nanoseconds: float) -> str:
+    """
+    Format a duration with a readable unit.
+
+    Args:
+        nanoseconds: The duration in nanoseconds.
+
+    Returns:
+        str: The formatted duration.
+    """
+    for unit, size in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if nanoseconds >= size:
+            return f"{nanoseconds / size:.2f}{unit}"
+    return f"{nanoseconds:.0f}ns"
@@ -0,0 +1,263 @@
+"""Realistic XRPL messages and networks, used as the input of the benchmarks."""
+
+import random
+from typing import Dict, List
+
+from google.protobuf.message import Message
+
+from protos import packet_pb2, ripple_pb2
+from rocket_controller.encoder_decoder import PacketEncoderDecoder
+from rocket_controller.interceptor_simulator import (
+    synthetic_node_info,
+    synthetic_traffic,
+)
+
+# Typical sizes of the fields of XRPL messages sent by xrpld validators.
+HASH_SIZE = 32
+PUBLIC_KEY_SIZE = 33
+SIGNATURE_SIZE = 71
+MANIFEST_SIZE = 239
+VALIDATION_SIZE = 201
+TRANSACTION_SIZE = 180
+LEDGER_NODE_SIZE = 400
+LEDGER_NODES = 256
+
+
+def realistic_messages(seed: int = 0) -> Dict[int, Message]:
+    """
+    Build a message of realistic size and content for every message type in PacketEncoderDecoder.message_type_map.
+
+    Args:
+        seed: Seed of the random hashes, keys and signatures.
+
+    Returns:
+        Dict[int, Message]: The message of every message type number.
+    """
+    rng = random.Random(seed)
+
+    def hash_() -> bytes:
+        return rng.randbytes(HASH_SIZE)
+
+    def public_key() -> bytes:
+        return b"\xed" + rng.randbytes(PUBLIC_KEY_SIZE - 1)
+
+    transaction = ripple_pb2.TMTransaction(
+        rawTransaction=rng.randbytes(TRANSACTION_SIZE),
+        status=ripple_pb2.tsNEW,
+        receiveTimestamp=800000000,
+    )
+
+    messages: Dict[int, Message] = {
+        2: ripple_pb2.TMManifests(
+            list=[
+                ripple_pb2.TMManifest(stobject=rng.randbytes(MANIFEST_SIZE))
+                for _ in range(5)
+            ]
+        ),
+        3: ripple_pb2.TMPing(
+            type=ripple_pb2.TMPing.ptPING, seq=42, pingTime=800000000, netTime=800000000
+        ),
+        5: ripple_pb2.TMCluster(
+            clusterNodes=[
+                ripple_pb2.TMClusterNode(
+                    publicKey=public_key().hex(),
+                    reportTime=800000000,
+                    nodeLoad=256,
+                    nodeName=f"validator_{i}",
+                    address=f"172.18.0.{i + 2}:51235",
+                )
+                for i in range(5)
+            ],
+            loadSources=[ripple_pb2.TMLoadSource(name="172.18.0.2", cost=100, count=3)],
+        ),
+        15: ripple_pb2.TMEndpoints(
+            version=2,
+            endpoints_v2=[
+                ripple_pb2.TMEndpoints.TMEndpointv2(
+                    endpoint=f"172.18.0.{i + 2}:51235", hops=i % 3
+                )
+                for i in range(5)
+            ],
+        ),
+        30: transaction,
+        31: ripple_pb2.TMGetLedger(
+            itype=ripple_pb2.liAS_NODE,
+            ltype=ripple_pb2.ltACCEPTED,
+            ledgerHash=hash_(),
+            ledgerSeq=100,
+            nodeIDs=[rng.randbytes(33) for _ in range(8)],
+            requestCookie=1234,
+            queryDepth=2,
+        ),
+        32: ripple_pb2.TMLedgerData(
+            ledgerHash=hash_(),
+            ledgerSeq=100,
+            type=ripple_pb2.liAS_NODE,
+            nodes=[
+                ripple_pb2.TMLedgerNode(
+                    nodedata=rng.randbytes(LEDGER_NODE_SIZE), nodeid=rng.randbytes(33)
+                )
+                for _ in range(LEDGER_NODES)
+            ],
+            requestCookie=1234,
+        ),
+        33: ripple_pb2.TMProposeSet(
+            proposeSeq=1,
+            currentTxHash=hash_(),
+            nodePubKey=public_key(),
+            closeTime=800000000,
+            signature=rng.randbytes(SIGNATURE_SIZE),
+            previousledger=hash_(),
+        ),
+        34: ripple_pb2.TMStatusChange(
+            newStatus=ripple_pb2.nsVALIDATING,
+            newEvent=ripple_pb2.neACCEPTED_LEDGER,
+            ledgerSeq=100,
+            ledgerHash=hash_(),
+            ledgerHashPrevious=hash_(),
+            networkTime=800000000,
+            firstSeq=1,
+            lastSeq=100,
+        ),
+        35: ripple_pb2.TMHaveTransactionSet(status=ripple_pb2.tsHAVE, hash=hash_()),
+        41: ripple_pb2.TMValidation(validation=rng.randbytes(VALIDATION_SIZE)),
+        42: ripple_pb2.TMGetObjectByHash(
+            type=ripple_pb2.TMGetObjectByHash.otTRANSACTION_NODE,
+            query=True,
+            seq=7,
+            ledgerHash=hash_(),
+            objects=[
+                ripple_pb2.TMIndexedObject(hash=hash_(), ledgerSeq=100)
+                for _ in range(16)
+            ],
+        ),
+        52: ripple_pb2.TMGetPeerShardInfo(hops=3),
+        53: ripple_pb2.TMPeerShardInfo(
+            shardIndexes="1-5", nodePubKey=public_key(), endpoint="172.18.0.2:51235"
+        ),
+        54: ripple_pb2.TMValidatorList(
+            manifest=rng.randbytes(MANIFEST_SIZE),
+            blob=rng.randbytes(2048),
+            signature=rng.randbytes(SIGNATURE_SIZE),
+            version=1,
+        ),
+        55: ripple_pb2.TMSquelch(
+            squelch=True, validatorPubKey=public_key(), squelchDuration=300
+        ),
+        56: ripple_pb2.TMValidatorListCollection(
+            version=2,
+            manifest=rng.randbytes(MANIFEST_SIZE),
+            blobs=[
+                ripple_pb2.ValidatorBlobInfo(
+                    blob=rng.randbytes(2048), signature=rng.randbytes(SIGNATURE_SIZE)
+                )
+                for _ in range(2)
+            ],
+        ),
+        57: ripple_pb2.TMProofPathRequest(
+            key=hash_(), ledgerHash=hash_(), type=ripple_pb2.lmACCOUNT_STATE
+        ),
+        58: ripple_pb2.TMProofPathResponse(
+            key=hash_(),
+            ledgerHash=hash_(),
+            type=ripple_pb2.lmACCOUNT_STATE,
+            ledgerHeader=rng.randbytes(118),
+            path=[rng.randbytes(LEDGER_NODE_SIZE) for _ in range(6)],
+        ),
+        59: ripple_pb2.TMReplayDeltaRequest(ledgerHash=hash_()),
+        60: ripple_pb2.TMReplayDeltaResponse(
+            ledgerHash=hash_(),
+            ledgerHeader=rng.randbytes(118),
+            transaction=[rng.randbytes(TRANSACTION_SIZE) for _ in range(20)],
+        ),
+        61: ripple_pb2.TMGetPeerShardInfoV2(
+            peerChain=[ripple_pb2.TMPublicKey(publicKey=public_key())], relays=2
+        ),
+        62: ripple_pb2.TMPeerShardInfoV2(
+            timestamp=800000000,
+            incomplete=[
+                ripple_pb2.TMPeerShardInfoV2.TMIncomplete(
+                    shardIndex=3, state=1, progress=50
+                )
+            ],
+            finalized="1-2",
+            publicKey=public_key(),
+            signature=rng.randbytes(SIGNATURE_SIZE),
+        ),
+        63: ripple_pb2.TMHaveTransactions(hashes=[hash_() for _ in range(32)]),
+        64: ripple_pb2.TMTransactions(transactions=[transaction] * 16),
+    }
+    return messages
+
+
+def realistic_packets(seed: int = 0) -> Dict[int, packet_pb2.Packet]:
+    """
+    Encode the realistic message of every message type in a packet between two nodes.
+
+    Args:
+        seed: Seed of the random hashes, keys and signatures.
+
+    Returns:
+        Dict[int, packet_pb2.Packet]: The packet of every message type number.
+    """
+    return {
+        message_type: packet_pb2.Packet(
+            data=PacketEncoderDecoder.encode_message(message, message_type),
+            from_port=60000,
+            to_port=60001,
+        )
+        for message_type, message in realistic_messages(seed).items()
+    }
+
+
+def network_config(node_amount: int) -> packet_pb2.Config:
+    """
+    Build the config of a network with the ports of the default network config.
+
+    Args:
+        node_amount: The amount of nodes in the network.
+
+    Returns:
+        packet_pb2.Config: The network config.
+    """
+    return packet_pb2.Config(
+        base_port_peer=60000,
+        base_port_ws=61000,
+        base_port_ws_admin=62000,
+        base_port_rpc=63000,
+        number_of_nodes=node_amount,
+    )
+
+
+def consensus_traffic(
+    nodes: List[packet_pb2.ValidatorNodeInfo], amount: int, seed: int = 0
+) -> List[packet_pb2.Packet]:
+    """
+    Generate the consensus traffic of a network.
+
+    Args:
+        nodes: The validator node info of the network.
+        amount: The amount of packets.
+        seed: Seed of the generated hashes and signatures.
+
+    Returns:
+        List[packet_pb2.Packet]: The packets, in the order they are sent.
+    """
+    traffic = synthetic_traffic(nodes, seed)
+    return [next(traffic) for _ in range(amount)]
+
+
+def validator_nodes(
+    node_amount: int, seed: int = 0
+) -> List[packet_pb2.ValidatorNodeInfo]:
+    """
+    Generate the validator node info of a network.
+
+    Args:
+        node_amount: The amount of nodes in the network.
+        seed: Seed of the generated keys.
+
+    Returns:
+        List[packet_pb2.ValidatorNodeInfo]: The validator node info, in the order of the peer IDs.
+    """
+    return synthetic_node_info(network_config(node_amount), seed)
@@ -0,0 +1,353 @@
+"""Benchmarks of the packet hot path, and the runner which measures them."""
+
+import asyncio
+import functools
+import itertools
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple
+
+from benchmarks.payloads import (
+    consensus_traffic,
+    realistic_messages,
+    realistic_packets,
+    validator_nodes,
+)
+from protos import packet_pb2
+from rocket_controller.binary_action_log import BinaryActionLogger
+from rocket_controller.csv_logger import ActionLogger
+from rocket_controller.encoder_decoder import DecodedPacket, PacketEncoderDecoder
+from rocket_controller.iteration_type import NoneIteration
+from rocket_controller.message_action import MessageAction
+from rocket_controller.message_action_buffer import MessageActionBuffer
+from rocket_controller.network_manager import NetworkManager
+from rocket_controller.packet_server import to_validator_node
+from rocket_controller.strategies import (
+    AsyncStrategy,
+    MutationExample,
+    RandomFuzzer,
+    Strategy,
+)
+from rocket_controller.strategies.evo_delay_strategy import EvoDelayStrategy
+from rocket_controller.strategies.evo_priority_strategy import EvoPriorityStrategy
+
+# The amount of nodes of the benchmarked network, the encodings of the bundled evolutionary strategies are for 5 nodes.
+NODE_AMOUNT = 5
+# Directory under ./logs the logger benchmarks write to, removed afterwards.
+LOG_DIRECTORY = "benchmarks"
+
+
+class Benchmark(NamedTuple):
+    """
+    A single operation to measure.
+
+    If number is None, the amount of operations per repeat is calibrated to take at least the minimum time.
+    finish is called at the end of every repeat and counted in its time, e.g. to wait for buffered writes.
+    """
+
+    name: str
+    operation: Callable[[], Any]
+    number: int | None = None
+    finish: Callable[[], Any] | None = None
+
+
+class BenchmarkResult(NamedTuple):
+    """The measured time of a benchmark, in nanoseconds per operation."""
+
+    number: int
+    repeat: int
+    min_ns: float
+    median_ns: float
+
+    @property
+    def operations_per_second(self) -> float:
+        """The amount of operations per second, according to the median time."""
+        return 1e9 / self.median_ns if self.median_ns > 0 else 0.0
+
+
+def encoder_decoder_benchmarks() -> Iterator[Benchmark]:
+    """
+    Decode and encode the realistic message of every supported message type.
+
+    Yields:
+        Benchmark: The benchmarks.
+    """
+    packets = realistic_packets()
+    for message_type, message in realistic_messages().items():
+        name = message.__class__.__name__
+        packet = packets[message_type]
+        yield Benchmark(
+            f"decode_packet/{name}",
+            functools.partial(PacketEncoderDecoder.decode_packet, packet),
+        )
+        yield Benchmark(
+            f"encode_message/{name}",
+            functools.partial(
+                PacketEncoderDecoder.encode_message, message, message_type
+            ),
+        )
+    proposal = packets[33]
+    yield Benchmark(
+        "peek_header", lambda: PacketEncoderDecoder.peek_header(proposal.data)
+    )
+
+
+def message_action_buffer_benchmarks() -> Iterator[Benchmark]:
+    """
+    Add and match entries of a full MessageActionBuffer.
+
+    Yields:
+        Benchmark: The benchmarks.
+    """
+    traffic = consensus_traffic(validator_nodes(NODE_AMOUNT), 1024)
+    message_actions = [MessageAction(packet.data, packet.data, 0) for packet in traffic]
+    buffer = MessageActionBuffer(NODE_AMOUNT + 1)
+    entries = itertools.cycle(message_actions)
+    for _ in range(buffer.capacity):
+        buffer.add(next(entries))
+    yield Benchmark("message_action_buffer/add", lambda: buffer.add(next(entries)))
+
+    stored = buffer.messages[-1].initial_message
+    yield Benchmark(
+        "message_action_buffer/match_hit",
+        lambda: buffer.match_previous_messages(stored),
+    )
+    missing = traffic[0].data + b"\x00"
+    yield Benchmark(
+        "message_action_buffer/match_miss",
+        lambda: buffer.match_previous_messages(missing),
+    )
+
+
+def network_manager_benchmarks() -> Iterator[Benchmark]:
+    """
+    Match broadcast messages against the subsets of a NetworkManager.
+
+    Yields:
+        Benchmark: The benchmarks.
+    """
+    network = NetworkManager(auto_parse_identical=True, auto_parse_subsets=True)
+    network.network_config = {}
+    network.update_network(
+        [to_validator_node(node) for node in validator_nodes(NODE_AMOUNT)]
+    )
+    peers = list(range(NODE_AMOUNT))
+    network.set_subsets_dict(
+        {peer_id: [p for p in peers if p != peer_id] for peer_id in peers}
+    )
+
+    broadcast = consensus_traffic(validator_nodes(NODE_AMOUNT), 1)[0].data
+    network.set_message_action(0, 1, broadcast, broadcast, 0)
+    yield Benchmark(
+        "network_manager/check_subsets_hit",
+        lambda: network.check_subsets(0, 2, broadcast),
+    )
+    missing = broadcast + b"\x00"
+    yield Benchmark(
+        "network_manager/check_subsets_miss",
+        lambda: network.check_subsets(0, 2, missing),
+    )
+
+
+def strategy_benchmarks() -> Iterator[Benchmark]:
+    """
+    Process consensus traffic with every bundled strategy, including the automatic processes of Strategy.
+
+    Every operation processes a new packet, so the automatic processes see realistic traffic instead of one message.
+
+    Yields:
+        Benchmark: The benchmarks.
+    """
+    nodes = validator_nodes(NODE_AMOUNT)
+    number = 1000
+    traffic = consensus_traffic(nodes, number * 5)
+    strategy_classes: List[type[Strategy]] = [
+        RandomFuzzer,
+        MutationExample,
+        EvoDelayStrategy,
+        EvoPriorityStrategy,
+    ]
+    # An AsyncStrategy processes its packets on an event loop, like the async server does
+    loop = asyncio.new_event_loop()
+
+    def process_packet(strategy: Strategy, packets: Iterator[packet_pb2.Packet]):
+        # Wrap the packet for every operation, like the server does, so its decoded message is not cached
+        packet = DecodedPacket(next(packets))
+        if isinstance(strategy, AsyncStrategy):
+            loop.run_until_complete(strategy.process_packet(packet))
+        else:
+            strategy.process_packet(packet)
+
+    for strategy_class in strategy_classes:
+        strategy = strategy_class(iteration_type=NoneIteration())  # type: ignore[call-arg]
+        strategy.update_network([to_validator_node(node) for node in nodes])
+        yield Benchmark(
+            f"process_packet/{strategy_class.__name__}",
+            functools.partial(process_packet, strategy, itertools.cycle(traffic)),
+            number=number,
+        )
+        if isinstance(strategy, EvoPriorityStrategy):
+            strategy.stop()
+    loop.close()
+
+
+def action_logger_benchmarks() -> Iterator[Benchmark]:
+    """
+    Log actions with the csv and binary action loggers, including the time to write them.
+
+    Yields:
+        Benchmark: The benchmarks.
+    """
+    nodes = [to_validator_node(node) for node in validator_nodes(NODE_AMOUNT)]
+    packets = realistic_packets()
+    proposal = DecodedPacket(packets[33])
+
+    # Closing the logger writes the queued rows right away, flushing waits for the writer to fill a batch first
+    csv_loggers = [ActionLogger(f"{LOG_DIRECTORY}/csv", nodes)]
+
+    def close_csv_logger():
+        csv_loggers[0].close()
+        csv_loggers[0] = ActionLogger(f"{LOG_DIRECTORY}/csv", nodes)
+
+    yield Benchmark(
+        "action_logger/log_action",
+        lambda: csv_loggers[0].log_action(
+            0, 1, 0, 1, proposal.message_name, proposal.text, proposal.text
+        ),
+        finish=close_csv_logger,
+    )
+
+    def log_packet(
+        logger: ActionLogger | BinaryActionLogger | None, packet: packet_pb2.Packet
+    ):
+        # Wrap the packet for every action, like the server does, so the rendered text is not cached.
+        # None logs to the current csv logger, which is replaced after every repeat.
+        decoded = DecodedPacket(packet)
+        (logger or csv_loggers[0]).log_packet(0, 1, 0, 1, decoded, decoded)
+
+    for message_type in (33, 32):
+        name = PacketEncoderDecoder.message_type_map[message_type].__name__
+        yield Benchmark(
+            f"action_logger/log_packet/{name}",
+            functools.partial(log_packet, None, packets[message_type]),
+            finish=close_csv_logger,
+        )
+    csv_loggers[0].close()
+
+    binary_logger = BinaryActionLogger(f"{LOG_DIRECTORY}/binary", nodes)
+    for message_type in (33, 32):
+        name = PacketEncoderDecoder.message_type_map[message_type].__name__
+        yield Benchmark(
+            f"binary_action_logger/log_packet/{name}",
+            functools.partial(log_packet, binary_logger, packets[message_type]),
+            finish=binary_logger.flush,
+        )
+    binary_logger.close()
+    shutil.rmtree(f"./logs/{LOG_DIRECTORY}", ignore_errors=True)
+    if os.path.isdir("./logs") and not os.listdir("./logs"):
+        os.rmdir("./logs")
+
+
+# Groups of benchmarks, every group sets up its input once and cleans up after its last benchmark.
+BENCHMARK_GROUPS: List[Callable[[], Iterator[Benchmark]]] = [
+    encoder_decoder_benchmarks,
+    message_action_buffer_benchmarks,
+    network_manager_benchmarks,
+    strategy_benchmarks,
+    action_logger_benchmarks,
+]
+
+
+def measure(
+    benchmark: Benchmark, repeat: int = 5, min_time: float = 0.1
+) -> BenchmarkResult:
+    """
+    Measure the time per operation of a benchmark.
+
+    Args:
+        benchmark: The benchmark to measure.
+        repeat: The amount of times the operations are timed.
+        min_time: The minimum amount of seconds of a repeat, used to calibrate the amount of operations.
+
+    Returns:
+        BenchmarkResult: The time per operation of every repeat, summarized.
+    """
+
+    def time_operations(number: int) -> float:
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            benchmark.operation()
+        if benchmark.finish is not None:
+            benchmark.finish()
+        return time.perf_counter_ns() - start
+
+    number = benchmark.number
+    if number is None:
+        number = 1
+        while time_operations(number) < min_time * 1e9:
+            number *= 2
+
+    times = [time_operations(number) / number for _ in range(repeat)]
+    return BenchmarkResult(number, repeat, min(times), statistics.median(times))
+
+
+def run_benchmarks(
+    name_filter: str = "",
+    repeat: int = 5,
+    min_time: float = 0.1,
+    report: Callable[[str, BenchmarkResult], Any] | None = None,
+) -> Dict[str, Any]:
+    """
+    Run the benchmarks and collect their results in a JSON serializable dictionary.
+
+    Args:
+        name_filter: Only benchmarks of which the name contains this string are run.
+        repeat: The amount of times the operations of a benchmark are timed.
+        min_time: The minimum amount of seconds of a repeat of a calibrated benchmark.
+        report: Called with the name and result of every benchmark, once it is measured.
+
+    Returns:
+        Dict[str, Any]: The metadata of the run, and the results by benchmark name.
+    """
+    results: Dict[str, Any] = {}
+    for group in BENCHMARK_GROUPS:
+        for benchmark in group():
+            if name_filter not in benchmark.name:
+                continue
+            result = measure(benchmark, repeat, min_time)
+            results[benchmark.name] = {
+                **result._asdict(),
+                "operations_per_second": result.operations_per_second,
+            }
+            if report is not None:
+                report(benchmark.name, result)
+
+    return {
+        "metadata": {
+            "commit": _current_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def _current_commit() -> str | None:
+    """
+    Look up the commit the benchmarks are run on.
+
+    Returns:
+        str | None: The hash of the checked out commit, None if it is not a git repository.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, check=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
@@ -1,25 +1,48 @@
 """This file contains a class to run and manage evolutionary based testing approaches."""
 import argparse
+import asyncio
+import json
+import multiprocessing
+import os
 import random
+from datetime import datetime
 from pathlib import Path
 
+import numpy as np
 import yaml
-from typing import Tuple
+from typing import Any, Dict, Tuple
+
+from rocket_controller import genetic_operators
+from rocket_controller.async_packet_server import serve_async
 
 from rocket_controller.cli_helper import process_args, str_to_strategy
+from rocket_controller.evaluation_pool import EvaluationPool
+from rocket_controller.fitness import SUMMARY_VERSION, FitnessWeights, RunMetrics, run_fitness
+from rocket_controller.fitness_cache import FitnessCache
+from rocket_controller.helper import format_datetime, yaml_to_dict
+from rocket_controller.interceptor_manager import InterceptorManager
+from rocket_controller.migration import MigrationExchange
 from rocket_controller.packet_server import serve
-from rocket_controller.strategies import Strategy
+from rocket_controller.parallel_executor import (
+    DEFAULT_NETWORK_CONFIG,
+    WorkerConfig,
+    plan_workers,
+    prepare_interceptor_dir,
+)
+from rocket_controller.strategies import AsyncStrategy, Strategy
+from rocket_controller.surrogate import SURROGATES, Surrogate, screen
 
 
 class EvoTestManager:
     """Manager for evolutionary based testing approaches."""
 
-    def __init__(self, config_path='evo_test_manager.yaml'):
+    def __init__(self, config_path='evo_test_manager.yaml', island=0):
         """
         Initializes an EvoTestManager.
         
         Args:
             config_path: path to the config file.
+            island: the island this manager evolves, when the config has multiple islands.
         """
         config_path = Path(config_path)
         if not config_path.exists():
@@ -39,11 +62,27 @@ class EvoTestManager:
             raise ValueError(f"strategy should be in {{'EvoDelayStrategy', 'EvoPriorityStrategy'}}, but got {strategy}")
         self.strategy = strategy
 
+        # Islands section of the config file, every island evolves its own populations in its own process
+        islands = self._config.get('islands') or {}
+        count = islands.get('count', 1)
+        if count < 1:
+            raise ValueError(f"islands count should be at least 1, but got {count}")
+        if not 0 <= island < count:
+            raise ValueError(f"island should be between 0 and {count - 1}, but got {island}")
+        self.islands = count
+        self.island = island
+
         seed = self._config['general'].get('seed', None)
         if seed is None:
+            if count > 1:
+                raise ValueError("islands find each other's migrants by the seed, so the seed should be specified")
             seed = random.randint(0, 1000000)
             print(f"seed not specified, using {seed}")
+        # Every island starts from different populations
+        seed += island
         random.seed(seed)
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
 
         # Evolution section of the config file
         population_size = self._config['evolution']['population_size']
@@ -56,40 +95,287 @@ class EvoTestManager:
             raise ValueError(f"generations should be at least 1, but got {generations}")
         self.generations = generations
 
+        # Genetic operators, see rocket_controller.genetic_operators
+        evolution = self._config['evolution']
+        selection = evolution.get('selection', 'tournament')
+        if selection not in ['tournament', 'rank']:
+            raise ValueError(f"selection should be in {{'tournament', 'rank'}}, but got {selection}")
+        self.selection_method = selection
+        tournament_size = evolution.get('tournament_size', 3)
+        if tournament_size < 1:
+            raise ValueError(f"tournament_size should be at least 1, but got {tournament_size}")
+        self.tournament_size = tournament_size
+
+        crossover = evolution.get('crossover', 'uniform')
+        if crossover not in ['uniform', 'k_point']:
+            raise ValueError(f"crossover should be in {{'uniform', 'k_point'}}, but got {crossover}")
+        self.crossover_method = crossover
+        crossover_points = evolution.get('crossover_points', 2)
+        if crossover_points < 1:
+            raise ValueError(f"crossover_points should be at least 1, but got {crossover_points}")
+        self.crossover_points = crossover_points
+        crossover_rate = evolution.get('crossover_rate', 0.9)
+        if not 0 <= crossover_rate <= 1:
+            raise ValueError(f"crossover_rate should be between 0 and 1, but got {crossover_rate}")
+        self.crossover_rate = crossover_rate
+
+        mutation = evolution.get('mutation', 'gaussian')
+        if mutation not in ['gaussian', 'uniform']:
+            raise ValueError(f"mutation should be in {{'gaussian', 'uniform'}}, but got {mutation}")
+        self.mutation_method = mutation
+        mutation_rate = evolution.get('mutation_rate', 0.05)
+        if not 0 <= mutation_rate <= 1:
+            raise ValueError(f"mutation_rate should be between 0 and 1, but got {mutation_rate}")
+        self.mutation_rate = mutation_rate
+        self.mutation_sigma = evolution.get('mutation_sigma', 0.1)
+
+        elitism = evolution.get('elitism', 1)
+        if not 0 <= elitism < population_size:
+            raise ValueError(f"elitism should be at least 0 and smaller than population_size, but got {elitism}")
+        self.elitism = elitism
+
+        best = evolution.get('best_populations', 5)
+        if best < 1:
+            raise ValueError(f"best_populations should be at least 1, but got {best}")
+        self.best_populations_kept = best
+
+        # Network runs evaluated concurrently, every run gets its own controller port and network ports
+        parallelism = self._config['evolution'].get('parallelism', 1)
+        if parallelism < 1:
+            raise ValueError(f"parallelism should be at least 1, but got {parallelism}")
+        self.parallelism = parallelism
+        retries = self._config['evolution'].get('retries', 1)
+        if retries < 0:
+            raise ValueError(f"retries should be at least 0, but got {retries}")
+        self.retries = retries
+        self.evaluation_timeout = self._config['evolution'].get('evaluation_timeout', None)
+        self.log_dir = format_datetime(datetime.now())
+        self.generation = 0
+
+        self.exchange: MigrationExchange | None = None
+        if self.islands > 1:
+            self.log_dir = f"{self.log_dir}-island-{island}"
+            migration_interval = islands.get('migration_interval', 5)
+            if migration_interval < 1:
+                raise ValueError(f"migration_interval should be at least 1, but got {migration_interval}")
+            self.migration_interval = migration_interval
+            migrants = islands.get('migrants', 2)
+            if not 1 <= migrants < population_size:
+                raise ValueError(f"migrants should be at least 1 and smaller than population_size, but got {migrants}")
+            self.migrants = migrants
+            self.migration_timeout = islands.get('migration_timeout', 600)
+            self.exchange = MigrationExchange(
+                islands.get('exchange_dir', './logs/islands'), island, count, namespace=f"seed-{seed - island}-"
+            )
+
+        # Cache section of the config file, results are only cached if a path is given
+        cache = self._config.get('cache') or {}
+        self.cache: FitnessCache | None = None
+        self.cache_rng = random.Random(seed)
+        if cache.get('path'):
+            self.cache = FitnessCache(
+                cache['path'],
+                min_samples=cache.get('min_samples', 1),
+                max_samples=cache.get('max_samples', cache.get('min_samples', 1)),
+                resample_probability=cache.get('resample_probability', 0.0),
+                rng=self.cache_rng,
+            )
+
         # Encoding section of the config file
         encoding = self._config['encoding']
         self.encoding_min = encoding['min_value']
         self.encoding_max = encoding['max_value']
         self.encoding_length = (self.nodes * (self.nodes - 1)) * 7
 
+        # The fittest populations of all generations so far, fittest first
+        self.best_populations = np.empty((0, self.encoding_length), dtype=np.int64)
+        self.best_fitness = np.empty(0)
+
+        # Fitness section of the config file
+        fitness = self._config.get('fitness') or {}
+        weights = {name: fitness[name] for name in FitnessWeights._fields if name in fitness}
+        self.fitness_weights = FitnessWeights(**weights)
+        abort_after = fitness.get('abort_after', None)
+        if abort_after is not None and abort_after < 1:
+            raise ValueError(f"abort_after should be at least 1, but got {abort_after}")
+        self.abort_after = abort_after
+        self.abort_below = fitness.get('abort_below', 0.0)
+
+        # Surrogate section of the config file, every population is run if no model is given
+        surrogate = self._config.get('surrogate') or {}
+        self.surrogate: Surrogate | None = None
+        if surrogate.get('model'):
+            model = surrogate['model']
+            if model not in SURROGATES:
+                raise ValueError(f"surrogate model should be in {set(SURROGATES)}, but got {model}")
+            if self.cache is None:
+                raise ValueError("the surrogate is fitted on the cache, so the cache path should be specified")
+            self.surrogate = SURROGATES[model](
+                self.encoding_min, self.encoding_max, **surrogate.get('options', {})
+            )
+            evaluations = surrogate.get('evaluations', population_size)
+            if evaluations < 1:
+                raise ValueError(f"surrogate evaluations should be at least 1, but got {evaluations}")
+            self.surrogate_evaluations = evaluations
+            self.surrogate_exploration = surrogate.get('exploration', 1.0)
+            self.surrogate_min_samples = surrogate.get('min_samples', 10)
+
+
+    def __getstate__(self):
+        """Pickle the manager without its cache, the processes running rocket only need the configuration."""
+        state = self.__dict__.copy()
+        state['cache'] = None
+        return state
 
     def initial_population(self):
-        return [random.randint(self.encoding_min, self.encoding_max) for _ in range(self.encoding_length)]
-
-    def selection(self, results: list[Tuple[list[int], list[int]]]):
-        # TODO first list[int] is a placeholder, should be the type of results from run_rocket
-        # TODO run fitness function on the results, then determine which ones are fit
-        # Temporarily passthrough all populations
-        populations = []
-        for result, population in results:
-            populations.append(population)
-        return populations
+        return self.initial_populations(1)[0].tolist()
 
-    def reproduction(self, populations: list[list[int]]):
-        # TODO Crossover
+    def initial_populations(self, size: int) -> np.ndarray:
+        """
+        Create random populations.
 
-        # TODO Mutation
+        Args:
+            size: the amount of populations.
 
-        # Temporarily passthrough all populations
-        return populations
+        Returns:
+            A size x encoding_length matrix with a population on every row.
+        """
+        return genetic_operators.random_population(
+            self.rng, size, self.encoding_length, self.encoding_min, self.encoding_max
+        )
+
+    def fitness(self, result: Any) -> float:
+        """
+        Score the result of a run, higher is fitter.
+
+        Args:
+            result: the result of run_rocket, None if the run failed.
+
+        Returns:
+            The weighted metrics of the iterations of the run, -inf for failed runs so they are never selected
+            over a successful run.
+        """
+        if result is None:
+            return -np.inf
+        return run_fitness(result, self.fitness_weights)
+
+    def pre_screen(self, populations: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Pick the populations worth running, by fitting the surrogate on the cache.
+
+        Populations are picked by their upper confidence bound, so both promising populations and populations
+        unlike any cached population are run. Without a surrogate, or too few cached populations to fit it on,
+        every population is run.
+
+        Args:
+            populations: the candidate populations, one on every row.
+
+        Returns:
+            The indices of the populations to run, and the predicted fitness of every population.
+        """
+        every_population = np.arange(len(populations))
+        if self.surrogate is None or self.surrogate_evaluations >= len(populations):
+            return every_population, np.full(len(populations), -np.inf)
 
+        # The cache is shared with other strategies, networks and seeds, whose keys differ
+        evaluated = [
+            (encoding, results)
+            for key, encoding, results in self.cache.evaluations()
+            if key == self.cache_key(encoding)
+        ]
+        if len(evaluated) < self.surrogate_min_samples:
+            return every_population, np.full(len(populations), -np.inf)
 
-    def run_rocket(self, encoding: list[int]):
+        encodings = np.array([encoding for encoding, _ in evaluated])
+        fitness = np.array([np.mean([self.fitness(result) for result in results]) for _, results in evaluated])
+        self.surrogate.fit(encodings, fitness)
+        prediction, uncertainty = self.surrogate.predict(populations)
+        selected = screen(prediction, uncertainty, self.surrogate_evaluations, self.surrogate_exploration)
+        print(f"Surrogate selected {len(selected)} of {len(populations)} populations, fitted on {len(evaluated)}")
+        return selected, prediction
+
+    def evaluate_generation(self, populations: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Determine the fitness of every population, running the populations picked by pre-screening.
+
+        Args:
+            populations: the populations, one on every row.
+
+        Returns:
+            The fitness of every population, the predicted fitness for populations which were not run,
+            and whether the fitness of every population was measured by running it.
+        """
+        selected, fitness = self.pre_screen(populations)
+        results = self.run_evolution_round(populations[selected].tolist())
+        fitness[selected] = [population_fitness for population_fitness, _ in results]
+        measured = np.zeros(len(populations), dtype=bool)
+        measured[selected] = True
+        return fitness, measured
+
+    def selection(
+        self, populations: np.ndarray, fitness: np.ndarray, measured: np.ndarray | None = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Select the elites, which survive unchanged, and the parents of the next generation.
+
+        Args:
+            populations: the populations, one on every row.
+            fitness: the fitness of every population.
+            measured: whether the fitness of every population was measured, only measured populations become
+                elites. None if every fitness was measured.
+
+        Returns:
+            The elites, and a matrix with the two parents of every child on consecutive rows.
+        """
+        candidates = np.arange(len(populations)) if measured is None else np.flatnonzero(measured)
+        elites = populations[candidates[genetic_operators.elite_indices(fitness[candidates], self.elitism)]]
+        parents = 2 * (self.population_size - len(elites))
+        if self.selection_method == 'tournament':
+            selected = genetic_operators.tournament_selection(self.rng, fitness, parents, self.tournament_size)
+        else:
+            selected = genetic_operators.rank_selection(self.rng, fitness, parents)
+        return elites, populations[selected]
+
+    def reproduction(self, elites: np.ndarray, parents: np.ndarray) -> np.ndarray:
+        """
+        Create the next generation, by crossing over and mutating the parents and adding the elites.
+
+        Args:
+            elites: the populations which survive unchanged.
+            parents: the two parents of every child on consecutive rows.
+
+        Returns:
+            The populations of the next generation, the elites first.
+        """
+        parents_a, parents_b = parents[0::2], parents[1::2]
+        if self.crossover_method == 'uniform':
+            children = genetic_operators.uniform_crossover(self.rng, parents_a, parents_b, self.crossover_rate)
+        else:
+            children = genetic_operators.k_point_crossover(
+                self.rng, parents_a, parents_b, self.crossover_points, self.crossover_rate
+            )
+
+        if self.mutation_method == 'gaussian':
+            children = genetic_operators.gaussian_mutation(
+                self.rng, children, self.mutation_rate, self.mutation_sigma, self.encoding_min, self.encoding_max
+            )
+        else:
+            children = genetic_operators.uniform_mutation(
+                self.rng, children, self.mutation_rate, self.encoding_min, self.encoding_max
+            )
+        return np.vstack([elites, children])
+
+
+    def run_rocket(self, encoding: list[int], worker: WorkerConfig | None = None):
         """
         Run rocket with set configurations.
 
         Args:
             encoding: encoding of numbers to be used by evolutionary strategy
+            worker: ports and directories to run the network with, defaults to the ports of the network config
+
+        Returns:
+            The summary of the metrics of every iteration of the run, see RunMetrics.summary, and the encoding.
         """
 
         if len(encoding) != self.encoding_length:
@@ -108,29 +394,362 @@ class EvoTestManager:
         # Do note: for more granular configurations, modify params_dict directly
         # See the constructor of Strategy for all possible parameters
         # The above Namespace may even be removed entirely as its functionalities are limited
+        if worker is not None:
+            params_dict['network_overrides'] = {**params_dict.get('network_overrides', {}), **worker.network_overrides}
+            params_dict['log_dir'] = worker.log_dir
         strategy: Strategy = str_to_strategy(self.strategy)(**params_dict)
-        server = serve(strategy)
-        server.wait_for_termination()
-        return [], encoding # TODO should return some sort of results
+        metrics = RunMetrics(self.fitness_weights, self.abort_after, self.abort_below)
+        strategy.iteration_type.set_run_metrics(metrics)
+        serve_params: Dict[str, Any] = {}
+        if worker is not None:
+            # Concurrent runs must not stop each other's containers, so a run only stops those publishing its ports
+            strategy.iteration_type.set_interceptor_manager(
+                InterceptorManager(
+                    worker.interceptor_dir,
+                    worker.controller_port,
+                    cleanup_containers=self.parallelism == 1 and self.islands == 1,
+                    container_ports=worker.node_ports,
+                )
+            )
+            serve_params['port'] = worker.controller_port
+
+        if isinstance(strategy, AsyncStrategy):
+            # Strategies holding packets, like EvoPriorityStrategy, wait on the event loop of an async server
+            async def serve_until_terminated():
+                server = await serve_async(strategy, **serve_params)
+                await server.wait_for_termination()
+
+            asyncio.run(serve_until_terminated())
+        else:
+            serve(strategy, **serve_params).wait_for_termination()
+        return metrics.summary(), encoding
+
+    def network_config(self) -> Dict[str, Any]:
+        """
+        Load the network config the runs use.
+
+        Returns:
+            The default network config, with the configured number of nodes.
+        """
+        network_config = yaml_to_dict(DEFAULT_NETWORK_CONFIG)
+        network_config['number_of_nodes'] = self.nodes
+        return network_config
+
+    def cache_key(self, encoding: list[int]) -> str:
+        """
+        Compute the key of the cached results of an encoding.
+
+        Args:
+            encoding: the evaluated encoding.
+
+        Returns:
+            The hash of the strategy, number of nodes, encoding, seed and version of the results.
+        """
+        return FitnessCache.key(self.strategy, self.nodes, encoding, self.seed, SUMMARY_VERSION)
 
     def run_evolution_round(self, populations: list[list[int]]):
+        """
+        Evaluate every population, using the cached results of populations which were evaluated before.
+
+        Identical populations are only evaluated once. Whether a cached population is evaluated again
+        is decided by the resampling policy of the cache, a population is scored by the mean fitness of its samples.
+
+        Args:
+            populations: the encodings to evaluate.
+
+        Returns:
+            The fitness of every population together with the population, -inf if it could not be evaluated.
+        """
+        self.generation += 1
+        if self.cache is None:
+            return [(self.fitness(result), population) for result, population in self.evaluate_populations(populations)]
+
+        keys = [self.cache_key(population) for population in populations]
+        pending: Dict[str, list[int]] = {}
+        for key, population in zip(keys, populations):
+            if key not in pending and self.cache.needs_evaluation(key):
+                pending[key] = population
+        print(f"{len(populations) - len(pending)} populations have cached results")
+
+        evaluated = self.evaluate_populations(list(pending.values())) if pending else []
+        for (key, population), (result, _) in zip(pending.items(), evaluated):
+            if result is not None:
+                self.cache.add(key, result, population)
+
         results = []
-        for population in populations:
-            # This is the part that could be run in parallel, if we figure out how with docker networking and stuff.
-            print(f"Running rocket with population {population}")
-            results.append(self.run_rocket(population))
+        for key, population in zip(keys, populations):
+            samples = self.cache.samples(key)
+            fitness = np.mean([self.fitness(sample) for sample in samples]) if samples else self.fitness(None)
+            results.append((float(fitness), population))
         return results
 
-    def main(self):
-        populations = [self.initial_population() for _ in range(self.population_size)]
-        for _ in range(self.generations):
-            print(f"Generation {_+1}")
-            results = self.run_evolution_round(populations)
-            selected = self.selection(results)
-            populations = self.reproduction(selected)
+    def evaluate_populations(self, populations: list[list[int]]):
+        """
+        Evaluate every population by running rocket, up to parallelism runs at a time.
+
+        Args:
+            populations: the encodings to evaluate.
+
+        Returns:
+            The result of every run together with its encoding, the result is None if all attempts of the run failed.
+        """
+        # Islands on the same host use the ports of their own block of workers
+        concurrent_runs = self.parallelism * self.islands
+        workers = plan_workers(
+            concurrent_runs, concurrent_runs, self.network_config(), f"{self.log_dir}/generation-{self.generation}"
+        )[self.island * self.parallelism:(self.island + 1) * self.parallelism]
+        for worker in workers:
+            prepare_interceptor_dir(worker.interceptor_dir)
+        pool = EvaluationPool(self.run_rocket, workers, self.retries, self.evaluation_timeout)
+        print(f"Running rocket with {len(populations)} populations on {len(workers)} workers")
+        results = pool.map(populations)
+        # Stop the containers left by runs which timed out, without stopping those of other islands
+        if self.parallelism > 1 or self.islands > 1:
+            InterceptorManager.cleanup_docker_containers([port for worker in workers for port in worker.node_ports])
+        return [
+            result if result is not None else (None, population)
+            for result, population in zip(results, populations)
+        ]
+
+    def update_best(self, populations: np.ndarray, fitness: np.ndarray):
+        """
+        Keep the fittest distinct populations of all generations so far.
+
+        Args:
+            populations: the populations of a generation, one on every row.
+            fitness: the fitness of every population.
+        """
+        candidates = np.vstack([self.best_populations, populations])
+        candidate_fitness = np.concatenate([self.best_fitness, fitness])
+        _, distinct = np.unique(candidates, axis=0, return_index=True)
+        distinct.sort()
+        best = distinct[genetic_operators.elite_indices(candidate_fitness[distinct], self.best_populations_kept)]
+        self.best_populations = candidates[best]
+        self.best_fitness = candidate_fitness[best]
+
+    def migrate(
+        self, populations: np.ndarray, fitness: np.ndarray, measured: np.ndarray | None = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Exchange populations with the neighbouring islands.
+
+        Every migration_interval generations, the fittest measured populations are sent to the next island,
+        and the least fit populations are replaced by the migrants of the previous island.
+
+        Args:
+            populations: the evaluated populations, one on every row.
+            fitness: the fitness of every population.
+            measured: whether the fitness of every population was measured, None if every fitness was measured.
+
+        Returns:
+            The populations, their fitness and whether it was measured after migration, migrants were measured.
+        """
+        measured = np.ones(len(populations), dtype=bool) if measured is None else measured
+        if (
+            self.exchange is None
+            or self.generation % self.migration_interval != 0
+            or self.generation >= self.generations
+        ):
+            return populations, fitness, measured
+
+        candidates = np.flatnonzero(measured)
+        emigrants = candidates[genetic_operators.elite_indices(fitness[candidates], self.migrants)]
+        self.exchange.emigrate(self.generation, populations[emigrants], fitness[emigrants])
+        arrived = self.exchange.immigrate(self.generation, self.migration_timeout)
+        if arrived is None:
+            print(f"No migrants of island {self.exchange.source} arrived within {self.migration_timeout} seconds")
+            return populations, fitness, measured
+
+        immigrants, immigrant_fitness = arrived
+        replaced = np.argsort(fitness, kind='stable')[:len(immigrants)]
+        populations, fitness, measured = populations.copy(), fitness.copy(), measured.copy()
+        populations[replaced] = immigrants
+        fitness[replaced] = immigrant_fitness
+        measured[replaced] = True
+        print(f"Received {len(immigrants)} migrants of island {self.exchange.source}")
+        return populations, fitness, measured
+
+    def checkpoint_path(self, generation: int) -> str:
+        """
+        Get the path of the checkpoint of a generation.
+
+        Args:
+            generation: the number of the generation.
+
+        Returns:
+            The path of the checkpoint in the log directory of the run.
+        """
+        return f"./logs/{self.log_dir}/checkpoints/generation-{generation}.npz"
+
+    def save_checkpoint(
+        self, evaluated: np.ndarray, fitness: np.ndarray, populations: np.ndarray, measured: np.ndarray | None = None
+    ) -> str:
+        """
+        Save the state of the run after a generation, so it can be resumed.
+
+        The checkpoint is written to a temporary file first, so a crash while saving does not corrupt it.
+
+        Args:
+            evaluated: the populations of the finished generation.
+            fitness: the fitness of the populations of the finished generation.
+            populations: the populations of the next generation.
+            measured: whether the fitness of every population of the finished generation was measured,
+                None if every fitness was measured.
+
+        Returns:
+            The path of the checkpoint.
+        """
+        if measured is None:
+            measured = np.ones(len(evaluated), dtype=bool)
+        path = self.checkpoint_path(self.generation)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f"{path}.tmp", 'wb') as f:
+            np.savez_compressed(
+                f,
+                generation=self.generation,
+                seed=self.seed,
+                strategy=self.strategy,
+                log_dir=self.log_dir,
+                populations=populations,
+                evaluated=evaluated,
+                fitness=fitness,
+                measured=measured,
+                best_populations=self.best_populations,
+                best_fitness=self.best_fitness,
+                rng_state=json.dumps(self.rng.bit_generator.state),
+                cache_rng_state=json.dumps(self.cache_rng.getstate()),
+            )
+        os.replace(f"{path}.tmp", path)
+        return path
+
+    def load_checkpoint(self, path: str) -> np.ndarray:
+        """
+        Restore the state of a run from a checkpoint, logs and checkpoints of the resumed run go to the same directory.
+
+        Args:
+            path: the path of the checkpoint.
+
+        Returns:
+            The populations of the next generation.
+
+        Raises:
+            ValueError: if the checkpoint was made with a different strategy or number of nodes.
+        """
+        with np.load(path) as checkpoint:
+            populations = checkpoint['populations']
+            if str(checkpoint['strategy']) != self.strategy or populations.shape[1] != self.encoding_length:
+                raise ValueError(
+                    f"checkpoint {path} was made with {checkpoint['strategy']} and encodings of length "
+                    f"{populations.shape[1]}, but the config uses {self.strategy} and length {self.encoding_length}"
+                )
+            self.generation = int(checkpoint['generation'])
+            self.seed = int(checkpoint['seed'])
+            self.log_dir = str(checkpoint['log_dir'])
+            self.best_populations = checkpoint['best_populations']
+            self.best_fitness = checkpoint['best_fitness']
+            self.rng.bit_generator.state = json.loads(str(checkpoint['rng_state']))
+            version, state, gauss_next = json.loads(str(checkpoint['cache_rng_state']))
+            self.cache_rng.setstate((version, tuple(state), gauss_next))
+        print(f"Resuming from generation {self.generation} of {path}")
+        return populations
+
+    def main(self, checkpoint: str | None = None):
+        """
+        Run the generations of the evolution, saving a checkpoint after every generation.
+
+        Args:
+            checkpoint: path of a checkpoint to resume from, None to start a new run.
+        """
+        if checkpoint is None:
+            populations = self.initial_populations(self.population_size)
+        else:
+            populations = self.load_checkpoint(checkpoint)
+        while self.generation < self.generations:
+            print(f"Generation {self.generation + 1}")
+            fitness, measured = self.evaluate_generation(populations)
+            # Predicted fitness only guides the selection of parents, the best populations were all run
+            self.update_best(populations[measured], fitness[measured])
+            print(f"Best fitness so far: {self.best_fitness[0]}")
+            populations, fitness, measured = self.migrate(populations, fitness, measured)
+            elites, parents = self.selection(populations, fitness, measured)
+            next_populations = self.reproduction(elites, parents)
+            self.save_checkpoint(populations, fitness, next_populations, measured)
+            populations = next_populations
         return
 
 
+def run_island(config_path: str, island: int, checkpoint: str | None = None):
+    """
+    Run the evolution of a single island, used as the target of the process of every island.
+
+    Args:
+        config_path: path to the config file.
+        island: the number of the island.
+        checkpoint: path of a checkpoint of the island to resume from, None to start a new run.
+    """
+    EvoTestManager(config_path, island).main(checkpoint)
+
+
+def island_node_ports(config_path: str, islands: int) -> list[int]:
+    """
+    Compute the ports of the nodes of every island on this host, see EvoTestManager.evaluate_populations.
+
+    Args:
+        config_path: path to the config file.
+        islands: the amount of islands.
+
+    Returns:
+        The node ports of the workers of all islands.
+    """
+    config = yaml_to_dict(config_path)
+    network_config = yaml_to_dict(DEFAULT_NETWORK_CONFIG)
+    network_config['number_of_nodes'] = config['general']['nodes']
+    concurrent_runs = config['evolution'].get('parallelism', 1) * islands
+    workers = plan_workers(concurrent_runs, concurrent_runs, network_config, 'islands')
+    return [port for worker in workers for port in worker.node_ports]
+
+
+def run_islands(config_path: str, islands: int):
+    """
+    Run the evolution of every island in its own process on this host.
+
+    Args:
+        config_path: path to the config file.
+        islands: the amount of islands.
+    """
+    ports = island_node_ports(config_path, islands)
+    context = multiprocessing.get_context('spawn')
+    processes = [
+        context.Process(target=run_island, args=(config_path, island), name=f"Island-{island}")
+        for island in range(islands)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        # Islands leave their containers running, so they do not stop the networks of other islands.
+        # Only the containers of these islands are stopped, not those of other campaigns or of islands on other hosts
+        InterceptorManager.cleanup_docker_containers(ports)
+
+
 if __name__ == "__main__":
-    manager = EvoTestManager()
-    manager.main()
+    parser = argparse.ArgumentParser(description="Run an evolutionary testing campaign.")
+    parser.add_argument('-c', '--config', type=str, default='evo_test_manager.yaml',
+                        help="The relative path to the configuration file to use.", metavar='PATH')
+    parser.add_argument('--resume', type=str, default=None,
+                        help="The path of a checkpoint to resume the campaign from.", metavar='CHECKPOINT')
+    parser.add_argument('--island', type=int, default=None,
+                        help="Only run this island, e.g. to run the islands on different hosts.", metavar='ID')
+    args = parser.parse_args()
+    island_count = (yaml_to_dict(args.config).get('islands') or {}).get('count', 1)
+    if island_count > 1 and args.island is None:
+        if args.resume is not None:
+            parser.error("resuming a run with multiple islands requires --island")
+        run_islands(args.config, island_count)
+    else:
+        run_island(args.config, args.island or 0, args.resume)
@@ -54,6 +54,78 @@ class PacketAck(google.protobuf.message.Message):
 
 global___PacketAck = PacketAck
 
+@typing.final
+class PacketBatch(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    PACKETS_FIELD_NUMBER: builtins.int
+    @property
+    def packets(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___Packet]: ...
+    def __init__(
+        self,
+        *,
+        packets: collections.abc.Iterable[global___Packet] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["packets", b"packets"]) -> None: ...
+
+global___PacketBatch = PacketBatch
+
+@typing.final
+class PacketAckBatch(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    ACKS_FIELD_NUMBER: builtins.int
+    @property
+    def acks(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___PacketAck]: ...
+    def __init__(
+        self,
+        *,
+        acks: collections.abc.Iterable[global___PacketAck] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["acks", b"acks"]) -> None: ...
+
+global___PacketAckBatch = PacketAckBatch
+
+@typing.final
+class SequencedPacket(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SEQUENCE_FIELD_NUMBER: builtins.int
+    PACKET_FIELD_NUMBER: builtins.int
+    sequence: builtins.int
+    @property
+    def packet(self) -> global___Packet: ...
+    def __init__(
+        self,
+        *,
+        sequence: builtins.int = ...,
+        packet: global___Packet | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["packet", b"packet"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["packet", b"packet", "sequence", b"sequence"]) -> None: ...
+
+global___SequencedPacket = SequencedPacket
+
+@typing.final
+class SequencedPacketAck(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    SEQUENCE_FIELD_NUMBER: builtins.int
+    ACK_FIELD_NUMBER: builtins.int
+    sequence: builtins.int
+    @property
+    def ack(self) -> global___PacketAck: ...
+    def __init__(
+        self,
+        *,
+        sequence: builtins.int = ...,
+        ack: global___PacketAck | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["ack", b"ack"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["ack", b"ack", "sequence", b"sequence"]) -> None: ...
+
+global___SequencedPacketAck = SequencedPacketAck
+
 @typing.final
 class ValidatorNodeInfo(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
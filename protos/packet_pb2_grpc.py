@@ -44,6 +44,16 @@ class PacketServiceStub(object):
                 request_serializer=protos_dot_packet__pb2.Packet.SerializeToString,
                 response_deserializer=protos_dot_packet__pb2.PacketAck.FromString,
                 _registered_method=True)
+        self.send_packets = channel.unary_unary(
+                '/packet.PacketService/send_packets',
+                request_serializer=protos_dot_packet__pb2.PacketBatch.SerializeToString,
+                response_deserializer=protos_dot_packet__pb2.PacketAckBatch.FromString,
+                _registered_method=True)
+        self.stream_packets = channel.stream_stream(
+                '/packet.PacketService/stream_packets',
+                request_serializer=protos_dot_packet__pb2.SequencedPacket.SerializeToString,
+                response_deserializer=protos_dot_packet__pb2.SequencedPacketAck.FromString,
+                _registered_method=True)
         self.send_validator_node_info = channel.stream_unary(
                 '/packet.PacketService/send_validator_node_info',
                 request_serializer=protos_dot_packet__pb2.ValidatorNodeInfo.SerializeToString,
@@ -65,6 +75,18 @@ class PacketServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def send_packets(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def stream_packets(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def send_validator_node_info(self, request_iterator, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -85,6 +107,16 @@ def add_PacketServiceServicer_to_server(servicer, server):
                     request_deserializer=protos_dot_packet__pb2.Packet.FromString,
                     response_serializer=protos_dot_packet__pb2.PacketAck.SerializeToString,
             ),
+            'send_packets': grpc.unary_unary_rpc_method_handler(
+                    servicer.send_packets,
+                    request_deserializer=protos_dot_packet__pb2.PacketBatch.FromString,
+                    response_serializer=protos_dot_packet__pb2.PacketAckBatch.SerializeToString,
+            ),
+            'stream_packets': grpc.stream_stream_rpc_method_handler(
+                    servicer.stream_packets,
+                    request_deserializer=protos_dot_packet__pb2.SequencedPacket.FromString,
+                    response_serializer=protos_dot_packet__pb2.SequencedPacketAck.SerializeToString,
+            ),
             'send_validator_node_info': grpc.stream_unary_rpc_method_handler(
                     servicer.send_validator_node_info,
                     request_deserializer=protos_dot_packet__pb2.ValidatorNodeInfo.FromString,
@@ -133,6 +165,60 @@ class PacketService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def send_packets(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/packet.PacketService/send_packets',
+            protos_dot_packet__pb2.PacketBatch.SerializeToString,
+            protos_dot_packet__pb2.PacketAckBatch.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def stream_packets(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/packet.PacketService/stream_packets',
+            protos_dot_packet__pb2.SequencedPacket.SerializeToString,
+            protos_dot_packet__pb2.SequencedPacketAck.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def send_validator_node_info(request_iterator,
             target,
@@ -1,10 +1,33 @@
 """Entry point of the application, run with python -m rocket_controller."""
 
 import argparse
+import asyncio
 
+from rocket_controller.action_log_filter import ActionLogFilter
+from rocket_controller.async_packet_server import serve_async
 from rocket_controller.cli_helper import parse_args, process_args, str_to_strategy
+from rocket_controller.metrics_exporter import MetricsExporter
+from rocket_controller.packet_recorder import PacketRecorder
 from rocket_controller.packet_server import serve
-from rocket_controller.strategies import Strategy
+from rocket_controller.stage_timer import StageTimer
+from rocket_controller.strategies import AsyncStrategy, Strategy
+
+
+async def main_async(
+    strategy: Strategy,
+    recorder: PacketRecorder | None = None,
+    metrics: MetricsExporter | None = None,
+) -> None:
+    """
+    Serve the strategy in async mode until the server terminates.
+
+    Args:
+        strategy: The Strategy to serve.
+        recorder: Recorder which captures every received packet and its ack in a trace, if desired.
+        metrics: Exporter which counts every processed packet and its action, if desired.
+    """
+    server = await serve_async(strategy, recorder, metrics=metrics)
+    await server.wait_for_termination()
 
 
 def main(args: argparse.Namespace) -> None:
@@ -16,8 +39,32 @@ def main(args: argparse.Namespace) -> None:
     """
     params_dict = process_args(args)
     strategy: Strategy = str_to_strategy(args.strategy)(**params_dict)
-    server = serve(strategy)
-    server.wait_for_termination()
+    if getattr(args, "action_log_format", None):
+        strategy.action_log_format = args.action_log_format
+    if getattr(args, "action_log_text", None) is not None:
+        strategy.action_log_text_types = args.action_log_text
+    if getattr(args, "action_log_sample", None) is not None:
+        strategy.action_log_filter = ActionLogFilter(args.action_log_sample)
+    if getattr(args, "stage_timing", False):
+        strategy.stage_timer = StageTimer(strategy.__class__.__name__)
+    recorder = PacketRecorder(args.record) if getattr(args, "record", None) else None
+    metrics = None
+    if getattr(args, "metrics_port", None) is not None:
+        metrics = MetricsExporter(strategy, args.metrics_port)
+        metrics.start()
+    try:
+        # An AsyncStrategy can only be served in async mode
+        if getattr(args, "async_mode", False) or isinstance(strategy, AsyncStrategy):
+            asyncio.run(main_async(strategy, recorder, metrics))
+            return
+        server = serve(strategy, recorder, metrics=metrics)
+        server.wait_for_termination()
+    finally:
+        if recorder is not None:
+            recorder.close()
+        if metrics is not None:
+            metrics.stop()
+        strategy.stage_timer.close()
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,92 @@
+"""This module contains a class which decides which actions are kept in the action log."""
+
+import random
+from typing import Dict
+
+from rocket_controller.encoder_decoder import MessageTypeFlag, PacketEncoderDecoder
+from rocket_controller.helper import MAX_U32
+
+
+class ActionLogFilter:
+    """
+    Filter which samples the actions kept in the action log per message type.
+
+    Actions are sampled with the rate of their message type, unless they match one of the always-log rules.
+    Example: ActionLogFilter({MessageTypeFlag.PING: 0.01, MessageTypeFlag.LEDGER_DATA: 0}) logs every drop and
+    mutation, 1% of the remaining TMPing messages, no other TMLedgerData messages and all other messages.
+    """
+
+    def __init__(
+        self,
+        sample_rates: Dict[MessageTypeFlag, float] | None = None,
+        default_rate: float = 1.0,
+        always_log_drops: bool = True,
+        always_log_mutations: bool = True,
+        always_log_delays: bool = False,
+        seed: int | None = None,
+    ):
+        """
+        Initialize ActionLogFilter class.
+
+        Args:
+            sample_rates: The fraction of actions to log, per flag of one or more message types.
+            default_rate: The fraction of actions to log for message types without a sample rate.
+            always_log_drops: Whether dropped messages are always logged.
+            always_log_mutations: Whether mutated messages are always logged.
+            always_log_delays: Whether delayed messages are always logged.
+            seed: Seed of the sampling, separate from the random state used by strategies.
+
+        Raises:
+            ValueError: If any of the rates is not between 0 and 1.
+        """
+        rates = sample_rates or {}
+        if any(not 0 <= rate <= 1 for rate in [*rates.values(), default_rate]):
+            raise ValueError("Sample rates must be between 0 and 1.")
+
+        self.default_rate = default_rate
+        # Precompute the rate of every message type, the first flag containing a type determines its rate
+        self._rates: Dict[int, float] = {
+            message_type: next(
+                (rate for flag, rate in rates.items() if flag & type_flag),
+                default_rate,
+            )
+            for message_type, type_flag in PacketEncoderDecoder.message_type_flags.items()
+        }
+        self.always_log_drops = always_log_drops
+        self.always_log_mutations = always_log_mutations
+        self.always_log_delays = always_log_delays
+        self._random = random.Random(seed)
+
+    def sample_rate(self, message_type: int) -> float:
+        """
+        Look up the sample rate of a message type.
+
+        Args:
+            message_type: The message type number.
+
+        Returns:
+            float: The fraction of actions on messages of this type which are logged.
+        """
+        return self._rates.get(message_type, self.default_rate)
+
+    def should_log(self, message_type: int, action: int, mutated: bool) -> bool:
+        """
+        Decide whether an action is logged.
+
+        Args:
+            message_type: The message type number of the original message.
+            action: The taken action.
+            mutated: Whether the message was mutated.
+
+        Returns:
+            bool: Whether the action should be logged.
+        """
+        if (
+            (mutated and self.always_log_mutations)
+            or (action == MAX_U32 and self.always_log_drops)
+            or (0 < action < MAX_U32 and self.always_log_delays)
+        ):
+            return True
+
+        rate = self.sample_rate(message_type)
+        return rate >= 1 or (rate > 0 and self._random.random() < rate)
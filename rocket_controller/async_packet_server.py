@@ -0,0 +1,275 @@
+"""This module is responsible for serving the PacketService on an asyncio event loop, using grpc.aio."""
+
+import asyncio
+import datetime
+from concurrent import futures
+from typing import AsyncIterator, List, Tuple
+
+import grpc
+
+from protos import packet_pb2, packet_pb2_grpc
+from rocket_controller.encoder_decoder import DecodedPacket
+from rocket_controller.helper import validate_ports_or_ids
+from rocket_controller.metrics_exporter import MetricsExporter
+from rocket_controller.packet_recorder import PacketRecorder
+from rocket_controller.packet_server import PacketService, reject
+from rocket_controller.strategies.async_strategy import AsyncStrategy
+from rocket_controller.strategies.strategy import Strategy
+
+
+class AsyncServerHandle:
+    """Wrapper around a grpc.aio server, which allows the iteration type to stop it from any thread, see ServerHandle."""
+
+    def __init__(self, server: grpc.aio.Server, loop: asyncio.AbstractEventLoop):
+        """
+        Initialize the AsyncServerHandle.
+
+        Args:
+            server: The running grpc.aio server.
+            loop: The event loop the server is running on.
+        """
+        self._server = server
+        self._loop = loop
+
+    def stop(self, grace: float | None) -> futures.Future:
+        """
+        Schedule stopping the server on its event loop.
+
+        Args:
+            grace: Duration of the grace period in seconds, None to abort all active RPCs immediately.
+
+        Returns:
+            A future which is done once the server has stopped.
+        """
+        return asyncio.run_coroutine_threadsafe(self._server.stop(grace), self._loop)
+
+
+class AsyncPacketService(PacketService):
+    """
+    PacketService which handles its RPCs as coroutines on the event loop of a grpc.aio server.
+
+    An AsyncStrategy is awaited directly, so the amount of packets in flight is not limited by a thread pool.
+    Any other Strategy is run in the default executor of the event loop.
+    """
+
+    async def send_packet(  # type: ignore[override]
+        self, request, context: grpc.aio.ServicerContext | None
+    ) -> packet_pb2.PacketAck:
+        """
+        This function receives the packet from the interceptor and passes it to the controller.
+
+        Args:
+            request: Packet containing intercepted data.
+            context: gRPC context, None for a packet of a stream.
+
+        Returns:
+            The possibly modified packet and an action.
+
+        Raises:
+            ValueError: If request.from_port == request.to_port or if any is negative.
+        """
+        timestamp = int(datetime.datetime.now().timestamp() * 1000)
+        timer = self.strategy.stage_timer
+        packet = DecodedPacket(request)
+        start = timer.now()
+        validate_ports_or_ids(request.from_port, request.to_port)
+        timer.record("validate", packet.message_type, start)
+
+        start = timer.now()
+        result = await self._process_packet(packet)
+        timer.record("process_packet", packet.message_type, start)
+        return self._acknowledge(packet, result, timestamp)
+
+    async def send_packets(  # type: ignore[override]
+        self, request: packet_pb2.PacketBatch, context: grpc.aio.ServicerContext
+    ) -> packet_pb2.PacketAckBatch:
+        """
+        This function receives a batch of packets from the interceptor and passes it to the controller at once.
+
+        Args:
+            request: Batch of packets containing intercepted data.
+            context: gRPC context.
+
+        Returns:
+            The possibly modified packets and their actions, in the order of the received packets.
+
+        Raises:
+            ValueError: If the ports of any packet are equal or if any is negative,
+                or if the strategy did not return a result for every packet.
+        """
+        timestamp = int(datetime.datetime.now().timestamp() * 1000)
+        timer = self.strategy.stage_timer
+        packets = [DecodedPacket(packet) for packet in request.packets]
+        for packet in packets:
+            start = timer.now()
+            validate_ports_or_ids(packet.from_port, packet.to_port)
+            timer.record("validate", packet.message_type, start)
+
+        start = timer.now()
+        if isinstance(self.strategy, AsyncStrategy):
+            results = await self.strategy.process_packets(packets)
+        else:
+            results = await asyncio.get_running_loop().run_in_executor(
+                None, self.strategy.process_packets, packets
+            )
+        timer.record_batch(
+            "process_packet", [packet.message_type for packet in packets], start
+        )
+
+        return packet_pb2.PacketAckBatch(
+            acks=[
+                self._acknowledge(packet, result, timestamp)
+                for packet, result in zip(packets, results, strict=True)
+            ]
+        )
+
+    async def stream_packets(  # type: ignore[override]
+        self,
+        request_iterator: AsyncIterator[packet_pb2.SequencedPacket],
+        context: grpc.aio.ServicerContext,
+    ) -> AsyncIterator[packet_pb2.SequencedPacketAck]:
+        """
+        This function receives a stream of packets from the interceptor and streams back an ack for every packet.
+
+        Every packet is processed in its own task, acks are returned as soon as they are ready.
+
+        Args:
+            request_iterator: Iterator of sequence-tagged packets containing intercepted data.
+            context: gRPC context.
+
+        Yields:
+            The sequence-tagged possibly modified packets and their actions, packets with invalid ports are dropped.
+        """
+        acks: asyncio.Queue[asyncio.Task | int] = asyncio.Queue()
+        # Keep references to the running tasks, the event loop only keeps weak references.
+        tasks: set[asyncio.Task] = set()
+
+        async def consume_requests():
+            submitted = 0
+            try:
+                async for request in request_iterator:
+                    task = asyncio.create_task(self._process_sequenced_async(request))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                    task.add_done_callback(acks.put_nowait)
+                    submitted += 1
+            finally:
+                # Signal the amount of acks to expect before the stream can be closed.
+                acks.put_nowait(submitted)
+
+        consumer = asyncio.create_task(consume_requests())
+
+        sent = 0
+        expected: int | None = None
+        try:
+            while expected is None or sent < expected:
+                item = await acks.get()
+                if isinstance(item, int):
+                    expected = item
+                    continue
+                sent += 1
+                yield item.result()
+        finally:
+            consumer.cancel()
+            for task in tasks:
+                task.cancel()
+
+    async def send_validator_node_info(  # type: ignore[override]
+        self,
+        request_iterator: AsyncIterator[packet_pb2.ValidatorNodeInfo],
+        context: grpc.aio.ServicerContext,
+    ) -> packet_pb2.ValidatorNodeInfoAck:
+        """
+        This function receives the validator node info from the interceptor and passes it to the controller.
+
+        Args:
+            request_iterator: Iterator of validator node info.
+            context: gRPC context.
+
+        Returns:
+            ValidatorNodeInfoAck: An acknowledgement.
+        """
+        requests: List[packet_pb2.ValidatorNodeInfo] = [
+            request async for request in request_iterator
+        ]
+        return super().send_validator_node_info(requests, context)
+
+    async def get_config(self, request, context):  # type: ignore[override]
+        """
+        This function sends the network config specified in the self.strategy field to the interceptor.
+
+        Args:
+            request: The request containing the network config.
+            context: gRPC context.
+
+        Returns:
+            Config: The Config object.
+        """
+        return super().get_config(request, context)
+
+    async def _process_sequenced_async(
+        self, request: packet_pb2.SequencedPacket
+    ) -> packet_pb2.SequencedPacketAck:
+        """
+        Process a sequence-tagged packet.
+
+        Args:
+            request: Sequence-tagged packet containing intercepted data.
+
+        Returns:
+            The sequence-tagged ack of the packet, which drops the packet if its ports are invalid.
+        """
+        try:
+            ack = await self.send_packet(request.packet, None)
+        except ValueError as e:
+            ack = reject(request.packet, e)
+        return packet_pb2.SequencedPacketAck(sequence=request.sequence, ack=ack)
+
+    async def _process_packet(self, packet: DecodedPacket) -> Tuple[bytes, int, int]:
+        """
+        Let the strategy process a packet, without blocking the event loop.
+
+        Args:
+            packet: Packet containing intercepted data.
+
+        Returns:
+            The possibly modified packet data, the action and the send amount.
+        """
+        if isinstance(self.strategy, AsyncStrategy):
+            return await self.strategy.process_packet(packet)
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.strategy.process_packet, packet
+        )
+
+
+async def serve_async(
+    strategy: Strategy,
+    recorder: PacketRecorder | None = None,
+    port: int = 50051,
+    metrics: MetricsExporter | None = None,
+) -> grpc.aio.Server:
+    """
+    This function starts the asynchronous server and listens for incoming packets.
+
+    Args:
+        strategy: The Strategy to use while serving packets.
+        recorder: Recorder which captures every received packet and its ack in a trace, if desired.
+        port: The port to listen on, the interceptor connects to 50051.
+        metrics: Exporter which counts every processed packet and its action, if desired.
+
+    Returns:
+        The started grpc.aio server.
+    """
+    server = grpc.aio.server()
+    packet_pb2_grpc.add_PacketServiceServicer_to_server(
+        AsyncPacketService(strategy, recorder=recorder, metrics=metrics), server
+    )
+    server.add_insecure_port(f"[::]:{port}")
+    await server.start()
+    strategy.iteration_type.set_server(
+        AsyncServerHandle(server, asyncio.get_running_loop())
+    )
+    strategy.iteration_type.set_network(strategy.network)
+    strategy.iteration_type.add_iteration()
+
+    return server
@@ -0,0 +1,259 @@
+"""This module contains a compact binary alternative to the csv action log, and a reader which decodes it on demand."""
+
+import atexit
+import struct
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator, NamedTuple
+
+from loguru import logger
+
+from protos import packet_pb2
+from rocket_controller.csv_logger import CSVLogger
+from rocket_controller.encoder_decoder import DecodedPacket, DecodingNotSupportedError
+from rocket_controller.validator_node_info import ValidatorNode
+
+MAGIC = b"RCAL"
+VERSION = 1
+
+# Magic bytes and format version at the start of every binary action log.
+file_header = struct.Struct("<4sH")
+# Timestamp, action, send amount, sender ID, receiver ID, message type and the lengths of both packets.
+record_header = struct.Struct("<qIIHHiII")
+# Length of the possibly mutated data, when it is identical to the original data and not stored again.
+UNCHANGED = 0xFFFFFFFF
+
+
+class BinaryActionLogger:
+    """
+    Action logger which stores the raw packets in a compact binary file, instead of a csv file with decoded messages.
+
+    Every record consists of a fixed size header with the numeric fields, followed by the raw packet data.
+    The messages are not decoded while logging, use read_action_log to decode them afterwards.
+    """
+
+    def __init__(
+        self,
+        sub_directory: str,
+        validator_node_list: list[ValidatorNode],
+        action_log_filename: str | None = None,
+        node_log_filename: str | None = None,
+    ):
+        """
+        Initialize BinaryActionLogger class.
+
+        Args:
+            sub_directory: Sub-directory to store the log files under.
+            validator_node_list: List of validator nodes in the network.
+            action_log_filename: Name of the action log file.
+            node_log_filename: Name of the node log file.
+        """
+        filename = (
+            action_log_filename if action_log_filename is not None else "action_log"
+        )
+        filename = filename if filename.endswith(".bin") else filename + ".bin"
+
+        node_logger = CSVLogger(
+            filename=node_log_filename
+            if node_log_filename is not None
+            else "node_info",
+            columns=["validator_node_info"],
+            directory=sub_directory,
+        )
+        node_logger.log_rows([[node] for node in validator_node_list])
+
+        Path("./logs/" + sub_directory).mkdir(parents=True, exist_ok=True)
+        self.filepath = "./logs/" + sub_directory + "/" + filename
+
+        self._lock = threading.Lock()
+        self._file = open(self.filepath, mode="wb", buffering=1 << 20)
+        self._file.write(file_header.pack(MAGIC, VERSION))
+        # Make sure buffered records are written when the application exits without closing the logger
+        atexit.register(self.close)
+
+    def log_packet(
+        self,
+        action: int,
+        send_amount: int,
+        from_node_id: int,
+        to_node_id: int,
+        original: DecodedPacket,
+        possibly_mutated: DecodedPacket,
+        custom_timestamp: int | None = None,
+    ):
+        """
+        Log an action taken on a packet.
+
+        Args:
+            action: Action to be logged.
+            send_amount: The amount of times the messages should be sent.
+            from_node_id: ID of the node who sent the message.
+            to_node_id: ID of the node who is supposed to receive the message.
+            original: The original packet.
+            possibly_mutated: The possibly mutated packet.
+            custom_timestamp: A custom timestamp to log if desired.
+
+        Actions logged after the logger was closed are dropped, e.g. those of packets in flight at an iteration switch.
+        """
+        timestamp = (
+            int(datetime.now().timestamp() * 1000)
+            if custom_timestamp is None
+            else custom_timestamp
+        )
+        unchanged = possibly_mutated.data == original.data
+        header = record_header.pack(
+            timestamp,
+            action,
+            send_amount,
+            from_node_id,
+            to_node_id,
+            original.message_type,
+            len(original.data),
+            UNCHANGED if unchanged else len(possibly_mutated.data),
+        )
+        with self._lock:
+            if self._file.closed:
+                logger.debug(f"Dropped an action for {self.filepath}, which was closed")
+                return
+            self._file.write(header)
+            self._file.write(original.data)
+            if not unchanged:
+                self._file.write(possibly_mutated.data)
+
+    def flush(self):
+        """Write all buffered records to the file."""
+        with self._lock:
+            self._file.flush()
+
+    def close(self):
+        """Write all buffered records and close the file, the logger can not be used afterwards."""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.close()
+        atexit.unregister(self.close)
+
+
+class ActionRecord(NamedTuple):
+    """A single action read from a binary action log."""
+
+    timestamp: int
+    action: int
+    send_amount: int
+    from_node_id: int
+    to_node_id: int
+    message_type: int
+    original_data: bytes
+    possibly_mutated_data: bytes
+
+    def original(self) -> DecodedPacket:
+        """
+        Wrap the original data, its message is decoded when it is accessed.
+
+        Returns:
+            DecodedPacket: The original packet.
+        """
+        return DecodedPacket(packet_pb2.Packet(data=self.original_data))
+
+    def possibly_mutated(self) -> DecodedPacket:
+        """
+        Wrap the possibly mutated data, its message is decoded when it is accessed.
+
+        Returns:
+            DecodedPacket: The possibly mutated packet.
+        """
+        return DecodedPacket(packet_pb2.Packet(data=self.possibly_mutated_data))
+
+    def to_csv_row(self) -> list[Any]:
+        """
+        Decode the record to a row in the format of the csv action log.
+
+        Packets of which decoding is not supported are represented by their message type and data in hex.
+
+        Returns:
+            list[Any]: The row, with the columns of csv_logger.action_log_columns.
+        """
+        original = self.original()
+        possibly_mutated = self.possibly_mutated()
+        try:
+            return [
+                self.timestamp,
+                self.action,
+                self.send_amount,
+                self.from_node_id,
+                self.to_node_id,
+                original.message_name,
+                original.text,
+                possibly_mutated.text,
+            ]
+        except DecodingNotSupportedError:
+            return [
+                self.timestamp,
+                self.action,
+                self.send_amount,
+                self.from_node_id,
+                self.to_node_id,
+                str(self.message_type),
+                self.original_data.hex(),
+                self.possibly_mutated_data.hex(),
+            ]
+
+
+def read_action_log(filepath: str) -> Iterator[ActionRecord]:
+    """
+    Read the records of a binary action log, without decoding the messages.
+
+    Args:
+        filepath: Path of the binary action log.
+
+    Yields:
+        ActionRecord: The records, in the order they were logged.
+
+    Raises:
+        ValueError: If the file is not a binary action log, or if it is truncated.
+    """
+    with open(filepath, mode="rb") as f:
+        header = f.read(file_header.size)
+        if len(header) < file_header.size:
+            raise ValueError(f"{filepath} is not a binary action log")
+        (magic, version) = file_header.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(
+                f"{filepath} is not a binary action log of version {VERSION}"
+            )
+
+        while record := f.read(record_header.size):
+            if len(record) < record_header.size:
+                raise ValueError(f"{filepath} ends with a truncated record")
+            (
+                timestamp,
+                action,
+                send_amount,
+                from_node_id,
+                to_node_id,
+                message_type,
+                original_length,
+                mutated_length,
+            ) = record_header.unpack(record)
+
+            original_data = f.read(original_length)
+            possibly_mutated_data = (
+                original_data if mutated_length == UNCHANGED else f.read(mutated_length)
+            )
+            if len(original_data) < original_length or (
+                mutated_length != UNCHANGED
+                and len(possibly_mutated_data) < mutated_length
+            ):
+                raise ValueError(f"{filepath} ends with a truncated record")
+
+            yield ActionRecord(
+                timestamp,
+                action,
+                send_amount,
+                from_node_id,
+                to_node_id,
+                message_type,
+                original_data,
+                possibly_mutated_data,
+            )
@@ -5,6 +5,7 @@ import ast
 import sys
 from typing import Any, Dict, List, Type
 
+from rocket_controller.encoder_decoder import MessageTypeFlag
 from rocket_controller.strategies import Strategy
 
 
@@ -76,6 +77,63 @@ def parse_args() -> argparse.Namespace:
         "Format: PARAM1=VALUE1,PARAM2=VALUE2...",
         metavar="VALUES",
     )
+    parser.add_argument(
+        "--action_log_format",
+        choices=["csv", "binary"],
+        default=None,
+        help="The format of the action log. csv logs the decoded messages, binary logs the raw packets "
+        "compactly, which can be decoded afterwards using rocket_controller.binary_action_log.read_action_log. "
+        "Defaults to the format of the strategy, which is csv unless the strategy sets it otherwise.",
+    )
+    parser.add_argument(
+        "--action_log_text",
+        type=check_valid_message_types,
+        default=None,
+        help="The message types of which the messages are logged as text in the csv action log, "
+        "the other messages are logged as raw hex, which can be rendered afterwards using "
+        "rocket_controller.csv_logger.render_action_log. Format: TYPE1,TYPE2... using the names of "
+        "rocket_controller.encoder_decoder.MessageTypeFlag, e.g. PROPOSE_SET,VALIDATION, or NONE. Defaults to all types.",
+        metavar="TYPES",
+    )
+    parser.add_argument(
+        "--action_log_sample",
+        type=check_valid_sample_rates,
+        default=None,
+        help="The fraction of actions kept in the action log per message type, dropped and mutated messages "
+        "are always logged. Format: TYPE1=RATE1,TYPE2=RATE2... using the names of "
+        "rocket_controller.encoder_decoder.MessageTypeFlag, e.g. PING=0.01,LEDGER_DATA=0. "
+        "Defaults to logging every action.",
+        metavar="RATES",
+    )
+    parser.add_argument(
+        "--record",
+        type=str,
+        default=None,
+        help="Record every received packet and the returned ack in a binary trace at the given path, "
+        "which can be replayed offline using python -m rocket_controller.packet_replay.",
+        metavar="PATH",
+    )
+    parser.add_argument(
+        "--stage_timing",
+        action="store_true",
+        help="Collect latency histograms of every stage of processing a packet, per message type. "
+        "A summary is written to stage_timing-<iteration>.json in the log directory of every iteration.",
+    )
+    parser.add_argument(
+        "--metrics_port",
+        type=int,
+        default=None,
+        help="Serve live metrics of the campaign in the Prometheus text format on http://127.0.0.1:PORT/metrics, "
+        "including the packets and actions per message type, the validated ledger of every node and the iteration.",
+        metavar="PORT",
+    )
+    parser.add_argument(
+        "--async",
+        action="store_true",
+        dest="async_mode",
+        help="Serve packets on an asyncio event loop (grpc.aio) instead of a fixed thread pool. "
+        "Strategies extending AsyncStrategy are always served this way.",
+    )
 
     return parser.parse_args()
 
@@ -118,6 +176,58 @@ def check_valid_partition(partition: str) -> List[List[int]]:
         raise argparse.ArgumentTypeError(f"not a valid partition: {partition!r}") from e
 
 
+def check_valid_message_types(message_types: str) -> MessageTypeFlag:
+    """
+    Check whether a string contains valid message type names and combine them.
+
+    Args:
+        message_types: The names of MessageTypeFlag members, separated by commas.
+
+    Returns:
+        MessageTypeFlag: The combined flag of the message types.
+
+    Raises:
+        argparse.ArgumentTypeError: If any of the names is not a MessageTypeFlag member.
+    """
+    flag = MessageTypeFlag.NONE
+    for name in message_types.split(","):
+        try:
+            flag |= MessageTypeFlag[name.strip().upper()]
+        except KeyError as err:
+            raise argparse.ArgumentTypeError(
+                f"Message type {name} is not one of {[member.name for member in MessageTypeFlag]}"
+            ) from err
+    return flag
+
+
+def check_valid_sample_rates(sample_rates: str) -> Dict[MessageTypeFlag, float]:
+    """
+    Check whether a string contains valid sample rates of message types.
+
+    Args:
+        sample_rates: Pairs of a MessageTypeFlag member name and a rate between 0 and 1, separated by commas.
+
+    Returns:
+        Dict[MessageTypeFlag, float]: The sample rate of every given message type.
+
+    Raises:
+        argparse.ArgumentTypeError: If any of the names is not a MessageTypeFlag member, or any rate is not between 0 and 1.
+    """
+    rates = {}
+    for item in sample_rates.split(","):
+        name, _, rate = item.partition("=")
+        try:
+            value = float(rate)
+        except ValueError as err:
+            raise argparse.ArgumentTypeError(
+                f"not a valid sample rate: {item!r}"
+            ) from err
+        if not 0 <= value <= 1:
+            raise argparse.ArgumentTypeError(f"not a valid sample rate: {item!r}")
+        rates[check_valid_message_types(name)] = value
+    return rates
+
+
 def check_valid_strategy_overrides(overrides_str: str) -> Dict[str, str]:
     """
     Checks whether the string format of network parameter overrides is valid.
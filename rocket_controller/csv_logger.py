@@ -1,11 +1,22 @@
 """This module contains a base class to log csv files and two fine-tuned classes extended from said base class."""
 
+import atexit
 import csv
+import queue
 import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+from loguru import logger
+
+from protos import packet_pb2
+from rocket_controller.encoder_decoder import (
+    DecodedPacket,
+    DecodingNotSupportedError,
+    MessageTypeFlag,
+)
 from rocket_controller.validator_node_info import ValidatorNode
 
 action_log_columns = [
@@ -100,7 +111,128 @@ class CSVLogger:
             self.log_row(row)
 
 
-class ActionLogger(CSVLogger):
+class BufferedCSVLogger(CSVLogger):
+    """
+    CSVLogger which writes its rows in batches on a background thread.
+
+    Logging a row only puts it in a bounded queue, the file is kept open by the writer thread.
+    A batch is written once it reaches batch_size rows or once flush_interval seconds passed since its first row.
+    Rows may also be given as a function returning the row, which is then built on the writer thread.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        columns: list[Any],
+        directory: str = "",
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        max_queue_size: int = 65536,
+    ):
+        """
+        Initialize BufferedCSVLogger class and start its writer thread.
+
+        Args:
+            filename: The name of the log file.
+            columns: The columns to be used in the log.
+            directory: The directory to store the log file in.
+            batch_size: The maximum amount of rows written at once.
+            flush_interval: The maximum amount of seconds a row waits before it is written.
+            max_queue_size: The maximum amount of queued rows, logging blocks when the queue is full.
+        """
+        super().__init__(filename, columns, directory)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue: queue.Queue[list[Any] | Callable[[], list[Any]] | None] = (
+            queue.Queue(maxsize=max_queue_size)
+        )
+        self._closed = False
+        self._writer_thread = threading.Thread(
+            target=self._write_rows, name=f"csv-writer-{filename}", daemon=True
+        )
+        self._writer_thread.start()
+        # Make sure queued rows are written when the application exits without closing the logger
+        atexit.register(self.close)
+
+    def log_row(self, row: list[Any] | Callable[[], list[Any]]):
+        """
+        Queue an arbitrary row to be logged.
+
+        Rows logged after the logger was closed are dropped, e.g. those of packets in flight at an iteration switch.
+
+        Args:
+            row: Row to be logged, or a function returning the row.
+
+        Raises:
+            ValueError: If length of row is not equal to the amount of columns.
+        """
+        if not callable(row) and len(self.columns) != len(row):
+            raise ValueError(
+                f"Wrong number of column entries in the given row, required columns are: {self.columns}"
+            )
+        # Queue the row under the lock of close, so no row is queued after the writer thread was stopped
+        with self._lock:
+            if self._closed:
+                logger.debug(f"Dropped a row for {self.filepath}, which was closed")
+                return
+            self._queue.put(row)
+
+    def flush(self):
+        """Block until all rows which were queued so far are written to the file."""
+        self._queue.join()
+
+    def close(self):
+        """Write all queued rows and stop the writer thread, the logger can not be used afterwards."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        atexit.unregister(self.close)
+        self._queue.put(None)
+        self._writer_thread.join()
+
+    def _next_batch(self) -> list[list[Any] | Callable[[], list[Any]] | None]:
+        """
+        Take the next batch of rows from the queue, waiting for the first row.
+
+        Returns:
+            The rows of the batch, ending with None if the logger was closed.
+        """
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self._flush_interval
+        while batch[-1] is not None and len(batch) < self._batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write_rows(self):
+        """Write the queued rows in batches until the logger is closed, runs on the writer thread."""
+        with open(self.filepath, mode="a", newline="") as f:
+            writer = csv.writer(f)
+            closed = False
+            while not closed:
+                batch = self._next_batch()
+                rows = []
+                for row in batch:
+                    if row is None:
+                        closed = True
+                        continue
+                    try:
+                        rows.append(row() if callable(row) else row)
+                    except Exception:
+                        logger.exception(f"Could not build a row for {self.filepath}")
+                writer.writerows(rows)
+                f.flush()
+                for _ in batch:
+                    self._queue.task_done()
+
+
+class ActionLogger(BufferedCSVLogger):
     """CSVLogger child class which is dedicated to handle the logging of taken actions."""
 
     def __init__(
@@ -109,6 +241,7 @@ class ActionLogger(CSVLogger):
         validator_node_list: list[ValidatorNode],
         action_log_filename: str | None = None,
         node_log_filename: str | None = None,
+        text_types: MessageTypeFlag | None = None,
     ):
         """
         Initialize ActionLogger class.
@@ -118,7 +251,10 @@ class ActionLogger(CSVLogger):
             validator_node_list: List of validator nodes in the network.
             action_log_filename: Name of the action log file.
             node_log_filename: Name of the node log file.
+            text_types: The message types of which the messages are logged as text, the data of other types is
+                logged as raw hex and can be rendered afterwards using render_action_log. Defaults to all types.
         """
+        self.text_types = text_types
         final_filename = (
             action_log_filename if action_log_filename is not None else "action_log.csv"
         )
@@ -179,6 +315,113 @@ class ActionLogger(CSVLogger):
             ]
         )
 
+    def log_packet(
+        self,
+        action: int,
+        send_amount: int,
+        from_node_id: int,
+        to_node_id: int,
+        original: DecodedPacket,
+        possibly_mutated: DecodedPacket,
+        custom_timestamp: int | None = None,
+    ):
+        """
+        Log an action taken on a packet, using the messages which were already decoded.
+
+        The messages are rendered to text on the writer thread, off the path of the packet.
+        Packets of types not in text_types, or which can not be decoded, are logged as raw hex prefixed by 0x.
+
+        Args:
+            action: Action to be logged.
+            send_amount: The amount of times the messages should be sent.
+            from_node_id: ID of the node who sent the message.
+            to_node_id: ID of the node who is supposed to receive the message.
+            original: The original packet.
+            possibly_mutated: The possibly mutated packet.
+            custom_timestamp: A custom timestamp to log if desired.
+        """
+        timestamp = (
+            int(datetime.now().timestamp() * 1000)
+            if custom_timestamp is None
+            else custom_timestamp
+        )
+        if not (
+            original.supported
+            and (self.text_types is None or original.flag & self.text_types)
+        ):
+            # Only the raw data is logged, which does not need to be deferred
+            self.log_row(
+                [
+                    timestamp,
+                    action,
+                    send_amount,
+                    from_node_id,
+                    to_node_id,
+                    original.message_name
+                    if original.supported
+                    else str(original.message_type),
+                    "0x" + original.data.hex(),
+                    "0x" + possibly_mutated.data.hex(),
+                ]
+            )
+            return
+
+        self.log_row(
+            lambda: [
+                timestamp,
+                action,
+                send_amount,
+                from_node_id,
+                to_node_id,
+                original.message_name,
+                original.text,
+                possibly_mutated.text,
+            ]
+        )
+
+
+def render_logged_data(data: str) -> str:
+    """
+    Render message data logged in the action log as text, if it was logged as raw hex.
+
+    Args:
+        data: The original_data or possibly_mutated_data entry of a row of the action log.
+
+    Returns:
+        str: The message as text, or the given data if it is already text or can not be decoded.
+    """
+    if not data.startswith("0x"):
+        return data
+    try:
+        return DecodedPacket(packet_pb2.Packet(data=bytes.fromhex(data[2:]))).text
+    except (ValueError, DecodingNotSupportedError):
+        return data
+
+
+def render_action_log(filepath: str, output_filepath: str):
+    """
+    Export an action log with all messages rendered as text, like an action log kept with every type as text.
+
+    Args:
+        filepath: Path of the action log.
+        output_filepath: Path to write the rendered action log to.
+    """
+    data_columns = (
+        action_log_columns.index("original_data"),
+        action_log_columns.index("possibly_mutated_data"),
+    )
+    with (
+        open(filepath, newline="") as source,
+        open(output_filepath, mode="w", newline="") as target,
+    ):
+        reader = csv.reader(source)
+        writer = csv.writer(target)
+        writer.writerow(next(reader))
+        for row in reader:
+            for column in data_columns:
+                row[column] = render_logged_data(row[column])
+            writer.writerow(row)
+
 
 class ResultLogger(CSVLogger):
     """CSVLogger child class which is dedicated to handle the logging of results."""
@@ -261,7 +504,7 @@ class SpecCheckLogger(CSVLogger):
 
     def log_spec_check(
         self,
-        iteration: int,
+        iteration: int | str,
         reached_goal_ledger: bool | str,
         same_ledger_hashes: bool | str,
         same_ledger_indexes: bool | str,
@@ -270,7 +513,7 @@ class SpecCheckLogger(CSVLogger):
         Log a spec check row to the CSV file.
 
         Args:
-            iteration: The current iteration.
+            iteration: The current iteration, or the name of an iteration run by a worker of a parallel campaign.
             reached_goal_ledger: Whether the goal ledger was reached.
             same_ledger_hashes: Whether the ledger hashes were the same.
             same_ledger_indexes: Whether the ledger indexes were the same.
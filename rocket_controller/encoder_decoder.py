@@ -1,7 +1,9 @@
 """This module contains the class that implements an encoder and a decoder for XRPL packets."""
 
 import struct
+from enum import IntFlag
 from functools import singledispatchmethod
+from typing import Dict, Union
 
 from google.protobuf.message import Message
 from xrpl.core.keypairs.secp256k1 import SECP256K1
@@ -16,6 +18,52 @@ class DecodingNotSupportedError(Exception):
     pass
 
 
+class MessageTypeFlag(IntFlag):
+    """
+    Flags of the supported message types, which allow checking a message type against a set of types at once.
+
+    The flag of a message type can be obtained without decoding the message, using PacketEncoderDecoder.peek_header.
+    """
+
+    NONE = 0
+    MANIFESTS = 1 << 0
+    PING = 1 << 1
+    CLUSTER = 1 << 2
+    ENDPOINTS = 1 << 3
+    TRANSACTION = 1 << 4
+    GET_LEDGER = 1 << 5
+    LEDGER_DATA = 1 << 6
+    PROPOSE_SET = 1 << 7
+    STATUS_CHANGE = 1 << 8
+    HAVE_TRANSACTION_SET = 1 << 9
+    VALIDATION = 1 << 10
+    GET_OBJECT_BY_HASH = 1 << 11
+    GET_PEER_SHARD_INFO = 1 << 12
+    PEER_SHARD_INFO = 1 << 13
+    VALIDATOR_LIST = 1 << 14
+    SQUELCH = 1 << 15
+    VALIDATOR_LIST_COLLECTION = 1 << 16
+    PROOF_PATH_REQUEST = 1 << 17
+    PROOF_PATH_RESPONSE = 1 << 18
+    REPLAY_DELTA_REQUEST = 1 << 19
+    REPLAY_DELTA_RESPONSE = 1 << 20
+    GET_PEER_SHARD_INFO_V2 = 1 << 21
+    PEER_SHARD_INFO_V2 = 1 << 22
+    HAVE_TRANSACTIONS = 1 << 23
+    TRANSACTIONS = 1 << 24
+
+    # The message types involved in consensus, which are the types the evolutionary strategies act on.
+    CONSENSUS = (
+        TRANSACTION
+        | GET_LEDGER
+        | LEDGER_DATA
+        | PROPOSE_SET
+        | STATUS_CHANGE
+        | HAVE_TRANSACTION_SET
+        | VALIDATION
+    )
+
+
 # noinspection PyNestedDecorators
 class PacketEncoderDecoder:
     """Class that implements a packet decoder."""
@@ -50,6 +98,36 @@ class PacketEncoderDecoder:
         64: ripple_pb2.TMTransactions,
     }
 
+    message_type_flags: Dict[int, MessageTypeFlag] = {
+        2: MessageTypeFlag.MANIFESTS,
+        3: MessageTypeFlag.PING,
+        5: MessageTypeFlag.CLUSTER,
+        15: MessageTypeFlag.ENDPOINTS,
+        30: MessageTypeFlag.TRANSACTION,
+        31: MessageTypeFlag.GET_LEDGER,
+        32: MessageTypeFlag.LEDGER_DATA,
+        33: MessageTypeFlag.PROPOSE_SET,
+        34: MessageTypeFlag.STATUS_CHANGE,
+        35: MessageTypeFlag.HAVE_TRANSACTION_SET,
+        41: MessageTypeFlag.VALIDATION,
+        42: MessageTypeFlag.GET_OBJECT_BY_HASH,
+        52: MessageTypeFlag.GET_PEER_SHARD_INFO,
+        53: MessageTypeFlag.PEER_SHARD_INFO,
+        54: MessageTypeFlag.VALIDATOR_LIST,
+        55: MessageTypeFlag.SQUELCH,
+        56: MessageTypeFlag.VALIDATOR_LIST_COLLECTION,
+        57: MessageTypeFlag.PROOF_PATH_REQUEST,
+        58: MessageTypeFlag.PROOF_PATH_RESPONSE,
+        59: MessageTypeFlag.REPLAY_DELTA_REQUEST,
+        60: MessageTypeFlag.REPLAY_DELTA_RESPONSE,
+        61: MessageTypeFlag.GET_PEER_SHARD_INFO_V2,
+        62: MessageTypeFlag.PEER_SHARD_INFO_V2,
+        63: MessageTypeFlag.HAVE_TRANSACTIONS,
+        64: MessageTypeFlag.TRANSACTIONS,
+    }
+
+    header_format = struct.Struct("!IH")
+
     @singledispatchmethod
     @staticmethod
     def sign_message(message: Message, private_key: str) -> Message:
@@ -94,6 +172,41 @@ class PacketEncoderDecoder:
         message.signature = signature
         return message
 
+    @staticmethod
+    def peek_header(data: bytes) -> tuple[int, int]:
+        """
+        Decodes only the header of the given packet data, without parsing the message itself.
+
+        Args:
+            data: Data of the packet.
+
+        Returns:
+            tuple[int, int]: Tuple of the message length and the message type.
+
+        Raises:
+            DecodingNotSupportedError: If the data is too short to contain a header.
+        """
+        if len(data) < PacketEncoderDecoder.header_format.size:
+            raise DecodingNotSupportedError(
+                f"Packet of {len(data)} bytes does not contain a header"
+            )
+        return PacketEncoderDecoder.header_format.unpack_from(data)
+
+    @staticmethod
+    def message_type_flag(message_type: int) -> MessageTypeFlag:
+        """
+        Look up the flag of a message type.
+
+        Args:
+            message_type: The message type number.
+
+        Returns:
+            MessageTypeFlag: The flag of the message type, MessageTypeFlag.NONE if the type is not supported.
+        """
+        return PacketEncoderDecoder.message_type_flags.get(
+            message_type, MessageTypeFlag.NONE
+        )
+
     @staticmethod
     def decode_packet(packet: packet_pb2.Packet) -> tuple[Message, int]:
         """
@@ -108,7 +221,7 @@ class PacketEncoderDecoder:
         Raises:
             DecodingNotSupportedError: If the given packet is not supported.
         """
-        message_type = struct.unpack("!H", packet.data[4:6])[0]
+        message_type = PacketEncoderDecoder.peek_header(packet.data)[1]
         if message_type not in PacketEncoderDecoder.message_type_map:
             raise DecodingNotSupportedError(
                 f"Decoding of message type {message_type} not supported"
@@ -144,3 +257,108 @@ class PacketEncoderDecoder:
             + serialized
         )
         return final_message
+
+
+class DecodedPacket:
+    """
+    Wrapper around a Packet which decodes the packet at most once and caches the results.
+
+    The header (message length, type and flag) is decoded on construction, the message body is only decoded
+    when it is accessed for the first time. The same DecodedPacket is passed through the whole pipeline,
+    so the strategy, the status updates and the action log all share the decoded message.
+    Since the message is shared, it must not be mutated, use copy_message to obtain a mutable copy.
+    """
+
+    def __init__(self, packet: packet_pb2.Packet):
+        """
+        Initialize a DecodedPacket, decoding the header of the given packet.
+
+        Args:
+            packet: The packet to decode.
+        """
+        self.packet = packet
+        self.data: bytes = packet.data
+        self.from_port: int = packet.from_port
+        self.to_port: int = packet.to_port
+        try:
+            (self.length, self.message_type) = PacketEncoderDecoder.peek_header(
+                self.data
+            )
+        except DecodingNotSupportedError:
+            # Packets too short to contain a header get type -1, which is not supported for decoding.
+            (self.length, self.message_type) = (0, -1)
+        self.flag: MessageTypeFlag = PacketEncoderDecoder.message_type_flag(
+            self.message_type
+        )
+        self._message: Message | None = None
+        self._text: str | None = None
+
+    @classmethod
+    def wrap(cls, packet: Union[packet_pb2.Packet, "DecodedPacket"]) -> "DecodedPacket":
+        """
+        Wrap a packet in a DecodedPacket, unless it already is one.
+
+        Args:
+            packet: The packet to wrap.
+
+        Returns:
+            DecodedPacket: The DecodedPacket of the given packet.
+        """
+        return packet if isinstance(packet, DecodedPacket) else cls(packet)
+
+    @property
+    def supported(self) -> bool:
+        """Whether decoding the message of this packet is supported."""
+        return self.flag != MessageTypeFlag.NONE
+
+    @property
+    def message_name(self) -> str:
+        """
+        The name of the message type as defined in the ripple.proto file.
+
+        Raises:
+            DecodingNotSupportedError: If the message type of the packet is not supported.
+        """
+        if not self.supported:
+            raise DecodingNotSupportedError(
+                f"Decoding of message type {self.message_type} not supported"
+            )
+        return PacketEncoderDecoder.message_type_map[self.message_type].__name__
+
+    @property
+    def message(self) -> Message:
+        """
+        The decoded message, which is decoded on first access.
+
+        Raises:
+            DecodingNotSupportedError: If the message type of the packet is not supported.
+        """
+        if self._message is None:
+            self._message = PacketEncoderDecoder.decode_packet(self.packet)[0]
+        return self._message
+
+    @property
+    def text(self) -> str:
+        """
+        The decoded message as single-line text, which is rendered on first access.
+
+        Raises:
+            DecodingNotSupportedError: If the message type of the packet is not supported.
+        """
+        if self._text is None:
+            self._text = self.message.__str__().replace("\n", "; ")
+        return self._text
+
+    def copy_message(self) -> Message:
+        """
+        Create a copy of the decoded message, which can be mutated without affecting this packet.
+
+        Returns:
+            Message: A copy of the decoded message.
+
+        Raises:
+            DecodingNotSupportedError: If the message type of the packet is not supported.
+        """
+        message = type(self.message)()
+        message.CopyFrom(self.message)
+        return message
@@ -0,0 +1,206 @@
+"""This module evaluates encodings concurrently, every evaluation in its own process with its own ports."""
+
+import contextlib
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Any, Callable, List, Sequence, Tuple
+
+from loguru import logger
+
+from rocket_controller.parallel_executor import WorkerConfig
+
+Evaluate = Callable[[List[int], WorkerConfig], Any]
+
+# Seconds a timed out evaluation gets to stop its interceptor after SIGTERM, before it is killed
+TERMINATE_GRACE_SECONDS = 5.0
+
+
+class EvaluationPool:
+    """
+    Pool of workers which evaluate encodings, e.g. by running the network with an evolutionary strategy.
+
+    Every worker owns a WorkerConfig, so its evaluations use their own controller port and network ports.
+    An evaluation runs in a new spawned process, which is retried when it raises, crashes or times out.
+    The process leads its own process group, so a timed out evaluation is terminated together with the processes
+    it started, such as the interceptor, before it is retried on the same worker.
+    """
+
+    def __init__(
+        self,
+        evaluate: Evaluate,
+        workers: List[WorkerConfig],
+        retries: int = 1,
+        timeout: float | None = None,
+    ):
+        """
+        Initialize EvaluationPool class.
+
+        Args:
+            evaluate: Picklable function which evaluates an encoding using the ports and directories of a worker.
+            workers: The configs of the workers, the amount of workers is the amount of concurrent evaluations.
+            retries: The amount of times a failed evaluation is retried.
+            timeout: The maximum amount of seconds of an evaluation, None to wait indefinitely.
+
+        Raises:
+            ValueError: If there are no workers or the amount of retries is negative.
+        """
+        if not workers:
+            raise ValueError("An EvaluationPool needs at least one worker.")
+        if retries < 0:
+            raise ValueError(f"retries should be at least 0, but got {retries}")
+        self.evaluate = evaluate
+        self.workers = workers
+        self.retries = retries
+        self.timeout = timeout
+        self._context = multiprocessing.get_context("spawn")
+        self._evaluations = 0
+        self._lock = threading.Lock()
+
+    def map(self, encodings: Sequence[List[int]]) -> List[Any | None]:
+        """
+        Evaluate encodings concurrently.
+
+        Args:
+            encodings: The encodings to evaluate.
+
+        Returns:
+            List[Any | None]: The result of every encoding, in the same order, None if all attempts failed.
+        """
+        jobs: queue.SimpleQueue[Tuple[int, List[int]]] = queue.SimpleQueue()
+        for job in enumerate(encodings):
+            jobs.put(job)
+        results: List[Any | None] = [None] * len(encodings)
+
+        def work(worker: WorkerConfig):
+            while True:
+                try:
+                    index, encoding = jobs.get_nowait()
+                except queue.Empty:
+                    return
+                results[index] = self._evaluate_with_retries(worker, encoding)
+
+        threads = [
+            threading.Thread(
+                target=work, args=(worker,), name=f"Evaluation-{worker.worker_id}"
+            )
+            for worker in self.workers[: len(encodings)]
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def _evaluate_with_retries(
+        self, worker: WorkerConfig, encoding: List[int]
+    ) -> Any | None:
+        """
+        Evaluate an encoding on a worker, retrying failed attempts.
+
+        Args:
+            worker: The config of the worker.
+            encoding: The encoding to evaluate.
+
+        Returns:
+            Any | None: The result of the evaluation, None if all attempts failed.
+        """
+        for attempt in range(self.retries + 1):
+            with self._lock:
+                evaluation = self._evaluations
+                self._evaluations += 1
+            # Every attempt logs to its own directory, so a retry does not mix its logs with the failed attempt
+            job = worker._replace(log_dir=f"{worker.log_dir}/evaluation-{evaluation}")
+            success, result = self._run_process(job, encoding)
+            if success:
+                return result
+            logger.error(
+                f"Evaluation on worker {worker.worker_id} failed (attempt {attempt + 1} of {self.retries + 1}): {result}"
+            )
+        return None
+
+    def _run_process(
+        self, worker: WorkerConfig, encoding: List[int]
+    ) -> Tuple[bool, Any]:
+        """
+        Run a single evaluation in a new process.
+
+        Args:
+            worker: The config of the worker, with the log directory of this evaluation.
+            encoding: The encoding to evaluate.
+
+        Returns:
+            Tuple[bool, Any]: Whether the evaluation succeeded, and its result or the reason it failed.
+        """
+        receiver, sender = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_run_evaluation,
+            args=(self.evaluate, encoding, worker, sender),
+            name=f"Evaluation-{worker.worker_id}",
+        )
+        process.start()
+        # Close the parent's copy of the sending end, so receiving fails once the process exits without a result
+        sender.close()
+        try:
+            if not receiver.poll(self.timeout):
+                _terminate_process_group(process)
+                return False, f"timed out after {self.timeout} seconds"
+            return receiver.recv()
+        except EOFError:
+            return False, "the process exited without a result"
+        finally:
+            process.join()
+            receiver.close()
+
+
+def _run_evaluation(
+    evaluate: Evaluate,
+    encoding: List[int],
+    worker: WorkerConfig,
+    connection: Connection,
+):
+    """
+    Evaluate an encoding and send the result to the pool, used as the target of the process of an evaluation.
+
+    Args:
+        evaluate: The function which evaluates the encoding.
+        encoding: The encoding to evaluate.
+        worker: The config of the worker.
+        connection: The connection to send whether the evaluation succeeded and its result over.
+    """
+    if hasattr(os, "setsid"):
+        os.setsid()
+    try:
+        connection.send((True, evaluate(encoding, worker)))
+    except Exception as e:
+        connection.send((False, repr(e)))
+    finally:
+        connection.close()
+
+
+def _terminate_process_group(process: BaseProcess):
+    """
+    Terminate an evaluation process together with the processes it started.
+
+    The group gets SIGTERM first, so the interceptor can stop its containers, and SIGKILL once the grace period ended.
+    Without process groups, e.g. on Windows, or if the process did not lead its group yet, only the process is terminated.
+
+    Args:
+        process: The process of the evaluation, which leads its own process group.
+    """
+    if process.pid is None or not hasattr(os, "killpg"):
+        process.terminate()
+        return
+    pid = process.pid
+    try:
+        os.killpg(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        process.terminate()
+        return
+    process.join(TERMINATE_GRACE_SECONDS)
+    with contextlib.suppress(ProcessLookupError):
+        os.killpg(pid, signal.SIGKILL)
@@ -0,0 +1,236 @@
+"""This module collects the metrics of a run while it progresses, and scores runs for evolutionary testing."""
+
+import threading
+from typing import Any, Dict, List, NamedTuple
+
+# The version of the format of RunMetrics.summary, results are cached under it so results in another format are not scored.
+SUMMARY_VERSION = 1
+
+
+class FitnessWeights(NamedTuple):
+    """
+    The weights of the metrics of an iteration in its fitness.
+
+    The fitness rewards encodings which disrupt consensus, so failing a spec check, slow validation and
+    transactions which are not validated all increase it.
+    """
+
+    failed_termination: float = 10.0
+    failed_agreement: float = 100.0
+    time_to_validation: float = 1.0
+    unvalidated_transactions: float = 1.0
+
+
+def iteration_fitness(iteration: Dict[str, Any], weights: FitnessWeights) -> float:
+    """
+    Score the metrics of an iteration.
+
+    Args:
+        iteration: The metrics of the iteration, as in the summary of RunMetrics.
+        weights: The weights of the metrics.
+
+    Returns:
+        float: The fitness of the iteration, spec checks which did not run yet count as passed. A checked
+            iteration without validated ledgers halted, it failed termination and took the whole timeout.
+    """
+    halted = (
+        iteration["reached_goal_ledger"] is not None
+        and iteration["ledger_results"] == 0
+    )
+    failed_termination = iteration["reached_goal_ledger"] is False or halted
+    failed_agreement = (
+        iteration["same_ledger_hashes"] is False
+        or iteration["same_ledger_indexes"] is False
+    )
+    time_to_validation = (
+        iteration.get("timeout_seconds", 0.0)
+        if halted
+        else iteration["mean_time_to_validation"]
+    )
+    unvalidated = iteration["transactions"] - iteration["validated_transactions"]
+    return (
+        weights.failed_termination * failed_termination
+        + weights.failed_agreement * failed_agreement
+        + weights.time_to_validation * time_to_validation
+        + weights.unvalidated_transactions * unvalidated
+    )
+
+
+def run_fitness(summary: Dict[str, Any], weights: FitnessWeights) -> float:
+    """
+    Score a run by the mean fitness of its iterations.
+
+    Args:
+        summary: The summary of the run, as returned by RunMetrics.summary.
+        weights: The weights of the metrics.
+
+    Returns:
+        float: The fitness of the run, 0 if no iteration started.
+    """
+    iterations = summary["iterations"]
+    if not iterations:
+        return 0.0
+    return sum(iteration_fitness(it, weights) for it in iterations) / len(iterations)
+
+
+class RunMetrics:
+    """
+    Metrics of every iteration of a run, updated by the iteration type while the run progresses.
+
+    The metrics are taken from the same data as the result, spec check and transaction logs, so they are
+    available in memory as soon as they are logged, without reading the CSV files back. Updates come from the
+    threads logging ledger results, so they are protected by a lock.
+    """
+
+    def __init__(
+        self,
+        weights: FitnessWeights | None = None,
+        abort_after: int | None = None,
+        abort_below: float = 0.0,
+    ):
+        """
+        Initialize RunMetrics class.
+
+        Args:
+            weights: The weights of the metrics in the fitness of the run.
+            abort_after: The amount of spec-checked iterations after which a hopeless run is aborted, None to never abort.
+            abort_below: The fitness below which a run is hopeless.
+        """
+        self.weights = weights if weights is not None else FitnessWeights()
+        self.abort_after = abort_after
+        self.abort_below = abort_below
+        self.aborted = False
+        self._iterations: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def start_iteration(self, iteration: int, timeout_seconds: float = 0.0):
+        """
+        Start collecting the metrics of a new iteration.
+
+        Args:
+            iteration: The number of the iteration.
+            timeout_seconds: The timeout of the iteration, counted as the time to validation if no ledger is validated.
+        """
+        with self._lock:
+            self._iterations.append(
+                {
+                    "iteration": iteration,
+                    "timeout_seconds": timeout_seconds,
+                    "goal_ledger_seq": None,
+                    "ledger_results": 0,
+                    "max_ledger_seq": 0,
+                    "mean_time_to_validation": 0.0,
+                    "max_time_to_validation": 0.0,
+                    "reached_goal_ledger": None,
+                    "same_ledger_hashes": None,
+                    "same_ledger_indexes": None,
+                    "transactions": 0,
+                    "validated_transactions": 0,
+                }
+            )
+
+    def add_ledger_result(
+        self,
+        ledger_seq: int,
+        goal_ledger_seq: int,
+        time_to_validation: float,
+    ):
+        """
+        Add a ledger validated by a node, as logged in the result log of the iteration.
+
+        Args:
+            ledger_seq: The sequence of the validated ledger.
+            goal_ledger_seq: The goal ledger sequence of the iteration.
+            time_to_validation: The seconds the node took to validate the ledger.
+        """
+        with self._lock:
+            if not self._iterations:
+                return
+            current = self._iterations[-1]
+            count = current["ledger_results"] + 1
+            current["ledger_results"] = count
+            current["goal_ledger_seq"] = goal_ledger_seq
+            current["max_ledger_seq"] = max(current["max_ledger_seq"], ledger_seq)
+            current["mean_time_to_validation"] += (
+                time_to_validation - current["mean_time_to_validation"]
+            ) / count
+            current["max_time_to_validation"] = max(
+                current["max_time_to_validation"], time_to_validation
+            )
+
+    def add_transaction(self, validated: bool):
+        """
+        Add a transaction of the iteration, as logged in its transaction log.
+
+        Args:
+            validated: Whether the transaction was validated.
+        """
+        with self._lock:
+            if not self._iterations:
+                return
+            self._iterations[-1]["transactions"] += 1
+            self._iterations[-1]["validated_transactions"] += bool(validated)
+
+    def add_spec_check(
+        self,
+        iteration: int,
+        reached_goal_ledger: bool,
+        same_ledger_hashes: bool | None,
+        same_ledger_indexes: bool | None,
+    ):
+        """
+        Add the spec check of a finished iteration.
+
+        Args:
+            iteration: The number of the iteration.
+            reached_goal_ledger: Whether the goal ledger was reached.
+            same_ledger_hashes: Whether the ledger hashes were the same, None if no ledger was validated.
+            same_ledger_indexes: Whether the ledger indexes were the same, None if no ledger was validated.
+        """
+        with self._lock:
+            for metrics in self._iterations:
+                if metrics["iteration"] == iteration:
+                    metrics["reached_goal_ledger"] = reached_goal_ledger
+                    metrics["same_ledger_hashes"] = same_ledger_hashes
+                    metrics["same_ledger_indexes"] = same_ledger_indexes
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize the metrics of the run.
+
+        Returns:
+            Dict[str, Any]: A JSON serializable copy of the metrics of every iteration, and whether the run was aborted.
+        """
+        with self._lock:
+            return {
+                "iterations": [dict(metrics) for metrics in self._iterations],
+                "aborted": self.aborted,
+            }
+
+    def fitness(self) -> float:
+        """
+        Score the run so far.
+
+        Returns:
+            float: The fitness of the run.
+        """
+        return run_fitness(self.summary(), self.weights)
+
+    def should_abort(self) -> bool:
+        """
+        Decide whether the run is hopeless, called after the spec check of every iteration.
+
+        Returns:
+            bool: True if at least abort_after iterations were spec-checked and the fitness is below abort_below.
+        """
+        if self.abort_after is None:
+            return False
+        summary = self.summary()
+        checked = [
+            it for it in summary["iterations"] if it["reached_goal_ledger"] is not None
+        ]
+        if len(checked) < self.abort_after:
+            return False
+        if run_fitness({"iterations": checked}, self.weights) < self.abort_below:
+            self.aborted = True
+        return self.aborted
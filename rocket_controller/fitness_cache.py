@@ -0,0 +1,177 @@
+"""This module contains a persistent cache of the results of evaluating encodings, used by evolutionary testing."""
+
+import hashlib
+import json
+import random
+import sqlite3
+import time
+from typing import Any, Dict, List, Tuple
+
+
+class FitnessCache:
+    """
+    Cache of evaluation results, stored in an SQLite database so it survives restarts.
+
+    Results are keyed by a hash of the strategy, the number of nodes, the encoding, the seed and the version
+    of the format of the results.
+    Since network runs are noisy, an encoding can keep several samples: it is evaluated until it has
+    min_samples, and afterwards evaluated again with resample_probability until it has max_samples.
+    The encoding of a key is stored as well, so models such as a surrogate can be fitted on the cache.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        min_samples: int = 1,
+        max_samples: int = 1,
+        resample_probability: float = 0.0,
+        rng: random.Random | None = None,
+    ):
+        """
+        Initialize FitnessCache class.
+
+        Args:
+            path: The path of the database file, created if it does not exist.
+            min_samples: The amount of samples an encoding needs before its cached results are used.
+            max_samples: The maximum amount of samples of an encoding.
+            resample_probability: The probability an encoding with at least min_samples is evaluated again.
+            rng: Random number generator deciding whether to resample.
+
+        Raises:
+            ValueError: If the sample bounds or the probability are invalid.
+        """
+        if not 1 <= min_samples <= max_samples:
+            raise ValueError(
+                f"Expected 1 <= min_samples <= max_samples, but got {min_samples} and {max_samples}"
+            )
+        if not 0 <= resample_probability <= 1:
+            raise ValueError(
+                f"resample_probability should be between 0 and 1, but got {resample_probability}"
+            )
+        self.path = path
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.resample_probability = resample_probability
+        self._random = rng if rng is not None else random.Random()
+        self._connection = sqlite3.connect(path)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS samples (key TEXT NOT NULL, result TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS samples_key ON samples (key)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS encodings (key TEXT PRIMARY KEY, encoding TEXT NOT NULL)"
+            )
+
+    @staticmethod
+    def key(
+        strategy: str,
+        nodes: int,
+        encoding: List[int],
+        seed: int | None,
+        version: int = 0,
+    ) -> str:
+        """
+        Compute the key of an evaluation.
+
+        Args:
+            strategy: The name of the strategy.
+            nodes: The number of nodes in the network.
+            encoding: The evaluated encoding.
+            seed: The seed of the run.
+            version: The version of the format of the results, so results in an older format are not used.
+
+        Returns:
+            str: The SHA-256 hash of the parameters as hex.
+        """
+        parameters = json.dumps(
+            [strategy, nodes, [int(x) for x in encoding], seed, version]
+        )
+        return hashlib.sha256(parameters.encode()).hexdigest()
+
+    def samples(self, key: str) -> List[Any]:
+        """
+        Get the cached results of an evaluation.
+
+        Args:
+            key: The key of the evaluation.
+
+        Returns:
+            List[Any]: The results, oldest first.
+        """
+        rows = self._connection.execute(
+            "SELECT result FROM samples WHERE key = ? ORDER BY rowid", (key,)
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def needs_evaluation(self, key: str) -> bool:
+        """
+        Decide whether an encoding has to be evaluated, according to the resampling policy.
+
+        Args:
+            key: The key of the evaluation.
+
+        Returns:
+            bool: True if there are too few samples, or if the encoding is resampled.
+        """
+        (count,) = self._connection.execute(
+            "SELECT COUNT(*) FROM samples WHERE key = ?", (key,)
+        ).fetchone()
+        if count < self.min_samples:
+            return True
+        return (
+            count < self.max_samples
+            and self._random.random() < self.resample_probability
+        )
+
+    def add(self, key: str, result: Any, encoding: List[int] | None = None):
+        """
+        Store the result of an evaluation.
+
+        Args:
+            key: The key of the evaluation.
+            result: The JSON serializable result.
+            encoding: The evaluated encoding, stored once per key.
+        """
+        with self._connection:
+            self._connection.execute(
+                "INSERT INTO samples (key, result, created) VALUES (?, ?, ?)",
+                (key, json.dumps(result), time.time()),
+            )
+            if encoding is not None:
+                self._connection.execute(
+                    "INSERT OR IGNORE INTO encodings (key, encoding) VALUES (?, ?)",
+                    (key, json.dumps([int(x) for x in encoding])),
+                )
+
+    def evaluations(self) -> List[Tuple[str, List[int], List[Any]]]:
+        """
+        Get all cached evaluations of which the encoding is stored.
+
+        Returns:
+            List[Tuple[str, List[int], List[Any]]]: The key, encoding and results of every evaluation,
+                oldest result first.
+        """
+        rows = self._connection.execute(
+            "SELECT encodings.key, encodings.encoding, samples.result FROM encodings "
+            "JOIN samples ON samples.key = encodings.key ORDER BY encodings.key, samples.rowid"
+        ).fetchall()
+        evaluations: Dict[str, Tuple[str, List[int], List[Any]]] = {}
+        for key, encoding, result in rows:
+            if key not in evaluations:
+                evaluations[key] = (key, json.loads(encoding), [])
+            evaluations[key][2].append(json.loads(result))
+        return list(evaluations.values())
+
+    def __len__(self) -> int:
+        """The amount of distinct cached evaluations."""
+        (count,) = self._connection.execute(
+            "SELECT COUNT(DISTINCT key) FROM samples"
+        ).fetchone()
+        return count
+
+    def close(self):
+        """Close the database."""
+        self._connection.close()
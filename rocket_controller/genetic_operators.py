@@ -0,0 +1,184 @@
+"""This module contains the genetic operators of evolutionary testing, which operate on a whole population at once.
+
+A population is a matrix with an encoding on every row, and the fitness of a population is a vector with the
+fitness of every row, where higher is better. Randomness is drawn from a numpy Generator, so runs are reproducible.
+"""
+
+import numpy as np
+
+
+def random_population(
+    rng: np.random.Generator, size: int, length: int, low: int, high: int
+) -> np.ndarray:
+    """
+    Create a population of random encodings.
+
+    Args:
+        rng: The random number generator.
+        size: The amount of encodings.
+        length: The length of every encoding.
+        low: The minimum value of a gene.
+        high: The maximum value of a gene.
+
+    Returns:
+        np.ndarray: A size x length matrix of integers between low and high inclusive.
+    """
+    return rng.integers(low, high, size=(size, length), endpoint=True)
+
+
+def tournament_selection(
+    rng: np.random.Generator, fitness: np.ndarray, amount: int, tournament_size: int
+) -> np.ndarray:
+    """
+    Select individuals by holding tournaments between randomly drawn individuals, the fittest of every tournament wins.
+
+    Args:
+        rng: The random number generator.
+        fitness: The fitness of every individual.
+        amount: The amount of individuals to select.
+        tournament_size: The amount of individuals drawn for every tournament, with replacement.
+
+    Returns:
+        np.ndarray: The indices of the selected individuals.
+    """
+    candidates = rng.integers(0, len(fitness), size=(amount, tournament_size))
+    winners = np.argmax(fitness[candidates], axis=1)
+    return candidates[np.arange(amount), winners]
+
+
+def rank_selection(
+    rng: np.random.Generator, fitness: np.ndarray, amount: int
+) -> np.ndarray:
+    """
+    Select individuals with a probability proportional to their rank, the least fit individual has rank 1.
+
+    Args:
+        rng: The random number generator.
+        fitness: The fitness of every individual.
+        amount: The amount of individuals to select.
+
+    Returns:
+        np.ndarray: The indices of the selected individuals.
+    """
+    ranks = np.empty(len(fitness))
+    ranks[np.argsort(fitness, kind="stable")] = np.arange(1, len(fitness) + 1)
+    return rng.choice(len(fitness), size=amount, p=ranks / ranks.sum())
+
+
+def elite_indices(fitness: np.ndarray, amount: int) -> np.ndarray:
+    """
+    Find the fittest individuals.
+
+    Args:
+        fitness: The fitness of every individual.
+        amount: The amount of individuals to keep.
+
+    Returns:
+        np.ndarray: The indices of the fittest individuals, fittest first.
+    """
+    return np.argsort(-fitness, kind="stable")[:amount]
+
+
+def uniform_crossover(
+    rng: np.random.Generator,
+    parents_a: np.ndarray,
+    parents_b: np.ndarray,
+    crossover_rate: float = 1.0,
+) -> np.ndarray:
+    """
+    Create children which take every gene from either parent with equal probability.
+
+    Args:
+        rng: The random number generator.
+        parents_a: The first parent of every child.
+        parents_b: The second parent of every child.
+        crossover_rate: The probability a child is a crossover, otherwise it is a copy of its first parent.
+
+    Returns:
+        np.ndarray: The children.
+    """
+    from_b = rng.random(parents_a.shape) < 0.5
+    from_b &= (rng.random(len(parents_a)) < crossover_rate)[:, np.newaxis]
+    return np.where(from_b, parents_b, parents_a)
+
+
+def k_point_crossover(
+    rng: np.random.Generator,
+    parents_a: np.ndarray,
+    parents_b: np.ndarray,
+    points: int = 2,
+    crossover_rate: float = 1.0,
+) -> np.ndarray:
+    """
+    Create children which alternate between the parents at random cut points, starting with the first parent.
+
+    Args:
+        rng: The random number generator.
+        parents_a: The first parent of every child.
+        parents_b: The second parent of every child.
+        points: The amount of cut points of every child, cut points may coincide.
+        crossover_rate: The probability a child is a crossover, otherwise it is a copy of its first parent.
+
+    Returns:
+        np.ndarray: The children.
+    """
+    children, length = parents_a.shape
+    cuts = rng.integers(1, length, size=(children, points, 1), endpoint=False)
+    # The amount of cut points at or before a gene, the gene comes from the second parent if it is odd
+    segments = (np.arange(length) >= cuts).sum(axis=1)
+    from_b = segments % 2 == 1
+    from_b &= (rng.random(children) < crossover_rate)[:, np.newaxis]
+    return np.where(from_b, parents_b, parents_a)
+
+
+def gaussian_mutation(
+    rng: np.random.Generator,
+    population: np.ndarray,
+    mutation_rate: float,
+    sigma: float,
+    low: int,
+    high: int,
+) -> np.ndarray:
+    """
+    Add normally distributed noise to random genes, rounded and clamped to the bounds of a gene.
+
+    Args:
+        rng: The random number generator.
+        population: The encodings to mutate.
+        mutation_rate: The probability a gene is mutated.
+        sigma: The standard deviation of the noise, as a fraction of high - low.
+        low: The minimum value of a gene.
+        high: The maximum value of a gene.
+
+    Returns:
+        np.ndarray: The mutated encodings.
+    """
+    mutate = rng.random(population.shape) < mutation_rate
+    noise = rng.normal(0.0, sigma * (high - low), size=population.shape)
+    mutated = np.clip(np.rint(population + noise), low, high).astype(population.dtype)
+    return np.where(mutate, mutated, population)
+
+
+def uniform_mutation(
+    rng: np.random.Generator,
+    population: np.ndarray,
+    mutation_rate: float,
+    low: int,
+    high: int,
+) -> np.ndarray:
+    """
+    Replace random genes by a random value between the bounds of a gene.
+
+    Args:
+        rng: The random number generator.
+        population: The encodings to mutate.
+        mutation_rate: The probability a gene is mutated.
+        low: The minimum value of a gene.
+        high: The maximum value of a gene.
+
+    Returns:
+        np.ndarray: The mutated encodings.
+    """
+    mutate = rng.random(population.shape) < mutation_rate
+    values = rng.integers(low, high, size=population.shape, endpoint=True)
+    return np.where(mutate, values, population)
@@ -1,9 +1,11 @@
 """This module contains functionality to easily interact with the network packet interceptor subprocess."""
 
+import os
 import traceback
 from subprocess import PIPE, Popen, TimeoutExpired
 from sys import platform
 from threading import Thread
+from typing import Collection
 
 import docker
 from docker import DockerClient
@@ -13,9 +15,29 @@ from loguru import logger
 class InterceptorManager:
     """Class for interacting with the network packet interceptor subprocess."""
 
-    def __init__(self):
-        """Initialize the InterceptorManager, with None for the process variable."""
+    def __init__(
+        self,
+        working_dir: str = "./rocket_interceptor",
+        controller_port: int = 50051,
+        cleanup_containers: bool = True,
+        container_ports: Collection[int] | None = None,
+    ):
+        """
+        Initialize the InterceptorManager, with None for the process variable.
+
+        Args:
+            working_dir: The directory containing the rocket-interceptor executable and its network files.
+            controller_port: The port of the controller, passed to the interceptor as CONTROLLER_PORT.
+            cleanup_containers: Whether the validator containers are stopped once the last iteration finished.
+            container_ports: The host ports of the validator containers of this interceptor. If given, the containers
+                publishing one of these ports are stopped whenever the interceptor stops, so controllers sharing the
+                docker host only stop their own containers.
+        """
         self.process: Popen | None = None
+        self.working_dir = working_dir
+        self.controller_port = controller_port
+        self.cleanup_containers = cleanup_containers
+        self.container_ports = container_ports
 
     @staticmethod
     def __check_output(proc: Popen):
@@ -27,13 +49,29 @@ class InterceptorManager:
             logger.debug(f"\n{stderr}")
 
     @staticmethod
-    def cleanup_docker_containers():
-        """Stop the validator containers."""
+    def cleanup_docker_containers(ports: Collection[int] | None = None):
+        """
+        Stop the validator containers.
+
+        Args:
+            ports: Only stop the containers publishing one of these host ports, all validator containers if None.
+        """
         docker_client: DockerClient = docker.from_env()
         for c in docker_client.containers.list():
-            if "validator_" in c.name:
+            if "validator_" not in (c.name or ""):
+                continue
+            if ports is None or InterceptorManager._publishes_port(c, ports):
                 c.stop()
 
+    @staticmethod
+    def _publishes_port(container, ports: Collection[int]) -> bool:
+        """Check whether a container publishes one of the given host ports."""
+        return any(
+            int(binding["HostPort"]) in ports
+            for bindings in (container.ports or {}).values()
+            for binding in bindings or []
+        )
+
     def start_new(self):
         """Starts the rocket-interceptor subprocess, and spawns a thread checking for output."""
         file = (
@@ -45,7 +83,8 @@ class InterceptorManager:
         try:
             self.process = Popen(
                 [f"./{file}"],
-                cwd="./rocket_interceptor",
+                cwd=self.working_dir,
+                env={**os.environ, "CONTROLLER_PORT": str(self.controller_port)},
                 stdin=PIPE,
                 stdout=PIPE,
                 stderr=PIPE,
@@ -76,3 +115,5 @@ class InterceptorManager:
                 self.process.wait(timeout=5.0)
             except TimeoutExpired:
                 self.process.kill()
+        if self.container_ports is not None:
+            self.cleanup_docker_containers(self.container_ports)
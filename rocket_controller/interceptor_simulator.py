@@ -0,0 +1,417 @@
+"""This module contains a stand-in for the rocket-interceptor, which load-tests the controller with synthetic traffic."""
+
+import argparse
+import asyncio
+import multiprocessing
+import random
+import threading
+import time
+from concurrent import futures
+from typing import Any, Dict, Iterator, List, NamedTuple
+
+import base58
+import grpc
+
+from protos import packet_pb2, packet_pb2_grpc, ripple_pb2
+from rocket_controller.async_packet_server import serve_async
+from rocket_controller.cli_helper import str_to_strategy
+from rocket_controller.encoder_decoder import PacketEncoderDecoder
+from rocket_controller.iteration_type import NoneIteration
+from rocket_controller.packet_server import serve
+from rocket_controller.strategies.async_strategy import AsyncStrategy
+
+# Base58 prefixes of XRPL node public keys, node private keys and seeds.
+NODE_PUBLIC_PREFIX = b"\x1c"
+NODE_PRIVATE_PREFIX = b"\x20"
+SEED_PREFIX = b"\x21"
+
+
+class SimulationReport(NamedTuple):
+    """Outcome of a simulation, with the latency of every send_packet call in seconds."""
+
+    packets: int
+    seconds: float
+    latencies: List[float]
+
+    @property
+    def packets_per_second(self) -> float:
+        """The amount of packets the controller acknowledged per second."""
+        return self.packets / self.seconds if self.seconds > 0 else 0.0
+
+    def latency_percentile(self, percentile: float) -> float:
+        """
+        Look up a percentile of the latencies.
+
+        Args:
+            percentile: The percentile, between 0 and 100.
+
+        Returns:
+            float: The latency in seconds below which the given percentage of the send_packet calls completed.
+        """
+        if not self.latencies:
+            return 0.0
+        latencies = sorted(self.latencies)
+        index = round(percentile / 100 * (len(latencies) - 1))
+        return latencies[index]
+
+    def summary(self) -> str:
+        """
+        Summarize the throughput and latency of the simulation.
+
+        Returns:
+            str: A human readable summary.
+        """
+        return (
+            f"{self.packets} packets in {self.seconds:.3f}s ({self.packets_per_second:.0f} packets/s), latency "
+            f"p50 {self.latency_percentile(50) * 1000:.3f}ms, "
+            f"p90 {self.latency_percentile(90) * 1000:.3f}ms, "
+            f"p99 {self.latency_percentile(99) * 1000:.3f}ms, "
+            f"max {self.latency_percentile(100) * 1000:.3f}ms"
+        )
+
+
+def synthetic_node_info(
+    config: packet_pb2.Config, seed: int | None = None
+) -> List[packet_pb2.ValidatorNodeInfo]:
+    """
+    Generate the validator node info of a network, with the ports of the network config and random keys.
+
+    Args:
+        config: The network config received from the controller.
+        seed: Seed of the generated keys.
+
+    Returns:
+        List[packet_pb2.ValidatorNodeInfo]: The validator node info, in the order of the peer IDs.
+    """
+    rng = random.Random(seed)
+    nodes = []
+    for peer_id in range(config.number_of_nodes):
+        public_key = b"\xed" + rng.randbytes(32)
+        private_key = rng.randbytes(32)
+        nodes.append(
+            packet_pb2.ValidatorNodeInfo(
+                peer_port=config.base_port_peer + peer_id,
+                ws_public_port=config.base_port_ws + peer_id,
+                ws_admin_port=config.base_port_ws_admin + peer_id,
+                rpc_port=config.base_port_rpc + peer_id,
+                status="success",
+                validation_key=rng.randbytes(16).hex().upper(),
+                validation_private_key=base58.b58encode_check(
+                    NODE_PRIVATE_PREFIX + private_key, alphabet=base58.XRP_ALPHABET
+                ).decode(),
+                validation_public_key=base58.b58encode_check(
+                    NODE_PUBLIC_PREFIX + public_key, alphabet=base58.XRP_ALPHABET
+                ).decode(),
+                validation_seed=base58.b58encode_check(
+                    SEED_PREFIX + rng.randbytes(16), alphabet=base58.XRP_ALPHABET
+                ).decode(),
+            )
+        )
+    return nodes
+
+
+def synthetic_traffic(
+    nodes: List[packet_pb2.ValidatorNodeInfo], seed: int | None = None
+) -> Iterator[packet_pb2.Packet]:
+    """
+    Generate consensus traffic of a network, round by round.
+
+    In every round, each node broadcasts a proposal, a validation and a status change to all other nodes,
+    the same message is sent to every peer like an xrpld node does.
+
+    Args:
+        nodes: The validator node info of the network.
+        seed: Seed of the generated hashes and signatures.
+
+    Yields:
+        packet_pb2.Packet: The packets, in the order they are sent.
+    """
+    rng = random.Random(seed)
+    ports = [node.peer_port for node in nodes]
+    public_keys = [
+        base58.b58decode_check(
+            node.validation_public_key, alphabet=base58.XRP_ALPHABET
+        )[1:]
+        for node in nodes
+    ]
+    ledger_hash = rng.randbytes(32)
+    ledger_seq = 2
+    close_time = 800000000
+
+    while True:
+        previous_hash, ledger_hash = ledger_hash, rng.randbytes(32)
+        for sender, public_key in enumerate(public_keys):
+            messages = [
+                PacketEncoderDecoder.encode_message(
+                    ripple_pb2.TMProposeSet(
+                        proposeSeq=0,
+                        currentTxHash=rng.randbytes(32),
+                        nodePubKey=public_key,
+                        closeTime=close_time,
+                        signature=rng.randbytes(rng.randint(70, 72)),
+                        previousledger=previous_hash,
+                    ),
+                    33,
+                ),
+                PacketEncoderDecoder.encode_message(
+                    ripple_pb2.TMValidation(
+                        validation=rng.randbytes(rng.randint(180, 220))
+                    ),
+                    41,
+                ),
+                PacketEncoderDecoder.encode_message(
+                    ripple_pb2.TMStatusChange(
+                        newStatus=ripple_pb2.nsVALIDATING,
+                        newEvent=ripple_pb2.neACCEPTED_LEDGER,
+                        ledgerSeq=ledger_seq,
+                        ledgerHash=ledger_hash,
+                        ledgerHashPrevious=previous_hash,
+                        networkTime=close_time,
+                        firstSeq=1,
+                        lastSeq=ledger_seq,
+                    ),
+                    34,
+                ),
+            ]
+            for data in messages:
+                for receiver, port in enumerate(ports):
+                    if receiver != sender:
+                        yield packet_pb2.Packet(
+                            data=data, from_port=ports[sender], to_port=port
+                        )
+        ledger_seq += 1
+        close_time += 4
+
+
+class InterceptorSimulator:
+    """
+    gRPC client which behaves like the rocket-interceptor towards the controller, without Docker or xrpld.
+
+    It fetches the network config, announces a network of synthetic validator nodes and drives send_packet
+    with synthetic consensus traffic from a pool of threads, measuring the latency of every call.
+    """
+
+    def __init__(
+        self,
+        address: str = "localhost:50051",
+        rate: float = 0,
+        concurrency: int = 8,
+        seed: int | None = None,
+    ):
+        """
+        Initialize InterceptorSimulator class.
+
+        Args:
+            address: Address of the gRPC server of the controller.
+            rate: The amount of packets per second to send, 0 to send as fast as the controller acknowledges them.
+            concurrency: The maximum amount of packets in flight, like the connections of the interceptor.
+            seed: Seed of the synthetic network and its traffic.
+
+        Raises:
+            ValueError: If the rate is negative or the concurrency is not greater than 0.
+        """
+        if rate < 0:
+            raise ValueError("Rate must not be negative.")
+        if concurrency < 1:
+            raise ValueError("Concurrency must be greater than 0.")
+
+        self.rate = rate
+        self.concurrency = concurrency
+        self.seed = seed
+        self.nodes: List[packet_pb2.ValidatorNodeInfo] = []
+        self._channel = grpc.insecure_channel(address)
+        self._stub = packet_pb2_grpc.PacketServiceStub(self._channel)
+
+    def connect(self, timeout: float = 10) -> packet_pb2.Config:
+        """
+        Wait for the controller, fetch its network config and announce the synthetic validator nodes.
+
+        Args:
+            timeout: The amount of seconds to wait for the controller to become reachable.
+
+        Returns:
+            packet_pb2.Config: The network config of the controller.
+        """
+        grpc.channel_ready_future(self._channel).result(timeout=timeout)
+        config = self._stub.get_config(packet_pb2.GetConfig())
+        self.nodes = synthetic_node_info(config, self.seed)
+        self._stub.send_validator_node_info(iter(self.nodes))
+        return config
+
+    def run(self, packet_amount: int) -> SimulationReport:
+        """
+        Send synthetic traffic to the controller.
+
+        Args:
+            packet_amount: The amount of packets to send.
+
+        Returns:
+            SimulationReport: The throughput and latencies of the simulation.
+
+        Raises:
+            RuntimeError: If connect was not called first.
+        """
+        if not self.nodes:
+            raise RuntimeError("The simulator is not connected to the controller")
+
+        traffic = synthetic_traffic(self.nodes, self.seed)
+        lock = threading.Lock()
+        latencies: List[float] = []
+        sent = 0
+        start = time.perf_counter()
+
+        def send():
+            nonlocal sent
+            while True:
+                with lock:
+                    if sent >= packet_amount:
+                        return
+                    index = sent
+                    sent += 1
+                    packet = next(traffic)
+                if self.rate > 0:
+                    # Hold the packet until its scheduled send time, so the rate does not depend on the controller
+                    delay = start + index / self.rate - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                before = time.perf_counter()
+                self._stub.send_packet(packet)
+                latency = time.perf_counter() - before
+                with lock:
+                    latencies.append(latency)
+
+        with futures.ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for worker in [executor.submit(send) for _ in range(self.concurrency)]:
+                worker.result()
+
+        return SimulationReport(len(latencies), time.perf_counter() - start, latencies)
+
+    def close(self):
+        """Close the channel to the controller."""
+        self._channel.close()
+
+
+def serve_strategy(
+    strategy_name: str,
+    port: int,
+    network_config_path: str | None = None,
+    strategy_config_path: str | None = None,
+    keep_action_log: bool = True,
+):
+    """
+    Serve a strategy with a NoneIteration until the process is terminated, used as the target of a simulation.
+
+    Args:
+        strategy_name: The name of the Strategy class.
+        port: The port to serve on.
+        network_config_path: The path of the network config file.
+        strategy_config_path: The path of the strategy config file.
+        keep_action_log: Whether the strategy keeps an action log.
+    """
+    params: Dict[str, Any] = {
+        "iteration_type": NoneIteration(timeout_seconds=24 * 60 * 60)
+    }
+    if network_config_path is not None:
+        params["network_config_path"] = network_config_path
+    if strategy_config_path is not None:
+        params["strategy_config_path"] = strategy_config_path
+    strategy = str_to_strategy(strategy_name)(**params)
+    strategy.keep_action_log = keep_action_log
+
+    if isinstance(strategy, AsyncStrategy):
+
+        async def serve_until_terminated():
+            server = await serve_async(strategy, port=port)
+            await server.wait_for_termination()
+
+        asyncio.run(serve_until_terminated())
+    else:
+        serve(strategy, port=port).wait_for_termination()
+
+
+def main():
+    """Load-test the controller from the command line, and print the report."""
+    parser = argparse.ArgumentParser(
+        prog="python -m rocket_controller.interceptor_simulator",
+        description="Send synthetic consensus traffic to the controller, and report its throughput and latency.",
+    )
+    parser.add_argument(
+        "--strategy",
+        type=str,
+        default=None,
+        help="The name of a Strategy Class to serve in a separate process with a NoneIteration. "
+        "If not set, a controller which is already running is load-tested.",
+    )
+    parser.add_argument(
+        "-n",
+        "--network_config",
+        type=str,
+        default=None,
+        help="The relative path to the network configuration file of the served strategy.",
+        metavar="PATH",
+    )
+    parser.add_argument(
+        "-c",
+        "--config",
+        type=str,
+        default=None,
+        help="The relative path to the configuration file of the served strategy.",
+        metavar="PATH",
+    )
+    parser.add_argument(
+        "--no_action_log",
+        action="store_true",
+        help="Disable the action log of the served strategy.",
+    )
+    parser.add_argument(
+        "--port", type=int, default=50051, help="The port of the controller."
+    )
+    parser.add_argument(
+        "--packets", type=int, default=10000, help="The amount of packets to send."
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=0,
+        help="The amount of packets per second to send. Defaults to 0, sending as fast as possible.",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="The maximum amount of packets in flight.",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the traffic.")
+    args = parser.parse_args()
+
+    server_process = None
+    if args.strategy is not None:
+        # A separate process keeps the client threads from competing with the controller for the GIL
+        server_process = multiprocessing.get_context("spawn").Process(
+            target=serve_strategy,
+            args=(
+                args.strategy,
+                args.port,
+                args.network_config,
+                args.config,
+                not args.no_action_log,
+            ),
+            daemon=True,
+        )
+        server_process.start()
+
+    simulator = InterceptorSimulator(
+        f"localhost:{args.port}", args.rate, args.concurrency, args.seed
+    )
+    try:
+        simulator.connect(timeout=60)
+        print(simulator.run(args.packets).summary())
+    finally:
+        simulator.close()
+        if server_process is not None:
+            server_process.terminate()
+            server_process.join()
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
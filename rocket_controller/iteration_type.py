@@ -3,15 +3,15 @@ import random
 import threading
 import time
 from datetime import datetime
-from typing import Dict, List, TypedDict
+from typing import Any, Dict, List, Protocol, TypedDict
 
 from anyio import sleep
-from grpc import Server
 from loguru import logger
 from xrpl.models.response import ResponseStatus
 
 from protos import ripple_pb2
 from rocket_controller.csv_logger import TransactionLogger
+from rocket_controller.fitness import RunMetrics
 from rocket_controller.interceptor_manager import InterceptorManager
 from rocket_controller.ledger_result import LedgerResult
 from rocket_controller.network_manager import NetworkManager
@@ -20,6 +20,14 @@ from rocket_controller.transaction_builder import TransactionBuilder
 from rocket_controller.validator_node_info import ValidatorNode
 
 
+class ServerHandle(Protocol):
+    """Server which an iteration type can stop, a grpc.Server or the AsyncServerHandle of the async server."""
+
+    def stop(self, grace: float | None) -> Any:
+        """Stop the server, active RPCs are aborted after the grace period in seconds."""
+        ...
+
+
 class LedgerValidationInfo(TypedDict):
     """Information about the ledger validation."""
 
@@ -50,9 +58,10 @@ class TimeBasedIteration:
         self._ledger_results = LedgerResult()
         self._tx_logger: TransactionLogger | None = None
         self._spec_checker: SpecChecker | None = None
+        self._run_metrics: RunMetrics | None = None
 
         self._max_iterations = max_iterations
-        self._server: Server | None = None
+        self._server: ServerHandle | None = None
         self._network: NetworkManager | None = None
         self._timer: threading.Timer | None = None
         self._transaction_timer: threading.Timer | None = None
@@ -76,7 +85,8 @@ class TimeBasedIteration:
             f"Finished iteration {self.cur_iteration-1}, stopping test process..."
         )
         self._interceptor_manager.stop()
-        self._interceptor_manager.cleanup_docker_containers()
+        if self._interceptor_manager.cleanup_containers:
+            self._interceptor_manager.cleanup_docker_containers()
 
     def _terminate_server(self):
         """Terminate the gRPC server."""
@@ -206,20 +216,24 @@ class TimeBasedIteration:
         if tx_hash == 'None':
             self._tx_logger.log_transaction_validation(sender_alias, receiver_alias, amount, 'None', False)
             logger.info(f"Transaction {tx_hash} not submitted, skipping validation.")
+            if self._run_metrics is not None:
+                self._run_metrics.add_transaction(False)
         else:
             try:
                 validated = self._network.validate_transaction(tx_hash, 0)
                 logger.info(f"Transaction {tx_hash} validated: {validated}")
                 self._tx_logger.log_transaction_validation(sender_alias, receiver_alias, amount, tx_hash, validated)
+                if self._run_metrics is not None:
+                    self._run_metrics.add_transaction(validated)
             except Exception as e:
                 logger.error(f"Error while validating transaction: {e}")
 
-    def set_server(self, server: Server):
+    def set_server(self, server: ServerHandle):
         """
         Set the server variable to the running instance of the gRPC server.
 
         Args:
-            server: New Server.
+            server: New Server, or the handle of the async server.
         """
         self._server = server
 
@@ -227,6 +241,25 @@ class TimeBasedIteration:
     def set_network(self, network: NetworkManager):
         self._network = network
 
+    def set_interceptor_manager(self, interceptor_manager: InterceptorManager):
+        """
+        Set the manager of the interceptor subprocess, e.g. to run the interceptor in another directory.
+
+        Args:
+            interceptor_manager: New InterceptorManager.
+        """
+        self._interceptor_manager = interceptor_manager
+
+    def set_run_metrics(self, run_metrics: RunMetrics):
+        """
+        Collect the metrics of every iteration in memory while the run progresses, e.g. to score the run.
+
+        Args:
+            run_metrics: The RunMetrics to update, which can abort the run after an iteration.
+        """
+        self._run_metrics = run_metrics
+        self._ledger_results.run_metrics = run_metrics
+
 
     def set_validator_nodes(self, validator_nodes: List[ValidatorNode]):
         """
@@ -265,13 +298,25 @@ class TimeBasedIteration:
             if "LogLedgerResult" in t.name: # TODO Stopping here is dangerous.
                 t.join()
 
+        aborted = False
         if self.cur_iteration > 1:
-            self._spec_checker.spec_check(self.cur_iteration - 1)
-        if self.cur_iteration <= self._max_iterations:
+            spec_check = self._spec_checker.spec_check(self.cur_iteration - 1)
+            if self._run_metrics is not None:
+                if spec_check is not None:
+                    self._run_metrics.add_spec_check(self.cur_iteration - 1, *spec_check)
+                else:
+                    # Without ledger results the iteration halted before reaching the goal ledger
+                    self._run_metrics.add_spec_check(self.cur_iteration - 1, False, None, None)
+                aborted = self._run_metrics.should_abort()
+                if aborted:
+                    logger.info(f"Aborting the run after iteration {self.cur_iteration - 1}, its fitness is too low")
+        if self.cur_iteration <= self._max_iterations and not aborted:
             self._interceptor_manager.stop()
             self._ledger_results.new_result_logger(self._log_dir, self.cur_iteration)
             self._tx_logger = TransactionLogger(f"{self._log_dir}/iteration-{self.cur_iteration}", self.cur_iteration)
             logger.info(f"Starting iteration {self.cur_iteration}")
+            if self._run_metrics is not None:
+                self._run_metrics.start_iteration(self.cur_iteration, self._timeout_seconds)
             self._interceptor_manager.start_new()
             self._start_timeout_timer()
             self._start_transactions()
@@ -8,6 +8,7 @@ from xrpl.clients import WebsocketClient
 from xrpl.models import Ledger
 
 from rocket_controller.csv_logger import ResultLogger
+from rocket_controller.fitness import RunMetrics
 from rocket_controller.validator_node_info import ValidatorNode
 
 
@@ -17,6 +18,7 @@ class LedgerResult:
     def __init__(self):
         """Initialize the LedgerResult object."""
         self.result_logger: ResultLogger | None = None
+        self.run_metrics: RunMetrics | None = None
 
     def new_result_logger(self, log_dir: str, iteration: int):
         """
@@ -122,3 +124,7 @@ class LedgerResult:
             _ledger_hash,
             _ledger_index,
         )
+        if self.run_metrics is not None:
+            self.run_metrics.add_ledger_result(
+                ledger_seq, goal_ledger, time_to_consensus
+            )
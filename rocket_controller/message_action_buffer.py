@@ -1,17 +1,32 @@
 """This module contains a class which stores received MessageAction entries."""
 
+import threading
+from collections import OrderedDict
+from typing import Callable
+
 from rocket_controller.message_action import MessageAction
 
 
 class MessageActionBuffer:
-    """MessageAction list which holds the last `capacity` amount of given entries."""
+    """
+    MessageAction store which holds the `capacity` most recently used entries.
+
+    Entries are indexed by their initial message, so matching a message takes constant time regardless of the capacity.
+    When the buffer is full, the least recently added or matched entry is evicted.
+    Packets are processed concurrently, so entries are only read, reordered and evicted under a lock.
+    """
 
-    def __init__(self, capacity: int):
+    def __init__(
+        self,
+        capacity: int,
+        on_evict: Callable[[MessageAction], None] | None = None,
+    ):
         """
         Initialize a new MessageActionBuffer.
 
         Args:
             capacity (int): Maximum number of entries to store in buffer.
+            on_evict (Callable[[MessageAction], None], optional): Called with every entry evicted from the buffer.
 
         Raises:
             ValueError: If given capacity is not greater than 0.
@@ -20,19 +35,46 @@ class MessageActionBuffer:
             raise ValueError("Capacity must be greater than 0.")
 
         self.capacity = capacity
-        self.messages: list[MessageAction] = []
+        self.on_evict = on_evict
+        self._entries: OrderedDict[bytes, MessageAction] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def messages(self) -> list[MessageAction]:
+        """The stored MessageAction entries, from least to most recently used."""
+        with self._lock:
+            return list(self._entries.values())
+
+    def __len__(self) -> int:
+        """The amount of stored entries."""
+        return len(self._entries)
 
     def add(self, message: MessageAction):
         """
-        Add a new MessageAction entry.
+        Add a new MessageAction entry, replacing any entry with the same initial message.
 
         Args:
             message (MessageAction): MessageAction to add.
         """
-        while len(self.messages) >= self.capacity:
-            self.messages.pop(0)
+        with self._lock:
+            self._entries[message.initial_message] = message
+            self._entries.move_to_end(message.initial_message)
+
+            while len(self._entries) > self.capacity:
+                (_, evicted) = self._entries.popitem(last=False)
+                if self.on_evict is not None:
+                    self.on_evict(evicted)
 
-        self.messages.append(message)
+    def touch(self, message: bytes):
+        """
+        Mark the entry of a message as most recently used, if it is stored.
+
+        Args:
+            message: The initial message of the entry.
+        """
+        with self._lock:
+            if message in self._entries:
+                self._entries.move_to_end(message)
 
     def match_previous_messages(self, message: bytes) -> tuple[bool, tuple[bytes, int]]:
         """
@@ -45,8 +87,10 @@ class MessageActionBuffer:
             Tuple(bool, Tuple(bytes, int)): Boolean indicating success along with final message and action.
             Returns original message and 0 as action when no match was found.
         """
-        for message_action in self.messages:
-            if message == message_action.initial_message:
-                return True, (message_action.final_message, message_action.action)
+        with self._lock:
+            message_action = self._entries.get(message)
+            if message_action is None:
+                return False, (message, 0)
 
-        return False, (message, 0)
+            self._entries.move_to_end(message)
+        return True, (message_action.final_message, message_action.action)
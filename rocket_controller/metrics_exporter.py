@@ -0,0 +1,232 @@
+"""This module serves live metrics of a running campaign over HTTP, in the Prometheus text exposition format."""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from queue import Queue
+from typing import Dict, List, Tuple
+
+from loguru import logger
+
+from rocket_controller.helper import MAX_U32
+from rocket_controller.stage_timer import BUCKET_BOUNDS_NS, message_type_name
+from rocket_controller.strategies.strategy import Strategy
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class MetricsExporter:
+    """
+    Counts the packets and actions of a strategy, and serves them together with the state of the iteration.
+
+    Counters are updated by the PacketService for every packet, gauges are read from the strategy when the
+    endpoint is scraped, so an idle exporter costs nothing. Rates such as packets per second are derived from
+    the counters by the scraper, e.g. rate(rocket_packets_total[1m]) in Prometheus.
+    """
+
+    def __init__(self, strategy: Strategy, port: int = 9100, host: str = "127.0.0.1"):
+        """
+        Initialize MetricsExporter class.
+
+        Args:
+            strategy: The strategy of which the metrics are exported.
+            port: The port to serve the metrics on, 0 to pick a free port.
+            host: The address to listen on, only the local machine by default.
+        """
+        self.strategy = strategy
+        self.host = host
+        self.port = port
+        self._packets: Dict[int, int] = {}
+        self._actions: Dict[str, int] = {"send": 0, "delay": 0, "drop": 0}
+        self._mutations = 0
+        self._lock = threading.Lock()
+        self._server: ThreadingHTTPServer | None = None
+
+    def count_packet(self, message_type: int, action: int, mutated: bool):
+        """
+        Count a processed packet and the action taken on it.
+
+        Args:
+            message_type: The message type of the packet.
+            action: The action taken by the strategy.
+            mutated: Whether the strategy mutated the packet.
+        """
+        kind = "drop" if action == MAX_U32 else "send" if action == 0 else "delay"
+        with self._lock:
+            self._packets[message_type] = self._packets.get(message_type, 0) + 1
+            self._actions[kind] += 1
+            if mutated:
+                self._mutations += 1
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics.
+        """
+        with self._lock:
+            packets = dict(self._packets)
+            actions = dict(self._actions)
+            mutations = self._mutations
+
+        lines: List[str] = []
+        _add_metric(
+            lines,
+            "rocket_info",
+            "gauge",
+            "The strategy served by the controller.",
+            [(f'strategy="{self.strategy.__class__.__name__}"', 1)],
+        )
+        _add_metric(
+            lines,
+            "rocket_packets_total",
+            "counter",
+            "Packets processed by the strategy, by message type.",
+            [
+                (f'message_type="{message_type_name(message_type)}"', count)
+                for message_type, count in sorted(packets.items())
+            ],
+        )
+        _add_metric(
+            lines,
+            "rocket_actions_total",
+            "counter",
+            "Actions taken by the strategy, a delay is any action other than sending immediately or dropping.",
+            [(f'action="{kind}"', count) for kind, count in actions.items()],
+        )
+        _add_metric(
+            lines,
+            "rocket_mutations_total",
+            "counter",
+            "Packets mutated by the strategy.",
+            [("", mutations)],
+        )
+
+        iteration_type = self.strategy.iteration_type
+        _add_metric(
+            lines,
+            "rocket_iteration",
+            "gauge",
+            "The number of the running iteration.",
+            [("", iteration_type.cur_iteration)],
+        )
+        _add_metric(
+            lines,
+            "rocket_validated_ledger_seq",
+            "gauge",
+            "The sequence of the last ledger validated by every node in the running iteration.",
+            [
+                (f'node="{node_id}"', info["seq"])
+                for node_id, info in sorted(
+                    list(iteration_type.ledger_validation_map.items())
+                )
+            ],
+        )
+        _add_metric(
+            lines,
+            "rocket_outstanding_transactions",
+            "gauge",
+            "Transactions submitted in the running iteration, which are validated at its end.",
+            [("", len(iteration_type.to_be_validated_txs))],
+        )
+        queue = getattr(self.strategy, "queue", None)
+        if isinstance(queue, (Queue, asyncio.Queue)):
+            _add_metric(
+                lines,
+                "rocket_queue_depth",
+                "gauge",
+                "Packets held in the queue of the strategy.",
+                [("", queue.qsize())],
+            )
+        if self.strategy.stage_timer.enabled:
+            self._add_stage_histograms(lines)
+        return "\n".join(lines) + "\n"
+
+    def _add_stage_histograms(self, lines: List[str]):
+        """
+        Add the latency histograms of the stage timer of the strategy.
+
+        Args:
+            lines: The lines of the rendered metrics.
+        """
+        name = "rocket_stage_duration_seconds"
+        lines.append(
+            f"# HELP {name} Duration of the stages of processing a packet, by message type."
+        )
+        lines.append(f"# TYPE {name} histogram")
+        for (stage, message_type), histogram in sorted(
+            self.strategy.stage_timer.histograms().items()
+        ):
+            labels = f'stage="{stage}",message_type="{message_type_name(message_type)}"'
+            cumulative = 0
+            for bound, count in zip(BUCKET_BOUNDS_NS, histogram.counts):
+                cumulative += count
+                lines.append(
+                    f'{name}_bucket{{{labels},le="{bound / 1e9:g}"}} {cumulative}'
+                )
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.total_ns / 1e9}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+    def start(self) -> int:
+        """
+        Start serving the metrics on /metrics in a background thread.
+
+        Returns:
+            int: The port the metrics are served on.
+        """
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(f"Metrics request: {format % args}")
+
+        self._server = ThreadingHTTPServer((self.host, self.port), MetricsHandler)
+        self.port = self._server.server_address[1]
+        threading.Thread(
+            target=self._server.serve_forever, name="MetricsExporter", daemon=True
+        ).start()
+        logger.info(f"Serving metrics on http://{self.host}:{self.port}/metrics")
+        return self.port
+
+    def stop(self):
+        """Stop serving the metrics."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def _add_metric(
+    lines: List[str],
+    name: str,
+    metric_type: str,
+    description: str,
+    samples: List[Tuple[str, int | float]],
+):
+    """
+    Add a metric with its samples in the Prometheus text exposition format.
+
+    Args:
+        lines: The lines of the rendered metrics.
+        name: The name of the metric.
+        metric_type: The Prometheus type of the metric, counter or gauge.
+        description: The help text of the metric.
+        samples: The label string and value of every sample.
+    """
+    lines.append(f"# HELP {name} {description}")
+    lines.append(f"# TYPE {name} {metric_type}")
+    for labels, value in samples:
+        lines.append(f"{name}{{{labels}}} {value}" if labels else f"{name} {value}")
@@ -0,0 +1,105 @@
+"""This module exchanges migrants between the islands of an evolution run, through files in a shared directory."""
+
+import os
+import time
+from pathlib import Path
+from typing import Tuple
+
+import numpy as np
+
+
+class MigrationExchange:
+    """
+    Exchanges migrants between islands arranged in a ring, island k receives the migrants of island k - 1.
+
+    Migrants are written to a file per island and generation, so islands on different hosts can exchange
+    migrants through a shared directory such as an NFS mount. Files are written to a temporary file first
+    and renamed, so an island never reads a partially written file.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        island: int,
+        islands: int,
+        namespace: str = "",
+        poll_interval: float = 1.0,
+    ):
+        """
+        Initialize MigrationExchange class.
+
+        Args:
+            directory: The directory shared by all islands.
+            island: The number of this island.
+            islands: The amount of islands.
+            namespace: Prefix of the files, so runs sharing a directory do not exchange migrants.
+            poll_interval: Seconds between checks whether the migrants of the source island arrived.
+
+        Raises:
+            ValueError: If the island is not one of the islands.
+        """
+        if not 0 <= island < islands:
+            raise ValueError(
+                f"island should be between 0 and {islands - 1}, but got {island}"
+            )
+        self.directory = directory
+        self.island = island
+        self.islands = islands
+        self.namespace = namespace
+        self.poll_interval = poll_interval
+        Path(directory).mkdir(parents=True, exist_ok=True)
+
+    @property
+    def source(self) -> int:
+        """The island this island receives migrants from."""
+        return (self.island - 1) % self.islands
+
+    def path(self, island: int, generation: int) -> str:
+        """
+        Get the path of the file with the migrants of an island.
+
+        Args:
+            island: The number of the island.
+            generation: The generation the migrants emigrated after.
+
+        Returns:
+            str: The path of the file.
+        """
+        return f"{self.directory}/{self.namespace}island-{island}-generation-{generation}.npz"
+
+    def emigrate(self, generation: int, populations: np.ndarray, fitness: np.ndarray):
+        """
+        Send migrants to the next island.
+
+        Args:
+            generation: The generation the migrants emigrate after.
+            populations: The migrating populations, one on every row.
+            fitness: The fitness of every migrating population.
+        """
+        path = self.path(self.island, generation)
+        with open(f"{path}.tmp", "wb") as f:
+            np.savez(f, populations=populations, fitness=fitness)
+        os.replace(f"{path}.tmp", path)
+
+    def immigrate(
+        self, generation: int, timeout: float = 0.0
+    ) -> Tuple[np.ndarray, np.ndarray] | None:
+        """
+        Receive the migrants of the source island, waiting until they arrive.
+
+        Args:
+            generation: The generation the migrants emigrated after.
+            timeout: The maximum amount of seconds to wait.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray] | None: The migrating populations and their fitness,
+                None if they did not arrive in time.
+        """
+        path = self.path(self.source, generation)
+        deadline = time.monotonic() + timeout
+        while not os.path.exists(path):
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(self.poll_interval)
+        with np.load(path) as migrants:
+            return migrants["populations"], migrants["fitness"]
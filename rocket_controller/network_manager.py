@@ -1,6 +1,8 @@
 """This module holds functionalities to control a network of nodes."""
 
-from typing import Any
+import threading
+from functools import partial
+from typing import Any, Callable
 
 import base58
 import xrpl.models.requests
@@ -19,6 +21,7 @@ from rocket_controller.helper import (
 )
 from rocket_controller.message_action import MessageAction
 from rocket_controller.message_action_buffer import MessageActionBuffer
+from rocket_controller.network_topology import NetworkTopology
 from rocket_controller.transaction_builder import TransactionBuilder
 from rocket_controller.validator_node_info import ValidatorNode
 
@@ -45,8 +48,10 @@ class NetworkManager:
         self.node_amount: int = 0
         self.port_to_id_dict: dict[int, int] = {}
         self.id_to_port_dict: dict[int, int] = {}
-        self.communication_matrix: list[list[bool]] = []
+        self.topology = NetworkTopology()
         self.prev_message_action_matrix: list[list[MessageActionBuffer]] = []
+        # Per sender, maps every buffered initial message to the receivers it was sent to and the taken action.
+        self.message_action_index: list[dict[bytes, dict[int, MessageAction]]] = []
         self.subsets_dict: dict[int, list[list[int]] | list[int]] = {}
         self.auto_parse_identical = auto_parse_identical
         self.auto_parse_subsets = auto_parse_subsets
@@ -90,17 +95,30 @@ class NetworkManager:
                 decoded_priv_key.hex()
             )
 
+        # Scheduled changes belong to the previous network
+        self.topology.cancel_scheduled()
+        self.topology = NetworkTopology(self.node_amount)
         self.partition_network(
             [[peer_id for peer_id in range(len(validator_node_list))]]
         )
-        if self.auto_parse_identical:
+        if self.auto_parse_identical or self.auto_parse_subsets:
+            # By default, every peer combination remembers one more message than there are nodes
+            capacity = self.network_config.get(
+                "message_buffer_capacity", self.node_amount + 1
+            )
             self.prev_message_action_matrix = [
                 [
-                    MessageActionBuffer(self.node_amount + 1)
-                    for _ in range(self.node_amount)
+                    MessageActionBuffer(
+                        capacity,
+                        on_evict=partial(
+                            self._remove_from_index, peer_from_id, peer_to_id
+                        ),
+                    )
+                    for peer_to_id in range(self.node_amount)
                 ]
-                for _ in range(self.node_amount)
+                for peer_from_id in range(self.node_amount)
             ]
+            self.message_action_index = [{} for _ in range(self.node_amount)]
         if self.auto_parse_subsets:
             self.subsets_dict = {peer_id: [] for peer_id in range(self.node_amount)}
 
@@ -124,18 +142,12 @@ class NetworkManager:
                 "The given network partition is not valid for the current network."
             )
 
-        self.communication_matrix = [
-            [False for _ in range(self.node_amount)] for _ in range(self.node_amount)
-        ]
-
-        for partition in partitions:
-            for i in range(len(partition)):
-                for j in range(i + 1, len(partition)):
-                    peer_id_1 = partition[i]
-                    peer_id_2 = partition[j]
+        self.topology.partition(partitions)
 
-                    self.communication_matrix[peer_id_1][peer_id_2] = True
-                    self.communication_matrix[peer_id_2][peer_id_1] = True
+    @property
+    def communication_matrix(self) -> list[list[bool]]:
+        """Matrix in which entry [i][j] indicates whether peer i can communicate with peer j."""
+        return self.topology.to_matrix()
 
     def connect_nodes(self, peer_id_1: int, peer_id_2: int):
         """
@@ -149,8 +161,7 @@ class NetworkManager:
             ValueError: if peer_id_1 is equal to peer_id_2 or if any is negative.
         """
         validate_ports_or_ids(peer_id_1, peer_id_2)
-        self.communication_matrix[peer_id_1][peer_id_2] = True
-        self.communication_matrix[peer_id_2][peer_id_1] = True
+        self.topology.connect(peer_id_1, peer_id_2)
 
     def disconnect_nodes(self, peer_id_1: int, peer_id_2: int):
         """
@@ -164,8 +175,21 @@ class NetworkManager:
             ValueError: if peer_id_1 is equal to peer_id_2 or if any is negative.
         """
         validate_ports_or_ids(peer_id_1, peer_id_2)
-        self.communication_matrix[peer_id_1][peer_id_2] = False
-        self.communication_matrix[peer_id_2][peer_id_1] = False
+        self.topology.disconnect(peer_id_1, peer_id_2)
+
+    def isolate_node(self, peer_id: int):
+        """
+        Isolate a node using its ID, which disallows all communication from and to the node.
+
+        Args:
+            peer_id (int): Peer ID.
+
+        Raises:
+            ValueError: if peer_id is negative.
+        """
+        if peer_id < 0:
+            raise ValueError("Received ports or ID's must be non-negative.")
+        self.topology.isolate(peer_id)
 
     def check_communication(self, peer_from_id: int, peer_to_id: int) -> bool:
         """
@@ -182,17 +206,33 @@ class NetworkManager:
             ValueError: if peer_from_id is equal to peer_to_id or if any is negative.
         """
         validate_ports_or_ids(peer_from_id, peer_to_id)
-        return self.communication_matrix[peer_from_id][peer_to_id]
+        return self.topology.can_communicate(peer_from_id, peer_to_id)
 
     def reset_communications(self):
         """
         Reset all communications, falling back to the network configuration.
 
-        This method uses partition_network to rebuild the communication matrix in a correct way.
+        This method does not cancel scheduled topology changes.
         """
-        self.partition_network(
-            [[peer_id for peer_id in range(len(self.validator_node_list))]]
-        )
+        self.topology.heal_all()
+
+    def schedule_topology_change(
+        self, delay: float, change: Callable[..., Any], *args: Any
+    ) -> threading.Timer:
+        """
+        Schedule a change of the communications, which is cancelled when the network is updated.
+
+        Example: self.network.schedule_topology_change(5, self.network.partition_network, [[0], [1, 2]])
+
+        Args:
+            delay: The amount of seconds after which the change is applied.
+            change: The function which applies the change.
+            *args: The arguments to call the function with.
+
+        Returns:
+            threading.Timer: The timer which applies the change, which can be used to cancel it.
+        """
+        return self.topology.schedule(delay, change, *args)
 
     def set_subsets_dict_entry(
         self, peer_id: int, subsets: list[list[int]] | list[int]
@@ -260,9 +300,32 @@ class NetworkManager:
             )
 
         validate_ports_or_ids(peer_from_id, peer_to_id)
-        self.prev_message_action_matrix[peer_from_id][peer_to_id].add(
-            MessageAction(initial_message, final_message, action)
+        message_action = MessageAction(initial_message, final_message, action)
+        self.message_action_index[peer_from_id].setdefault(initial_message, {})[
+            peer_to_id
+        ] = message_action
+        self.prev_message_action_matrix[peer_from_id][peer_to_id].add(message_action)
+
+    def _remove_from_index(
+        self, peer_from_id: int, peer_to_id: int, message_action: MessageAction
+    ):
+        """
+        Remove a MessageAction which was evicted from its buffer from the message_action_index.
+
+        Args:
+            peer_from_id: Sender peer ID.
+            peer_to_id: Receiving peer ID.
+            message_action: The evicted MessageAction.
+        """
+        receivers = self.message_action_index[peer_from_id].get(
+            message_action.initial_message
         )
+        if receivers is None or receivers.get(peer_to_id) is not message_action:
+            return
+
+        del receivers[peer_to_id]
+        if not receivers:
+            del self.message_action_index[peer_from_id][message_action.initial_message]
 
     def check_previous_message(
         self, peer_from_id: int, peer_to_id: int, message: bytes
@@ -313,18 +376,20 @@ class NetworkManager:
         # For the subset which peer_to_id is in, check whether an identical message can be found.
         # If one is found, we automatically parse it to the processed version with its action.
         if peer_to_id in subset:
+            receivers = self.message_action_index[peer_from_id].get(message, {})
+            # The first peer of the subset which received the message determines the action
             for peer_id in subset:
-                if (
-                    result := self.check_previous_message(
-                        peer_from_id, peer_id, message
-                    )
-                )[0]:
-                    # result is a tuple[bool, tuple[bytes, int]]
-                    # The second tuple contains the processed message and an action
+                if (message_action := receivers.get(peer_id)) is not None:
+                    # The entry was used, so it is kept over entries of the receiver which were used less recently
+                    self.prev_message_action_matrix[peer_from_id][peer_id].touch(message)
                     self.set_message_action(
-                        peer_from_id, peer_to_id, message, result[1][0], result[1][1]
+                        peer_from_id,
+                        peer_to_id,
+                        message,
+                        message_action.final_message,
+                        message_action.action,
                     )
-                    return result
+                    return True, (message_action.final_message, message_action.action)
 
         return False, self.check_previous_message(peer_from_id, peer_to_id, message)[1]
 
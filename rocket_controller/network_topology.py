@@ -0,0 +1,146 @@
+"""This module contains a class which stores which nodes of a network are able to communicate with each other."""
+
+import threading
+from typing import Any, Callable
+
+
+class NetworkTopology:
+    """
+    Communication topology of a network of nodes, stored as an adjacency bitset per node.
+
+    Bit j of the bitset of node i is set when node i can communicate with node j. Every modification builds
+    new bitsets and replaces them at once, so reads do not take a lock and always observe a consistent topology.
+    Modifications are serialized, which allows them to be scheduled from other threads.
+    """
+
+    def __init__(self, node_amount: int = 0):
+        """
+        Initialize a new NetworkTopology in which no nodes can communicate.
+
+        Args:
+            node_amount: The amount of nodes in the network.
+        """
+        self.node_amount = node_amount
+        self._rows: tuple[int, ...] = (0,) * node_amount
+        self._lock = threading.Lock()
+        self._timers: list[threading.Timer] = []
+
+    def can_communicate(self, peer_from_id: int, peer_to_id: int) -> bool:
+        """
+        Check whether 2 nodes can communicate with each other.
+
+        Args:
+            peer_from_id: The peer ID from where the message was sent.
+            peer_to_id: The peer ID to where the message was sent.
+
+        Returns:
+            bool: A boolean indicating whether communication is permitted between the 2 given ID's.
+        """
+        return bool(self._rows[peer_from_id] >> peer_to_id & 1)
+
+    def to_matrix(self) -> list[list[bool]]:
+        """
+        Build the communication matrix of the topology.
+
+        Returns:
+            list[list[bool]]: Matrix in which entry [i][j] indicates whether node i can communicate with node j.
+        """
+        rows = self._rows
+        return [
+            [bool(row >> peer_id & 1) for peer_id in range(self.node_amount)]
+            for row in rows
+        ]
+
+    def partition(self, partitions: list[list[int]]):
+        """
+        Replace the topology by the given partitions, nodes can only communicate with nodes in their own partition.
+
+        Args:
+            partitions: List containing the network partitions (as lists of peer ID's).
+        """
+        rows = [0] * self.node_amount
+        for partition in partitions:
+            mask = 0
+            for peer_id in partition:
+                mask |= 1 << peer_id
+            for peer_id in partition:
+                rows[peer_id] = mask & ~(1 << peer_id)
+
+        with self._lock:
+            self._rows = tuple(rows)
+
+    def heal_all(self):
+        """Allow communication between all nodes."""
+        self.partition([list(range(self.node_amount))])
+
+    def isolate(self, peer_id: int):
+        """
+        Disallow all communication from and to a node.
+
+        Args:
+            peer_id: The peer ID of the node to isolate.
+        """
+        mask = ~(1 << peer_id)
+        with self._lock:
+            rows = [row & mask for row in self._rows]
+            rows[peer_id] = 0
+            self._rows = tuple(rows)
+
+    def connect(self, peer_id_1: int, peer_id_2: int):
+        """
+        Allow communication between 2 nodes.
+
+        Args:
+            peer_id_1: Peer ID 1.
+            peer_id_2: Peer ID 2.
+        """
+        with self._lock:
+            rows = list(self._rows)
+            rows[peer_id_1] |= 1 << peer_id_2
+            rows[peer_id_2] |= 1 << peer_id_1
+            self._rows = tuple(rows)
+
+    def disconnect(self, peer_id_1: int, peer_id_2: int):
+        """
+        Disallow communication between 2 nodes.
+
+        Args:
+            peer_id_1: Peer ID 1.
+            peer_id_2: Peer ID 2.
+        """
+        with self._lock:
+            rows = list(self._rows)
+            rows[peer_id_1] &= ~(1 << peer_id_2)
+            rows[peer_id_2] &= ~(1 << peer_id_1)
+            self._rows = tuple(rows)
+
+    def schedule(
+        self, delay: float, change: Callable[..., Any], *args: Any
+    ) -> threading.Timer:
+        """
+        Schedule a change of the topology to be applied after a delay.
+
+        Example: topology.schedule(5, topology.heal_all)
+
+        Args:
+            delay: The amount of seconds after which the change is applied.
+            change: The function which applies the change.
+            *args: The arguments to call the function with.
+
+        Returns:
+            threading.Timer: The timer which applies the change, which can be used to cancel it.
+        """
+        timer = threading.Timer(delay, change, args)
+        timer.daemon = True
+        with self._lock:
+            self._timers = [t for t in self._timers if t.is_alive()]
+            self._timers.append(timer)
+        timer.start()
+        return timer
+
+    def cancel_scheduled(self):
+        """Cancel all scheduled changes which were not applied yet."""
+        with self._lock:
+            timers, self._timers = self._timers, []
+        for timer in timers:
+            timer.cancel()
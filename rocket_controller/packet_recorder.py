@@ -0,0 +1,200 @@
+"""This module contains a recorder which captures the traffic of the PacketService in a binary trace, and its reader."""
+
+import atexit
+import struct
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, NamedTuple
+
+from protos import packet_pb2
+
+MAGIC = b"RCTR"
+VERSION = 1
+
+# Magic bytes and format version at the start of every trace.
+file_header = struct.Struct("<4sH")
+# Record kind, timestamp and the lengths of the two serialized messages following the header.
+record_header = struct.Struct("<BqII")
+# Length prefix of every serialized ValidatorNodeInfo in a node info record.
+node_length = struct.Struct("<I")
+
+NODE_INFO = 0
+PACKET = 1
+
+
+class TracedNodeInfo(NamedTuple):
+    """The validator node info sent by the interceptor at the start of an iteration."""
+
+    timestamp: int
+    nodes: List[packet_pb2.ValidatorNodeInfo]
+
+
+class TracedPacket(NamedTuple):
+    """A packet received from the interceptor, and the ack which was returned for it."""
+
+    timestamp: int
+    packet: packet_pb2.Packet
+    ack: packet_pb2.PacketAck
+
+
+class PacketRecorder:
+    """
+    Recorder which stores every packet and ack handled by the PacketService in a binary trace.
+
+    Every record consists of a fixed size header, followed by the serialized protobuf messages.
+    The trace can be read with read_trace, or fed back through a strategy with packet_replay.replay_trace.
+    """
+
+    def __init__(self, filepath: str):
+        """
+        Initialize PacketRecorder class, the trace file is created immediately.
+
+        Args:
+            filepath: Path of the trace file, its parent directories are created if they do not exist.
+        """
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        self.filepath = filepath
+
+        self._lock = threading.Lock()
+        self._file = open(filepath, mode="wb", buffering=1 << 20)
+        self._file.write(file_header.pack(MAGIC, VERSION))
+        # Make sure buffered records are written when the application exits without closing the recorder
+        atexit.register(self.close)
+
+    def record_node_info(
+        self,
+        nodes: List[packet_pb2.ValidatorNodeInfo],
+        custom_timestamp: int | None = None,
+    ):
+        """
+        Record the validator node info of a new iteration.
+
+        Args:
+            nodes: The validator node info, in the order it was received.
+            custom_timestamp: A custom timestamp to record if desired.
+        """
+        payload = b"".join(
+            node_length.pack(len(data)) + data
+            for data in (node.SerializeToString() for node in nodes)
+        )
+        self._write(NODE_INFO, custom_timestamp, payload, b"")
+
+    def record_packet(
+        self,
+        packet: packet_pb2.Packet,
+        ack: packet_pb2.PacketAck,
+        custom_timestamp: int | None = None,
+    ):
+        """
+        Record a packet and the ack which was returned for it.
+
+        Args:
+            packet: The packet received from the interceptor.
+            ack: The ack returned to the interceptor.
+            custom_timestamp: A custom timestamp to record if desired.
+        """
+        self._write(
+            PACKET,
+            custom_timestamp,
+            packet.SerializeToString(),
+            ack.SerializeToString(),
+        )
+
+    def _write(self, kind: int, timestamp: int | None, first: bytes, second: bytes):
+        """
+        Write a record to the trace.
+
+        Args:
+            kind: The kind of the record.
+            timestamp: The timestamp of the record, in milliseconds since epoch, None for the current time.
+            first: The first serialized message.
+            second: The second serialized message.
+
+        Raises:
+            ValueError: If the recorder was closed.
+        """
+        if timestamp is None:
+            timestamp = int(datetime.now().timestamp() * 1000)
+        header = record_header.pack(kind, timestamp, len(first), len(second))
+        with self._lock:
+            self._file.write(header + first + second)
+
+    def flush(self):
+        """Write all buffered records to the file."""
+        with self._lock:
+            self._file.flush()
+
+    def close(self):
+        """Write all buffered records and close the file, the recorder can not be used afterwards."""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.close()
+        atexit.unregister(self.close)
+
+
+def read_trace(filepath: str) -> Iterator[TracedNodeInfo | TracedPacket]:
+    """
+    Read the records of a trace.
+
+    Args:
+        filepath: Path of the trace.
+
+    Yields:
+        TracedNodeInfo | TracedPacket: The records, in the order they were recorded.
+
+    Raises:
+        ValueError: If the file is not a trace, or if it is truncated or contains an unknown record.
+    """
+    with open(filepath, mode="rb") as f:
+        header = f.read(file_header.size)
+        if len(header) < file_header.size:
+            raise ValueError(f"{filepath} is not a packet trace")
+        (magic, version) = file_header.unpack(header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{filepath} is not a packet trace of version {VERSION}")
+
+        while record := f.read(record_header.size):
+            if len(record) < record_header.size:
+                raise ValueError(f"{filepath} ends with a truncated record")
+            (kind, timestamp, first_length, second_length) = record_header.unpack(
+                record
+            )
+            first = f.read(first_length)
+            second = f.read(second_length)
+            if len(first) < first_length or len(second) < second_length:
+                raise ValueError(f"{filepath} ends with a truncated record")
+
+            if kind == PACKET:
+                yield TracedPacket(
+                    timestamp,
+                    packet_pb2.Packet.FromString(first),
+                    packet_pb2.PacketAck.FromString(second),
+                )
+            elif kind == NODE_INFO:
+                yield TracedNodeInfo(timestamp, _parse_nodes(first))
+            else:
+                raise ValueError(f"{filepath} contains an unknown record kind {kind}")
+
+
+def _parse_nodes(payload: bytes) -> List[packet_pb2.ValidatorNodeInfo]:
+    """
+    Parse the length-prefixed validator node info of a node info record.
+
+    Args:
+        payload: The payload of the record.
+
+    Returns:
+        List[packet_pb2.ValidatorNodeInfo]: The validator node info.
+    """
+    nodes = []
+    offset = 0
+    while offset < len(payload):
+        (length,) = node_length.unpack_from(payload, offset)
+        offset += node_length.size
+        nodes.append(
+            packet_pb2.ValidatorNodeInfo.FromString(payload[offset : offset + length])
+        )
+        offset += length
+    return nodes
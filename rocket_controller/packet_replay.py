@@ -0,0 +1,131 @@
+"""This module replays a recorded packet trace through a strategy offline, without the interceptor or a network."""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List, NamedTuple
+
+from rocket_controller.cli_helper import str_to_strategy
+from rocket_controller.encoder_decoder import DecodedPacket
+from rocket_controller.iteration_type import NoneIteration
+from rocket_controller.packet_recorder import TracedNodeInfo, read_trace
+from rocket_controller.packet_server import to_validator_node
+from rocket_controller.strategies.async_strategy import AsyncStrategy
+from rocket_controller.strategies.strategy import Strategy
+
+
+class ReplayResult(NamedTuple):
+    """Outcome of replaying a trace through a strategy."""
+
+    packets: int
+    mismatches: List[int]
+    seconds: float
+
+    @property
+    def packets_per_second(self) -> float:
+        """The amount of packets the strategy processed per second."""
+        return self.packets / self.seconds if self.seconds > 0 else 0.0
+
+
+def replay_trace(strategy: Strategy, filepath: str) -> ReplayResult:
+    """
+    Feed every packet of a trace through the process_packet method of a strategy, as fast as possible.
+
+    The recorded node info updates the network of the strategy, like it does when the interceptor sends it.
+    Every result is compared with the recorded ack, a seeded strategy reproduces the recorded run exactly.
+    An AsyncStrategy processes the packets one at a time on an event loop.
+
+    Args:
+        strategy: The strategy to replay the trace through, its action log is not written.
+        filepath: Path of the trace, recorded with a PacketRecorder.
+
+    Returns:
+        ReplayResult: The amount of replayed packets, the indices of the packets of which the result
+        differed from the recorded ack and the time spent processing packets.
+
+    Raises:
+        ValueError: If the trace contains a packet before any node info.
+    """
+    packets = 0
+    mismatches: List[int] = []
+    seconds = 0.0
+    has_network = False
+    loop = asyncio.new_event_loop() if isinstance(strategy, AsyncStrategy) else None
+
+    try:
+        for record in read_trace(filepath):
+            if isinstance(record, TracedNodeInfo):
+                strategy.update_network(
+                    [to_validator_node(node) for node in record.nodes]
+                )
+                has_network = True
+                continue
+            if not has_network:
+                raise ValueError(f"{filepath} contains a packet before any node info")
+
+            start = time.perf_counter()
+            packet = DecodedPacket(record.packet)
+            if isinstance(strategy, AsyncStrategy) and loop is not None:
+                result = loop.run_until_complete(strategy.process_packet(packet))
+            else:
+                result = strategy.process_packet(packet)
+            seconds += time.perf_counter() - start
+
+            if result != (
+                record.ack.data,
+                record.ack.action,
+                record.ack.send_amount,
+            ):
+                mismatches.append(packets)
+            packets += 1
+    finally:
+        if loop is not None:
+            loop.close()
+
+    return ReplayResult(packets, mismatches, seconds)
+
+
+def main():
+    """Replay a trace through a strategy from the command line, and print the result."""
+    parser = argparse.ArgumentParser(
+        prog="python -m rocket_controller.packet_replay",
+        description="Replay a packet trace recorded with --record through a strategy, without the interceptor.",
+    )
+    parser.add_argument("trace", type=str, help="The path of the trace to replay.")
+    parser.add_argument(
+        "strategy", type=str, help="The name of the Strategy Class to use."
+    )
+    parser.add_argument(
+        "-n",
+        "--network_config",
+        type=str,
+        default=None,
+        help="The relative path to the network configuration file to use.",
+        metavar="PATH",
+    )
+    parser.add_argument(
+        "-c",
+        "--config",
+        type=str,
+        default=None,
+        help="The relative path to the configuration file to use.",
+        metavar="PATH",
+    )
+    args = parser.parse_args()
+
+    params: Dict[str, Any] = {"iteration_type": NoneIteration()}
+    if args.network_config is not None:
+        params["network_config_path"] = args.network_config
+    if args.config is not None:
+        params["strategy_config_path"] = args.config
+    strategy = str_to_strategy(args.strategy)(**params)
+    result = replay_trace(strategy, args.trace)
+    print(
+        f"Replayed {result.packets} packets in {result.seconds:.3f}s "
+        f"({result.packets_per_second:.0f} packets/s), "
+        f"{len(result.mismatches)} differed from the recorded acks"
+    )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -1,17 +1,24 @@
 """This module is responsible for receiving the incoming packets from the interceptor and returning a response."""
 
 import datetime
+import queue
+import threading
 from concurrent import futures
-from typing import List
+from typing import Iterator, List, Tuple
 
 import grpc
+from loguru import logger
 from typeguard import TypeCheckError, check_type  # type: ignore
 
 from protos import packet_pb2, packet_pb2_grpc
 from protos.packet_pb2 import Packet
+from rocket_controller.binary_action_log import BinaryActionLogger
 from rocket_controller.csv_logger import ActionLogger
-from rocket_controller.encoder_decoder import PacketEncoderDecoder
-from rocket_controller.helper import format_datetime, validate_ports_or_ids
+from rocket_controller.encoder_decoder import DecodedPacket
+from rocket_controller.helper import MAX_U32, validate_ports_or_ids
+from rocket_controller.metrics_exporter import MetricsExporter
+from rocket_controller.packet_recorder import PacketRecorder
+from rocket_controller.strategies.async_strategy import AsyncStrategy
 from rocket_controller.strategies.strategy import Strategy
 from rocket_controller.validator_node_info import (
     SocketAddress,
@@ -21,19 +28,34 @@ from rocket_controller.validator_node_info import (
 
 HOST = "localhost"
 
+# The amount of threads which process the packets received through a stream_packets RPC.
+MAX_STREAM_WORKERS = 64
+
 
 class PacketService(packet_pb2_grpc.PacketServiceServicer):
     """This class is responsible for receiving the incoming packets from the interceptor and returning a response."""
 
-    def __init__(self, strategy: Strategy):
+    def __init__(
+        self,
+        strategy: Strategy,
+        stream_workers: int = MAX_STREAM_WORKERS,
+        recorder: PacketRecorder | None = None,
+        metrics: MetricsExporter | None = None,
+    ):
         """
         Constructor for the PacketService class.
 
         Args:
             strategy: The Strategy to use while serving packets.
+            stream_workers: The amount of threads processing the packets received through a stream_packets RPC.
+            recorder: Recorder which captures every received packet and its ack in a trace, if desired.
+            metrics: Exporter which counts every processed packet and its action, if desired.
         """
         self.strategy = strategy
-        self.logger: ActionLogger | None = None
+        self.logger: ActionLogger | BinaryActionLogger | None = None
+        self.recorder = recorder
+        self.metrics = metrics
+        self.stream_workers = stream_workers
 
     def send_packet(
         self, request, context: grpc.ServicerContext
@@ -50,98 +72,296 @@ class PacketService(packet_pb2_grpc.PacketServiceServicer):
         Returns:
             The possibly modified packet and an action.
 
+        Raises:
+            ValueError: If request.from_port == request.to_port or if any is negative.
+        """
+        return self._process(request)
+
+    def send_packets(
+        self, request: packet_pb2.PacketBatch, context: grpc.ServicerContext
+    ) -> packet_pb2.PacketAckBatch:
+        """
+        This function receives a batch of packets from the interceptor and passes it to the controller at once.
+
+        Every action taken by the defined strategy will be logged in ../execution_logs.
+
+        Args:
+            request: Batch of packets containing intercepted data.
+            context: gRPC context.
+
+        Returns:
+            The possibly modified packets and their actions, in the order of the received packets.
+
+        Raises:
+            ValueError: If the ports of any packet are equal or if any is negative,
+                or if the strategy did not return a result for every packet.
+        """
+        timestamp = int(datetime.datetime.now().timestamp() * 1000)
+        timer = self.strategy.stage_timer
+        packets = [DecodedPacket(packet) for packet in request.packets]
+        for packet in packets:
+            start = timer.now()
+            validate_ports_or_ids(packet.from_port, packet.to_port)
+            timer.record("validate", packet.message_type, start)
+
+        start = timer.now()
+        results = self.strategy.process_packets(packets)
+        timer.record_batch(
+            "process_packet", [packet.message_type for packet in packets], start
+        )
+
+        return packet_pb2.PacketAckBatch(
+            acks=[
+                self._acknowledge(packet, result, timestamp)
+                for packet, result in zip(packets, results, strict=True)
+            ]
+        )
+
+    def stream_packets(
+        self,
+        request_iterator: Iterator[packet_pb2.SequencedPacket],
+        context: grpc.ServicerContext,
+    ) -> Iterator[packet_pb2.SequencedPacketAck]:
+        """
+        This function receives a stream of packets from the interceptor and streams back an ack for every packet.
+
+        Packets are processed concurrently, so acks are returned as soon as they are ready,
+        which is not necessarily in the order the packets were received in.
+        The sequence number of a packet is copied to its ack, so the interceptor can match them.
+        A packet with invalid ports is dropped, without ending the stream.
+        The threads processing the packets are stopped once the stream ends, e.g. when the server stops.
+
+        Args:
+            request_iterator: Iterator of sequence-tagged packets containing intercepted data.
+            context: gRPC context.
+
+        Yields:
+            The sequence-tagged possibly modified packets and their actions.
+        """
+        acks: queue.SimpleQueue[futures.Future | int] = queue.SimpleQueue()
+        executor = futures.ThreadPoolExecutor(
+            max_workers=self.stream_workers, thread_name_prefix="StreamPacket"
+        )
+
+        def consume_requests():
+            # Reading the requests on a separate thread lets the acks be sent while packets are still coming in.
+            submitted = 0
+            try:
+                for request in request_iterator:
+                    future = executor.submit(self._process_sequenced, request)
+                    future.add_done_callback(acks.put)
+                    submitted += 1
+            except RuntimeError:
+                # The stream ended and its executor was shut down
+                pass
+            finally:
+                # Signal the amount of acks to expect before the stream can be closed.
+                acks.put(submitted)
+
+        threading.Thread(
+            target=consume_requests, name="StreamPacketReader", daemon=True
+        ).start()
+
+        sent = 0
+        expected: int | None = None
+        try:
+            while expected is None or sent < expected:
+                item = acks.get()
+                if isinstance(item, int):
+                    expected = item
+                    continue
+                sent += 1
+                yield item.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _process_sequenced(
+        self, request: packet_pb2.SequencedPacket
+    ) -> packet_pb2.SequencedPacketAck:
+        """
+        Process a sequence-tagged packet.
+
+        Args:
+            request: Sequence-tagged packet containing intercepted data.
+
+        Returns:
+            The sequence-tagged ack of the packet, which drops the packet if its ports are invalid.
+        """
+        try:
+            ack = self._process(request.packet)
+        except ValueError as e:
+            ack = reject(request.packet, e)
+        return packet_pb2.SequencedPacketAck(sequence=request.sequence, ack=ack)
+
+    def _process(self, request: packet_pb2.Packet) -> packet_pb2.PacketAck:
+        """
+        Pass a packet to the strategy and log the taken action.
+
+        Args:
+            request: Packet containing intercepted data.
+
+        Returns:
+            The possibly modified packet and an action.
+
         Raises:
             ValueError: If request.from_port == request.to_port or if any is negative.
         """
         timestamp = int(datetime.datetime.now().timestamp() * 1000)
+        timer = self.strategy.stage_timer
+        packet = DecodedPacket(request)
+        start = timer.now()
         validate_ports_or_ids(request.from_port, request.to_port)
+        timer.record("validate", packet.message_type, start)
+
+        start = timer.now()
+        result = self.strategy.process_packet(packet)
+        timer.record("process_packet", packet.message_type, start)
+        return self._acknowledge(packet, result, timestamp)
+
+    def _acknowledge(
+        self,
+        packet: DecodedPacket,
+        result: Tuple[bytes, int, int],
+        timestamp: int,
+    ) -> packet_pb2.PacketAck:
+        """
+        Log the action the strategy took on a packet and build its ack.
 
-        (new_data, action, send_amount) = self.strategy.process_packet(request)
+        Args:
+            packet: Packet containing intercepted data.
+            result: The possibly modified packet data, the action and the send amount returned by the strategy.
+            timestamp: The time the packet was received at, in milliseconds since epoch.
 
-        if not self.strategy.keep_action_log:
-            return packet_pb2.PacketAck(
-                data=new_data, action=action, send_amount=send_amount
+        Returns:
+            The possibly modified packet and an action.
+
+        Raises:
+            RuntimeError: If the action log is kept, but the logger was not initialized.
+        """
+        (new_data, action, send_amount) = result
+        ack = packet_pb2.PacketAck(
+            data=new_data, action=action, send_amount=send_amount
+        )
+
+        if self.recorder is not None:
+            self.recorder.record_packet(packet.packet, ack, timestamp)
+        if self.metrics is not None:
+            self.metrics.count_packet(
+                packet.message_type, action, new_data != packet.data
             )
+        if self.strategy.keep_action_log:
+            self._log_action(packet, result, timestamp)
+
+        return ack
+
+    def _log_action(
+        self,
+        packet: DecodedPacket,
+        result: Tuple[bytes, int, int],
+        timestamp: int,
+    ):
+        """
+        Log the action the strategy took on a packet.
+
+        The message the strategy already decoded is reused, only a mutated packet gets decoded again.
+        The messages are rendered to text by the writer thread of the logger, which is not part of the timed stages.
+
+        Args:
+            packet: Packet containing intercepted data.
+            result: The possibly modified packet data, the action and the send amount returned by the strategy.
+            timestamp: The time the packet was received at, in milliseconds since epoch.
+
+        Raises:
+            RuntimeError: If the logger was not initialized.
+        """
+        (new_data, action, send_amount) = result
 
         if not self.logger:
             raise RuntimeError("Logger was not initialized")
 
-        original_packet_decoded = PacketEncoderDecoder.decode_packet(request)
-        new_packet = Packet(
-            data=new_data, from_port=request.from_port, to_port=request.to_port
+        if self.strategy.action_log_filter is not None and not (
+            self.strategy.action_log_filter.should_log(
+                packet.message_type, action, new_data != packet.data
+            )
+        ):
+            return
+
+        timer = self.strategy.stage_timer
+        start = timer.now()
+        new_packet = (
+            packet
+            if new_data == packet.data
+            else DecodedPacket(
+                Packet(
+                    data=new_data, from_port=packet.from_port, to_port=packet.to_port
+                )
+            )
         )
-        new_packet_decoded = PacketEncoderDecoder.decode_packet(new_packet)
+        timer.record("log_decode", packet.message_type, start)
 
-        self.logger.log_action(
+        start = timer.now()
+        self.logger.log_packet(
             action=action,
             send_amount=send_amount,
-            from_node_id=self.strategy.network.port_to_id(request.from_port),
-            to_node_id=self.strategy.network.port_to_id(request.to_port),
-            message_type=PacketEncoderDecoder.message_type_map[
-                original_packet_decoded[1]
-            ].__name__,
-            original_data=original_packet_decoded[0].__str__().replace("\n", "; "),
-            possibly_mutated_data=new_packet_decoded[0].__str__().replace("\n", "; "),
+            from_node_id=self.strategy.network.port_to_id(packet.from_port),
+            to_node_id=self.strategy.network.port_to_id(packet.to_port),
+            original=packet,
+            possibly_mutated=new_packet,
             custom_timestamp=timestamp,
         )
-
-        return packet_pb2.PacketAck(
-            data=new_data, action=action, send_amount=send_amount
-        )
+        timer.record("log_write", packet.message_type, start)
 
     def send_validator_node_info(
         self,
         request_iterator: List[packet_pb2.ValidatorNodeInfo],
-        context: grpc.ServicerContext,
+        context: grpc.ServicerContext | grpc.aio.ServicerContext,
     ) -> packet_pb2.ValidatorNodeInfoAck:
         """
         This function receives the validator node info from the interceptor and passes it to the controller.
 
         Args:
             request_iterator: Iterator of validator node info.
-            context: gRPC context.
+            context: gRPC context, of the async server in async mode.
 
         Returns:
             ValidatorNodeInfoAck: An acknowledgement.
         """
-        validator_node_list: List[ValidatorNode] = []
-        for request in request_iterator:
-            validator_node_list.append(
-                ValidatorNode(
-                    peer=SocketAddress(
-                        host=HOST,
-                        port=request.peer_port,
-                    ),
-                    ws_public=SocketAddress(
-                        host=HOST,
-                        port=request.ws_public_port,
-                    ),
-                    ws_admin=SocketAddress(
-                        host=HOST,
-                        port=request.ws_admin_port,
-                    ),
-                    rpc=SocketAddress(
-                        host=HOST,
-                        port=request.rpc_port,
-                    ),
-                    validator_key_data=ValidatorKeyData(
-                        status=request.status,
-                        validation_key=request.validation_key,
-                        validation_private_key=request.validation_private_key,
-                        validation_public_key=request.validation_public_key,
-                        validation_seed=request.validation_seed,
-                    ),
-                )
-            )
+        requests = list(request_iterator)
+        if self.recorder is not None:
+            self.recorder.record_node_info(requests)
+        validator_node_list = [to_validator_node(request) for request in requests]
         self.strategy.update_network(validator_node_list)
 
+        if self.logger is not None:
+            # Write the remaining actions of the previous iteration
+            self.logger.close()
+
+        log_dir = f"{self.strategy.log_dir}/iteration-{self.strategy.iteration_type.cur_iteration}"
+        # Write the stage timings of the previous iteration, and time the new iteration separately
+        self.strategy.stage_timer.start_iteration(
+            f"./logs/{log_dir}/stage_timing-{self.strategy.iteration_type.cur_iteration}.json"
+        )
+
         if self.strategy.keep_action_log:
-            self.logger = ActionLogger(
-                f"{format_datetime(self.strategy.start_datetime)}/iteration-{self.strategy.iteration_type.cur_iteration}",
-                validator_node_list,
-                f"action-{self.strategy.iteration_type.cur_iteration}",
-                f"node_info-{self.strategy.iteration_type.cur_iteration}",
+            action_log_filename = f"action-{self.strategy.iteration_type.cur_iteration}"
+            node_log_filename = (
+                f"node_info-{self.strategy.iteration_type.cur_iteration}"
             )
+            if self.strategy.action_log_format == "binary":
+                self.logger = BinaryActionLogger(
+                    log_dir,
+                    validator_node_list,
+                    action_log_filename,
+                    node_log_filename,
+                )
+            else:
+                self.logger = ActionLogger(
+                    log_dir,
+                    validator_node_list,
+                    action_log_filename,
+                    node_log_filename,
+                    text_types=self.strategy.action_log_text_types,
+                )
 
         return packet_pb2.ValidatorNodeInfoAck(status="Received validator node info")
 
@@ -205,11 +425,90 @@ class PacketService(packet_pb2_grpc.PacketServiceServicer):
         )
 
 
-def serve(strategy: Strategy):
-    """This function starts the server and listens for incoming packets."""
+def reject(packet: packet_pb2.Packet, error: Exception) -> packet_pb2.PacketAck:
+    """
+    Drop a packet which cannot be processed, so a stream of packets is not ended by a single invalid packet.
+
+    Args:
+        packet: The packet which cannot be processed.
+        error: The reason the packet cannot be processed.
+
+    Returns:
+        An ack which drops the packet.
+    """
+    logger.error(
+        f"Dropping packet from port {packet.from_port} to port {packet.to_port}: {error}"
+    )
+    return packet_pb2.PacketAck(data=packet.data, action=MAX_U32, send_amount=1)
+
+
+def to_validator_node(request: packet_pb2.ValidatorNodeInfo) -> ValidatorNode:
+    """
+    Convert the validator node info received from the interceptor to a ValidatorNode.
+
+    Args:
+        request: The validator node info.
+
+    Returns:
+        ValidatorNode: The validator node.
+    """
+    return ValidatorNode(
+        peer=SocketAddress(
+            host=HOST,
+            port=request.peer_port,
+        ),
+        ws_public=SocketAddress(
+            host=HOST,
+            port=request.ws_public_port,
+        ),
+        ws_admin=SocketAddress(
+            host=HOST,
+            port=request.ws_admin_port,
+        ),
+        rpc=SocketAddress(
+            host=HOST,
+            port=request.rpc_port,
+        ),
+        validator_key_data=ValidatorKeyData(
+            status=request.status,
+            validation_key=request.validation_key,
+            validation_private_key=request.validation_private_key,
+            validation_public_key=request.validation_public_key,
+            validation_seed=request.validation_seed,
+        ),
+    )
+
+
+def serve(
+    strategy: Strategy,
+    recorder: PacketRecorder | None = None,
+    port: int = 50051,
+    metrics: MetricsExporter | None = None,
+):
+    """
+    This function starts the server and listens for incoming packets.
+
+    Args:
+        strategy: The Strategy to use while serving packets.
+        recorder: Recorder which captures every received packet and its ack in a trace, if desired.
+        port: The port to listen on, the interceptor connects to 50051.
+        metrics: Exporter which counts every processed packet and its action, if desired.
+
+    Returns:
+        The started gRPC server.
+
+    Raises:
+        ValueError: If the strategy is an AsyncStrategy, which can only be served by serve_async.
+    """
+    if isinstance(strategy, AsyncStrategy):
+        raise ValueError(
+            f"{strategy.__class__.__name__} is an AsyncStrategy, which can only be served in async mode."
+        )
     server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    packet_pb2_grpc.add_PacketServiceServicer_to_server(PacketService(strategy), server)
-    server.add_insecure_port("[::]:50051")
+    packet_pb2_grpc.add_PacketServiceServicer_to_server(
+        PacketService(strategy, recorder=recorder, metrics=metrics), server
+    )
+    server.add_insecure_port(f"[::]:{port}")
     server.start()
     strategy.iteration_type.set_server(server)
     strategy.iteration_type.set_network(strategy.network)
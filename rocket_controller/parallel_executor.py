@@ -0,0 +1,373 @@
+"""This module runs the iterations of a campaign concurrently, every worker with its own ports, logs and interceptor."""
+
+import argparse
+import asyncio
+import csv
+import json
+import multiprocessing
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+from sys import platform
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from loguru import logger
+
+from rocket_controller.async_packet_server import serve_async
+from rocket_controller.cli_helper import str_to_strategy
+from rocket_controller.helper import format_datetime, yaml_to_dict
+from rocket_controller.interceptor_manager import InterceptorManager
+from rocket_controller.iteration_type import LedgerBasedIteration
+from rocket_controller.packet_server import serve
+from rocket_controller.spec_checker import SpecChecker
+from rocket_controller.strategies.async_strategy import AsyncStrategy
+
+# The network config entries of the first port of every kind of port, every node uses the next port.
+BASE_PORT_KEYS = (
+    "base_port_peer",
+    "base_port_ws",
+    "base_port_ws_admin",
+    "base_port_rpc",
+)
+INTERCEPTOR_DIR = "./rocket_interceptor"
+DEFAULT_NETWORK_CONFIG = "./config/network/default_network.yaml"
+
+
+class WorkerConfig(NamedTuple):
+    """The iterations, ports and directories of a single worker."""
+
+    worker_id: int
+    iterations: int
+    controller_port: int
+    network_overrides: Dict[str, int]
+    log_dir: str
+    interceptor_dir: str
+    # The peer, websocket and RPC ports of the nodes, which identify the validator containers of the worker
+    node_ports: Tuple[int, ...] = ()
+
+
+def plan_workers(
+    workers: int,
+    iterations: int,
+    network_config: Dict[str, Any],
+    log_dir: str,
+    controller_port: int = 50051,
+) -> List[WorkerConfig]:
+    """
+    Divide the iterations over the workers, and give every worker a separate block of ports.
+
+    Worker k listens on controller_port + k, and its nodes use the ports following those of worker k - 1,
+    so the base ports of the network config must be far enough apart to fit the ports of all workers.
+
+    Args:
+        workers: The amount of workers.
+        iterations: The total amount of iterations.
+        network_config: The network config, containing the number of nodes and the base ports.
+        log_dir: The directory under ./logs of the campaign, every worker logs to a subdirectory.
+        controller_port: The port of the controller of the first worker.
+
+    Returns:
+        List[WorkerConfig]: The config of every worker which runs at least one iteration.
+
+    Raises:
+        ValueError: If there are no workers or iterations, or if the port blocks of the workers overlap.
+    """
+    if workers < 1 or iterations < 1:
+        raise ValueError("The amount of workers and iterations must be at least 1.")
+    workers = min(workers, iterations)
+
+    nodes = network_config["number_of_nodes"]
+    base_ports = sorted(network_config[key] for key in BASE_PORT_KEYS)
+    port_range = min(b - a for a, b in zip(base_ports, base_ports[1:]))
+    if workers * nodes > port_range:
+        raise ValueError(
+            f"{workers} workers with {nodes} nodes need {workers * nodes} ports per kind, "
+            f"but the base ports are only {port_range} apart."
+        )
+
+    per_worker, remainder = divmod(iterations, workers)
+    return [
+        WorkerConfig(
+            worker_id=worker_id,
+            iterations=per_worker + (1 if worker_id < remainder else 0),
+            controller_port=controller_port + worker_id,
+            network_overrides={
+                key: network_config[key] + worker_id * nodes for key in BASE_PORT_KEYS
+            },
+            log_dir=f"{log_dir}/worker-{worker_id}",
+            interceptor_dir=f"{INTERCEPTOR_DIR}/worker-{worker_id}",
+            node_ports=tuple(
+                network_config[key] + worker_id * nodes + node
+                for key in BASE_PORT_KEYS
+                for node in range(nodes)
+            ),
+        )
+        for worker_id in range(workers)
+    ]
+
+
+def prepare_interceptor_dir(interceptor_dir: str, source_dir: str = INTERCEPTOR_DIR):
+    """
+    Create the working directory of the interceptor of a worker, so workers do not share generated network files.
+
+    The network files are copied, the executable is linked.
+
+    Args:
+        interceptor_dir: The working directory to create.
+        source_dir: The directory containing the rocket-interceptor executable and the network files.
+    """
+    Path(interceptor_dir).mkdir(parents=True, exist_ok=True)
+    shutil.copytree(
+        f"{source_dir}/network", f"{interceptor_dir}/network", dirs_exist_ok=True
+    )
+    executable = (
+        "rocket-interceptor" if platform != "win32" else "rocket-interceptor.exe"
+    )
+    target = Path(interceptor_dir, executable)
+    if os.path.exists(f"{source_dir}/{executable}") and not target.exists():
+        if platform == "win32":
+            shutil.copy2(f"{source_dir}/{executable}", target)
+        else:
+            target.symlink_to(os.path.abspath(f"{source_dir}/{executable}"))
+
+
+def run_worker(
+    strategy_name: str,
+    params: Dict[str, Any],
+    worker: WorkerConfig,
+    max_ledger_seq: int = 4,
+    ledger_timeout_seconds: int = 45,
+):
+    """
+    Run the iterations of a worker, used as the target of the process of every worker.
+
+    Args:
+        strategy_name: The name of the Strategy class.
+        params: The parameters of the strategy, the network overrides are extended with the ports of the worker.
+        worker: The config of the worker.
+        max_ledger_seq: The ledger sequence which ends an iteration.
+        ledger_timeout_seconds: The timeout of validating a new ledger.
+    """
+    iteration_type = LedgerBasedIteration(
+        worker.iterations, max_ledger_seq, ledger_timeout_seconds
+    )
+    iteration_type.set_interceptor_manager(
+        InterceptorManager(
+            worker.interceptor_dir,
+            worker.controller_port,
+            cleanup_containers=False,
+            container_ports=worker.node_ports,
+        )
+    )
+    strategy = str_to_strategy(strategy_name)(
+        **{
+            **params,
+            "network_overrides": {
+                **params.get("network_overrides", {}),
+                **worker.network_overrides,
+            },
+            "iteration_type": iteration_type,
+            "log_dir": worker.log_dir,
+        }
+    )
+    logger.info(
+        f"Worker {worker.worker_id} runs {worker.iterations} iterations on port {worker.controller_port}"
+    )
+
+    if isinstance(strategy, AsyncStrategy):
+
+        async def serve_until_terminated():
+            server = await serve_async(strategy, port=worker.controller_port)
+            await server.wait_for_termination()
+
+        asyncio.run(serve_until_terminated())
+    else:
+        serve(strategy, port=worker.controller_port).wait_for_termination()
+
+
+def merge_results(log_dir: str, workers: List[WorkerConfig]) -> Dict[str, Any]:
+    """
+    Merge the spec checks of all workers into the log directory of the campaign, and aggregate them.
+
+    The iterations are named after the log directory of the worker, e.g. worker-2/iteration-3.
+
+    Args:
+        log_dir: The directory under ./logs of the campaign.
+        workers: The configs of the workers.
+
+    Returns:
+        Dict[str, Any]: The aggregated spec check results of all iterations, empty if aggregating failed.
+    """
+    spec_checker = SpecChecker(log_dir)
+    for worker in workers:
+        spec_check_log = f"logs/{worker.log_dir}/spec_check_log.csv"
+        if not os.path.exists(spec_check_log):
+            logger.error(f"Worker {worker.worker_id} did not log any spec checks")
+            continue
+        with open(spec_check_log, newline="") as file:
+            for row in csv.DictReader(file):
+                spec_checker.spec_check_logger.log_spec_check(
+                    f"worker-{worker.worker_id}/iteration-{row['iteration']}",
+                    row["reached_goal_ledger"],
+                    row["same_ledger_hashes"],
+                    row["same_ledger_indexes"],
+                )
+    spec_checker.aggregate_spec_checks()
+
+    aggregated_file = f"logs/{log_dir}/aggregated_spec_check_log.json"
+    if not os.path.exists(aggregated_file):
+        return {}
+    with open(aggregated_file) as file:
+        return json.load(file)
+
+
+class ParallelExecutor:
+    """
+    Runs the iterations of a campaign in concurrent workers, and merges their results afterwards.
+
+    Every worker is a separate process with its own strategy, controller port, block of node ports,
+    log subdirectory and interceptor working directory. The interceptor is passed the port of its controller
+    through the CONTROLLER_PORT environment variable. Workers share the docker host, so every worker only stops
+    the validator containers publishing its own node ports.
+    """
+
+    def __init__(
+        self,
+        strategy_name: str,
+        workers: int,
+        iterations: int,
+        params: Dict[str, Any] | None = None,
+        controller_port: int = 50051,
+        max_ledger_seq: int = 4,
+        ledger_timeout_seconds: int = 45,
+    ):
+        """
+        Initialize ParallelExecutor class.
+
+        Args:
+            strategy_name: The name of the Strategy class.
+            workers: The amount of concurrent workers.
+            iterations: The total amount of iterations.
+            params: The parameters of the strategy, as returned by cli_helper.process_args.
+            controller_port: The port of the controller of the first worker.
+            max_ledger_seq: The ledger sequence which ends an iteration.
+            ledger_timeout_seconds: The timeout of validating a new ledger.
+
+        Raises:
+            ValueError: If there are no workers or iterations, or if the port blocks of the workers overlap.
+        """
+        self.strategy_name = strategy_name
+        self.params = params or {}
+        self.max_ledger_seq = max_ledger_seq
+        self.ledger_timeout_seconds = ledger_timeout_seconds
+        self.log_dir = format_datetime(datetime.now())
+
+        network_config = yaml_to_dict(
+            self.params.get("network_config_path", DEFAULT_NETWORK_CONFIG)
+        )
+        network_config.update(self.params.get("network_overrides", {}))
+        self.workers = plan_workers(
+            workers, iterations, network_config, self.log_dir, controller_port
+        )
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run all workers until their iterations are finished.
+
+        Returns:
+            Dict[str, Any]: The aggregated spec check results of all iterations.
+        """
+        context = multiprocessing.get_context("spawn")
+        processes = []
+        for worker in self.workers:
+            prepare_interceptor_dir(worker.interceptor_dir)
+            process = context.Process(
+                target=run_worker,
+                args=(
+                    self.strategy_name,
+                    self.params,
+                    worker,
+                    self.max_ledger_seq,
+                    self.ledger_timeout_seconds,
+                ),
+                name=f"Worker-{worker.worker_id}",
+            )
+            process.start()
+            processes.append(process)
+
+        try:
+            for process in processes:
+                process.join()
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+            # Workers stop their own containers, stop those left by workers which were terminated
+            InterceptorManager.cleanup_docker_containers(
+                [port for worker in self.workers for port in worker.node_ports]
+            )
+
+        failed = [p.name for p in processes if p.exitcode != 0]
+        if failed:
+            logger.error(f"Workers exited with an error: {', '.join(failed)}")
+        return merge_results(self.log_dir, self.workers)
+
+
+def main():
+    """Run the iterations of a campaign in concurrent workers from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m rocket_controller.parallel_executor",
+        description="Run the iterations of a campaign concurrently, every worker with its own ports and logs.",
+    )
+    parser.add_argument(
+        "strategy", type=str, help="The name of the Strategy Class to use."
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=2, help="The amount of concurrent workers."
+    )
+    parser.add_argument(
+        "-i",
+        "--iterations",
+        type=int,
+        default=10,
+        help="The total amount of iterations, divided over the workers.",
+    )
+    parser.add_argument(
+        "-n",
+        "--network_config",
+        type=str,
+        default=None,
+        help="The relative path to the network configuration file to use.",
+        metavar="PATH",
+    )
+    parser.add_argument(
+        "-c",
+        "--config",
+        type=str,
+        default=None,
+        help="The relative path to the configuration file to use.",
+        metavar="PATH",
+    )
+    parser.add_argument(
+        "--controller_port",
+        type=int,
+        default=50051,
+        help="The controller port of the first worker, worker k uses this port + k.",
+    )
+    args = parser.parse_args()
+
+    params: Dict[str, Any] = {}
+    if args.network_config is not None:
+        params["network_config_path"] = args.network_config
+    if args.config is not None:
+        params["strategy_config_path"] = args.config
+    executor = ParallelExecutor(
+        args.strategy, args.workers, args.iterations, params, args.controller_port
+    )
+    results = executor.run()
+    print(json.dumps(results, indent=4))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
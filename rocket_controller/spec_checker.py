@@ -3,7 +3,7 @@
 import csv
 import json
 from collections import defaultdict
-from typing import Any, List
+from typing import Any, List, Tuple
 
 from loguru import logger
 
@@ -38,12 +38,16 @@ class SpecChecker:
         self.spec_check_logger: SpecCheckLogger = SpecCheckLogger(log_dir)
         self.log_dir: str = log_dir
 
-    def spec_check(self, iteration: int):
+    def spec_check(self, iteration: int) -> Tuple[bool, bool, bool] | None:
         """
         Do a specification check for the current iteration and log the results.
 
         Args:
             iteration: The current iteration.
+
+        Returns:
+            Whether the goal ledger was reached, the ledger hashes were the same and the ledger indexes were the same,
+            or None if the results of the iteration could not be checked.
         """
         result_file_path = (
             f"logs/{self.log_dir}/iteration-{iteration}/result-{iteration}.csv"
@@ -79,14 +83,14 @@ class SpecChecker:
             self.spec_check_logger.log_spec_check(
                 iteration, f"CSV Error: {e}", "-", "-"
             )
-            return
+            return None
 
         if not ledgers_data:
             logger.critical("No valid ledger data found.")
             self.spec_check_logger.log_spec_check(
                 iteration, "No valid ledger data found.", "-", "-"
             )
-            return
+            return None
 
         sorted_keys = sorted(ledgers_data.keys())
         logger.debug(f"Found data for ledger sequences: {sorted_keys}")
@@ -121,6 +125,7 @@ class SpecChecker:
             f"reached goal ledger: {all_ledger_goal_reached}, "
             f"same ledger hashes: {all_hashes_pass}, same ledger indexes: {all_indexes_pass}"
         )
+        return all_ledger_goal_reached, all_hashes_pass, all_indexes_pass
 
     def aggregate_spec_checks(self):
         """Aggregate the spec check results and write them to a final file."""
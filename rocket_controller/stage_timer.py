@@ -0,0 +1,372 @@
+"""This module contains high-resolution timing histograms of the stages of processing a packet."""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+from rocket_controller.encoder_decoder import PacketEncoderDecoder
+
+# The stages of send_packet which are timed, in the order they are run.
+STAGES = (
+    "validate",
+    "process_packet",
+    "auto_parse",
+    "handle_packet",
+    "store_message_action",
+    "update_status",
+    "log_decode",
+    "log_write",
+)
+# Upper bounds of the histogram buckets in nanoseconds, doubling from 1us to about 17s.
+# Longer durations are counted in an extra overflow bucket.
+BUCKET_BOUNDS_NS = tuple(1000 << i for i in range(25))
+
+
+class LatencyHistogram:
+    """Histogram of durations with exponentially growing buckets, which keeps its exact count, sum and maximum."""
+
+    __slots__ = ("counts", "total_ns", "max_ns")
+
+    def __init__(self):
+        """Initialize an empty LatencyHistogram."""
+        self.counts: List[int] = [0] * (len(BUCKET_BOUNDS_NS) + 1)
+        self.total_ns = 0
+        self.max_ns = 0
+
+    @property
+    def count(self) -> int:
+        """The amount of recorded durations."""
+        return sum(self.counts)
+
+    def add(self, duration_ns: int):
+        """
+        Record a duration.
+
+        Args:
+            duration_ns: The duration in nanoseconds.
+        """
+        # The smallest bucket i with duration_ns <= 1000 << i
+        index = (max(duration_ns - 1, 0) // 1000).bit_length()
+        self.counts[min(index, len(BUCKET_BOUNDS_NS))] += 1
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+
+    def merge(self, other: "LatencyHistogram"):
+        """
+        Add the durations of another histogram to this histogram.
+
+        Args:
+            other: The histogram to merge.
+        """
+        for i, count in enumerate(other.counts):
+            self.counts[i] += count
+        self.total_ns += other.total_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+
+    def percentile(self, q: float) -> int:
+        """
+        Estimate a percentile of the recorded durations, as the upper bound of the bucket containing it.
+
+        Args:
+            q: The percentile, between 0 and 100.
+
+        Returns:
+            int: The estimated duration in nanoseconds, 0 if nothing was recorded.
+        """
+        target = self.count * q / 100
+        cumulative = 0
+        for bound, count in zip(BUCKET_BOUNDS_NS, self.counts):
+            cumulative += count
+            if count and cumulative >= target:
+                return min(bound, self.max_ns)
+        return self.max_ns
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Summarize the recorded durations.
+
+        Returns:
+            Dict[str, float]: The count, and the mean, percentiles and maximum in microseconds.
+        """
+        count = self.count
+        return {
+            "count": count,
+            "mean_us": self.total_ns / count / 1000 if count else 0.0,
+            "p50_us": self.percentile(50) / 1000,
+            "p90_us": self.percentile(90) / 1000,
+            "p99_us": self.percentile(99) / 1000,
+            "max_us": self.max_ns / 1000,
+        }
+
+
+class StageTimer:
+    """
+    Collects a LatencyHistogram of every stage of processing a packet, per message type.
+
+    A stage is timed by taking start = timer.now() before it and calling timer.record(stage, message_type, start)
+    after it. The summary of an iteration is written to a JSON file when the next iteration starts,
+    and rewritten periodically while the iteration runs.
+    """
+
+    enabled = True
+
+    def __init__(self, strategy_name: str = "", summary_interval: float = 10.0):
+        """
+        Initialize StageTimer class.
+
+        Args:
+            strategy_name: Name of the strategy, included in the summary.
+            summary_interval: Seconds between rewrites of the summary file of the running iteration, 0 to disable.
+        """
+        self.strategy_name = strategy_name
+        self.summary_interval = summary_interval
+        self.summary_file: str | None = None
+        self.start_datetime = datetime.now()
+        self._histograms: Dict[Tuple[str, int], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+        # Serializes writing the summary with switching to the summary file of the next iteration
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._writer: threading.Thread | None = None
+
+    @staticmethod
+    def now() -> int:
+        """
+        Take the start time of a stage.
+
+        Returns:
+            int: A monotonic time in nanoseconds.
+        """
+        return time.perf_counter_ns()
+
+    def record(self, stage: str, message_type: int, start_ns: int):
+        """
+        Record the duration of a stage which started at start_ns.
+
+        Args:
+            stage: Name of the stage, one of STAGES.
+            message_type: The message type of the processed packet.
+            start_ns: The start time of the stage, as returned by now.
+        """
+        duration_ns = time.perf_counter_ns() - start_ns
+        with self._lock:
+            self._add(stage, message_type, duration_ns)
+
+    def record_batch(self, stage: str, message_types: Sequence[int], start_ns: int):
+        """
+        Record the duration of a stage which processed a batch of packets at once and started at start_ns.
+
+        The duration is divided evenly over the packets, so every packet is counted once.
+
+        Args:
+            stage: Name of the stage, one of STAGES.
+            message_types: The message type of every processed packet.
+            start_ns: The start time of the stage, as returned by now.
+        """
+        if not message_types:
+            return
+        duration_ns = (time.perf_counter_ns() - start_ns) // len(message_types)
+        with self._lock:
+            for message_type in message_types:
+                self._add(stage, message_type, duration_ns)
+
+    def _add(self, stage: str, message_type: int, duration_ns: int):
+        """Add a duration to the histogram of a stage and message type, the lock must be held."""
+        key = (stage, message_type)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = LatencyHistogram()
+        histogram.add(duration_ns)
+
+    def histograms(self) -> Dict[Tuple[str, int], LatencyHistogram]:
+        """
+        Take a snapshot of the histograms.
+
+        Returns:
+            Dict[Tuple[str, int], LatencyHistogram]: A copy of the histogram of every stage and message type.
+        """
+        with self._lock:
+            snapshot = {}
+            for key, histogram in self._histograms.items():
+                copy = LatencyHistogram()
+                copy.merge(histogram)
+                snapshot[key] = copy
+            return snapshot
+
+    def reset(self):
+        """Clear all histograms."""
+        with self._lock:
+            self._histograms = {}
+            self.start_datetime = datetime.now()
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize the histograms per stage, in total and per message type.
+
+        Returns:
+            Dict[str, Any]: A JSON serializable summary.
+        """
+        start_datetime = self.start_datetime
+        return self._summary(self.histograms(), start_datetime)
+
+    def _summary(
+        self,
+        histograms: Dict[Tuple[str, int], LatencyHistogram],
+        start_datetime: datetime,
+    ) -> Dict[str, Any]:
+        """
+        Summarize histograms per stage, in total and per message type.
+
+        Args:
+            histograms: The histogram of every stage and message type.
+            start_datetime: The time the histograms started collecting.
+
+        Returns:
+            Dict[str, Any]: A JSON serializable summary.
+        """
+        stages: Dict[str, Any] = {}
+        for (stage, message_type), histogram in sorted(histograms.items()):
+            entry = stages.setdefault(
+                stage, {"total": LatencyHistogram(), "by_message_type": {}}
+            )
+            entry["total"].merge(histogram)
+            entry["by_message_type"][message_type_name(message_type)] = (
+                histogram.summary()
+            )
+        for entry in stages.values():
+            entry["total"] = entry["total"].summary()
+
+        return {
+            "strategy": self.strategy_name,
+            "start": start_datetime.isoformat(timespec="seconds"),
+            "end": datetime.now().isoformat(timespec="seconds"),
+            "stages": {stage: stages[stage] for stage in STAGES if stage in stages},
+        }
+
+    def write_summary(self, filepath: str | None = None):
+        """
+        Write the summary to a JSON file.
+
+        Args:
+            filepath: The path of the file, defaults to the summary file of the running iteration.
+        """
+        with self._write_lock:
+            filepath = filepath or self.summary_file
+            if filepath is not None:
+                self._write(filepath, self.summary())
+
+    @staticmethod
+    def _write(filepath: str, summary: Dict[str, Any]):
+        """
+        Write a summary to a temporary file and rename it, so readers never see a partially written summary.
+
+        Args:
+            filepath: The path of the file.
+            summary: The summary to write.
+        """
+        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+        with open(f"{filepath}.tmp", "w") as f:
+            json.dump(summary, f, indent=2)
+        os.replace(f"{filepath}.tmp", filepath)
+
+    def start_iteration(self, summary_file: str):
+        """
+        Write the summary of the previous iteration, and start collecting the histograms of a new iteration.
+
+        The histograms are swapped at once, so every duration is counted in exactly one iteration, and the
+        periodic writer never writes the histograms of one iteration to the summary file of another.
+
+        Args:
+            summary_file: The path the summary of the new iteration is written to.
+        """
+        with self._write_lock:
+            with self._lock:
+                histograms, start_datetime = self._histograms, self.start_datetime
+                self._histograms = {}
+                self.start_datetime = datetime.now()
+            if self.summary_file is not None:
+                self._write(
+                    self.summary_file, self._summary(histograms, start_datetime)
+                )
+            self.summary_file = summary_file
+        if self._writer is None and self.summary_interval > 0:
+            self._writer = threading.Thread(
+                target=self._write_periodically, name="StageTimerWriter", daemon=True
+            )
+            self._writer.start()
+
+    def close(self):
+        """Stop rewriting the summary periodically and write the final summary of the running iteration."""
+        self._stop.set()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        self.write_summary()
+
+    def _write_periodically(self):
+        """Rewrite the summary of the running iteration every summary_interval seconds, until closed."""
+        while not self._stop.wait(self.summary_interval):
+            self.write_summary()
+
+
+class NullStageTimer(StageTimer):
+    """StageTimer which records nothing, used when stage timing is disabled so the hot path stays cheap."""
+
+    enabled = False
+
+    @staticmethod
+    def now() -> int:
+        """
+        Skip taking the time.
+
+        Returns:
+            int: Always 0.
+        """
+        return 0
+
+    def record(self, stage: str, message_type: int, start_ns: int):
+        """
+        Ignore the duration of a stage.
+
+        Args:
+            stage: Name of the stage.
+            message_type: The message type of the processed packet.
+            start_ns: The start time of the stage.
+        """
+
+    def record_batch(self, stage: str, message_types: Sequence[int], start_ns: int):
+        """
+        Ignore the duration of a stage which processed a batch of packets.
+
+        Args:
+            stage: Name of the stage.
+            message_types: The message type of every processed packet.
+            start_ns: The start time of the stage.
+        """
+
+    def start_iteration(self, summary_file: str):
+        """
+        Ignore the start of an iteration.
+
+        Args:
+            summary_file: The path the summary would be written to.
+        """
+
+
+def message_type_name(message_type: int) -> str:
+    """
+    Look up the name of a message type.
+
+    Args:
+        message_type: The message type number.
+
+    Returns:
+        str: The name of the message class, or the number if the type is unknown.
+    """
+    message_class = PacketEncoderDecoder.message_type_map.get(message_type)
+    return message_class.__name__ if message_class is not None else str(message_type)
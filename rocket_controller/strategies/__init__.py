@@ -4,6 +4,7 @@ import os
 import sys
 
 # Direct import for proper IDE integration (used in unit tests etc.)
+from .async_strategy import AsyncStrategy
 from .mutation_example import MutationExample
 from .random_fuzzer import RandomFuzzer
 from .strategy import Strategy
@@ -20,4 +21,4 @@ for py in [
     for cls in classes:
         setattr(sys.modules[__name__], cls.__name__, cls)
 
-__all__ = ["MutationExample", "RandomFuzzer", "Strategy"]
+__all__ = ["AsyncStrategy", "MutationExample", "RandomFuzzer", "Strategy"]
@@ -0,0 +1,100 @@
+"""This module is responsible for defining the asynchronous Strategy interface, used by the async server mode."""
+
+import asyncio
+from abc import abstractmethod
+from typing import List, Sequence, Tuple, Union
+
+from protos import packet_pb2
+from rocket_controller.encoder_decoder import DecodedPacket
+from rocket_controller.helper import MAX_U32
+from rocket_controller.strategies.strategy import Strategy
+
+
+class AsyncStrategy(Strategy):
+    """
+    Class that defines the asynchronous Strategy interface.
+
+    Packets are processed on the event loop of the async server, so handle_packet can await (e.g. to hold a packet)
+    without occupying a thread. Implementations must not block the event loop.
+    """
+
+    async def process_packet(  # type: ignore[override]
+        self,
+        packet: Union[packet_pb2.Packet, DecodedPacket],
+    ) -> Tuple[bytes, int, int]:
+        """
+        Process an incoming packet, applies automatic processes if applicable.
+
+        Args:
+            packet: The packet to process, a Packet gets wrapped in a DecodedPacket.
+
+        Returns:
+            Tuple[bytes, int, int]: The processed packet as bytes, the action and the send amount.
+        """
+        packet = DecodedPacket.wrap(packet)
+        timer = self.stage_timer
+        peer_from_id = self.network.port_to_id(packet.from_port)
+        peer_to_id = self.network.port_to_id(packet.to_port)
+
+        start = timer.now()
+        result = self.match_auto_parse(peer_from_id, peer_to_id, packet.data)
+        timer.record("auto_parse", packet.message_type, start)
+        if result[0]:
+            # If result[0] is True, then result[1] will contain usable data
+            (final_data, action) = result[1]
+            send_amount = 1
+
+        # Handle the packet regularly
+        else:
+            # If no communication is allowed by partitions, then we drop immediately
+            if self.auto_partition and not self.network.check_communication(
+                peer_from_id, peer_to_id
+            ):
+                (final_data, action, send_amount) = (packet.data, MAX_U32, 1)
+            else:
+                start = timer.now()
+                (final_data, action, send_amount) = await self.handle_packet(packet)
+                timer.record("handle_packet", packet.message_type, start)
+
+            start = timer.now()
+            self.store_message_action(
+                peer_from_id, peer_to_id, packet.data, final_data, action
+            )
+            timer.record("store_message_action", packet.message_type, start)
+
+        start = timer.now()
+        self.update_status(packet)
+        timer.record("update_status", packet.message_type, start)
+        return final_data, action, send_amount
+
+    async def process_packets(  # type: ignore[override]
+        self,
+        packets: Sequence[Union[packet_pb2.Packet, DecodedPacket]],
+    ) -> List[Tuple[bytes, int, int]]:
+        """
+        Process a batch of incoming packets concurrently.
+
+        Args:
+            packets: The packets to process.
+
+        Returns:
+            List[Tuple[bytes, int, int]]: For every packet, in the same order, the processed packet as bytes, the action and the send amount.
+        """
+        return list(
+            await asyncio.gather(*(self.process_packet(packet) for packet in packets))
+        )
+
+    @abstractmethod
+    async def handle_packet(
+        self, packet: DecodedPacket
+    ) -> Tuple[bytes, int, int]:  # pragma: no cover
+        """
+        This method is responsible for returning a possibly mutated packet and an action.
+
+        Args:
+            packet: The original packet, its decoded message is shared and must not be mutated.
+
+        Returns:
+            Tuple[bytes, int, int]: The new packet, action and send amount.
+        """
+        pass
@@ -1,11 +1,9 @@
 """This module contains the class that implements a strategy which can handle delay-based evolutionary encodings."""
 
 import random
-import struct
 from typing import Any, Dict, Tuple
 
-from protos import packet_pb2
-from rocket_controller.encoder_decoder import DecodingNotSupportedError, PacketEncoderDecoder
+from rocket_controller.encoder_decoder import DecodedPacket, DecodingNotSupportedError, MessageTypeFlag, PacketEncoderDecoder
 from rocket_controller.helper import MAX_U32
 from rocket_controller.iteration_type import TimeBasedIteration, LedgerBasedIteration
 from rocket_controller.strategies.strategy import Strategy
@@ -25,6 +23,7 @@ class EvoDelayStrategy(Strategy):
         iteration_type: TimeBasedIteration | None = LedgerBasedIteration(10, 10, 60),
         network_overrides: Dict[str, Any] | None = None,
         strategy_overrides: Dict[str, Any] | None = None,
+        log_dir: str | None = None,
     ):
         """
         Initializes the EvoDelayStrategy.
@@ -37,6 +36,7 @@ class EvoDelayStrategy(Strategy):
             iteration_type: The type of iteration to keep track of.
             network_overrides: A dictionary containing parameter names and values which override the network config.
             strategy_overrides: A dictionary containing parameter names and values which override the strategy config.
+            log_dir: The directory under ./logs the logs of all iterations are written to, defaults to the start time.
         """
         super().__init__(
             network_config_path=network_config_path,
@@ -46,6 +46,7 @@ class EvoDelayStrategy(Strategy):
             iteration_type=iteration_type,
             network_overrides=network_overrides,
             strategy_overrides=strategy_overrides,
+            log_dir=log_dir,
         )
 
         # Relies on correct processing -> encoding should be of correct length
@@ -61,7 +62,7 @@ class EvoDelayStrategy(Strategy):
         # Hardcoded on 7 message types we will consider, could be a parameter in the future
         assert len(self.delays) == 7 * self.network.node_amount * (self.network.node_amount-1)
 
-    def handle_packet(self, packet: packet_pb2.Packet) -> Tuple[bytes, int, int]:
+    def handle_packet(self, packet: DecodedPacket) -> Tuple[bytes, int, int]:
         """
         Implements the handle_packet method with an encoding of delays.
 
@@ -72,10 +73,9 @@ class EvoDelayStrategy(Strategy):
             Tuple[bytes, int, int]: The new packet, the delay and the send amount.
         """
 
-        # Code taken from packet decoder
-        message_type = struct.unpack("!H", packet.data[4:6])[0]
+        message_type = packet.message_type
 
-        if message_type not in set(range(30, 36)).union({41}):
+        if not packet.flag & MessageTypeFlag.CONSENSUS:
             return packet.data, 0, 1
 
         # Types used in evolutionary paper: https://doi.org/10.1109/ICSE-SEIP58684.2023.00009
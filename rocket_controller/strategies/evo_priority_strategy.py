@@ -1,19 +1,23 @@
+import asyncio
 import random
-import threading
-import time
-from queue import PriorityQueue
 from typing import Tuple
 
-from protos import packet_pb2
 from rocket_controller.helper import MAX_U32
-from rocket_controller.strategies.strategy import Strategy
+from rocket_controller.strategies.async_strategy import AsyncStrategy
 from rocket_controller.encoder_decoder import (
+    DecodedPacket,
     DecodingNotSupportedError,
-    PacketEncoderDecoder,
+    MessageTypeFlag,
 )
 from rocket_controller.iteration_type import LedgerBasedIteration, TimeBasedIteration
 
-class EvoPriorityStrategy(Strategy):
+class EvoPriorityStrategy(AsyncStrategy):
+    """
+    Strategy which holds consensus packets, and releases them in the order of their priority at an adaptive rate.
+
+    Held packets wait on the event loop of the async server, so the strategy must be served in async mode.
+    """
+
     def __init__(
         self,
         network_config_path: str | None = None,
@@ -25,6 +29,7 @@ class EvoPriorityStrategy(Strategy):
         iteration_type = LedgerBasedIteration(10, 10, 60),
         network_overrides=None,
         strategy_overrides=None,
+        log_dir=None,
     ):
         super().__init__(
             network_config_path,
@@ -36,12 +41,12 @@ class EvoPriorityStrategy(Strategy):
             iteration_type,
             network_overrides,
             strategy_overrides,
+            log_dir=log_dir,
         )
 
-        self.queue = PriorityQueue()
+        self.queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
         self.counter = 0
 
-        self.lock = threading.Lock()
         self.running = True
 
         self.min_priority = int(self.params.get("min_priority", 1))
@@ -55,21 +60,21 @@ class EvoPriorityStrategy(Strategy):
         self.max_events = int(self.params.get("max_events", 100)) # figure this out
         self.r = self.max_events / 2
         self.priorities = self.params.get("encoding")
-        self.dispatch_thread = threading.Thread(target=self.dispatch_loop, daemon=True)
+        self.dispatch_task: asyncio.Task | None = None
+        self.cancelled_task: asyncio.Task | None = None
 
 
     def setup(self):
         assert len(self.priorities) == 7 * self.network.node_amount * (self.network.node_amount - 1)
-        self.queue = PriorityQueue()
-        self.dispatch_thread = threading.Thread(target=self.dispatch_loop, daemon=True)
-        self.dispatch_thread.start()
+        # Packets held in the previous iteration are released, the dispatcher is started again once a packet is held
+        self.release_held()
 
 
 
-    def handle_packet(self, packet: packet_pb2.Packet) -> Tuple[bytes, int, int]:
-        message, message_type_no = PacketEncoderDecoder.decode_packet(packet)
+    async def handle_packet(self, packet: DecodedPacket) -> Tuple[bytes, int, int]:
+        message_type_no = packet.message_type
 
-        if message_type_no not in set(range(30, 36)).union({41}):
+        if not packet.flag & MessageTypeFlag.CONSENSUS:
             return packet.data, 0, 1
         return packet.data, 0, 1
 
@@ -84,43 +89,70 @@ class EvoPriorityStrategy(Strategy):
 
         priority = self.priorities[index]
 
-        event = threading.Event()
-        with self.lock:
-            self.counter += 1
-            self.queue.put((priority, self.counter, event))
-            # print(f"[handle_packet] Queued packet from {packet.from_port} to {packet.to_port} with priority {priority}")
-
-        # For the threading test -> numbers should be printed in a nondeterministic order
-        # curr_count = self.counter
-        # print(curr_count)
-        # time.sleep(random.randint(1, 3))  # Wait random amount of time
-        # print(curr_count)
-
-        event.wait()
+        await self.hold(priority)
         # print(f"[handle_packet] Resumed packet from {packet.from_port} to {packet.to_port}")
         return packet.data, 0, 1
 
-    def dispatch_loop(self):
+    async def hold(self, priority: int):
+        """
+        Wait until the dispatcher releases a packet with the given priority, lower priorities are released first.
+
+        Args:
+            priority: The priority of the held packet.
+        """
+        event = asyncio.Event()
+        self.counter += 1
+        self.queue.put_nowait((priority, self.counter, event))
+        if self.dispatch_task is None or self.dispatch_task.done():
+            self.dispatch_task = asyncio.create_task(self.dispatch_loop(self.cancelled_task))
+            self.cancelled_task = None
+        await event.wait()
+
+    async def dispatch_loop(self, previous: asyncio.Task | None = None):
+        """
+        Release the held packets one at a time, at a rate adjusted to the amount of held packets.
+
+        Args:
+            previous: The cancelled dispatcher, which is awaited first so only one dispatcher releases packets.
+        """
+        if previous is not None and previous.get_loop() is asyncio.get_running_loop():
+            await asyncio.wait([previous])
         while self.running:
-            with self.lock:
-                inbox_size = self.queue.qsize()
-                # Adjust rate r based on inbox size
-                if inbox_size > self.target_inbox * self.overflow_factor:
-                    self.r = min(self.r * self.sensitivity_ratio, self.max_events)
-                elif inbox_size < self.target_inbox * self.underflow_factor:
-                    self.r = max(self.r / self.sensitivity_ratio, self.max_events / 6)
-                # else: r stays the same
-
-                packets_per_sec = max(1, int(self.r))
-                interval = 1.0 / packets_per_sec
-
-                if not self.queue.empty():
-                    priority, count, event = self.queue.get()
-                    # print(f"[dispatch_loop] Dispatching event with priority {priority}, tie-breaker {count}")
-                    event.set()
-
-            time.sleep(interval)
+            inbox_size = self.queue.qsize()
+            # Adjust rate r based on inbox size
+            if inbox_size > self.target_inbox * self.overflow_factor:
+                self.r = min(self.r * self.sensitivity_ratio, self.max_events)
+            elif inbox_size < self.target_inbox * self.underflow_factor:
+                self.r = max(self.r / self.sensitivity_ratio, self.max_events / 6)
+            # else: r stays the same
+
+            packets_per_sec = max(1, int(self.r))
+            interval = 1.0 / packets_per_sec
+
+            if not self.queue.empty():
+                priority, count, event = self.queue.get_nowait()
+                # print(f"[dispatch_loop] Dispatching event with priority {priority}, tie-breaker {count}")
+                event.set()
+
+            await asyncio.sleep(interval)
+
+    def release_held(self):
+        """
+        Cancel the dispatcher and release every held packet, so no packet stays held in a queue which is not dispatched.
+
+        Must be called on the event loop of the server while it is running.
+        """
+        if self.dispatch_task is not None and not self.dispatch_task.done():
+            self.dispatch_task.cancel()
+            self.cancelled_task = self.dispatch_task
+        self.dispatch_task = None
+
+        queue, self.queue = self.queue, asyncio.PriorityQueue()
+        while not queue.empty():
+            _, _, event = queue.get_nowait()
+            event.set()
 
     def stop(self):
+        """Stop the dispatcher and release every held packet."""
         self.running = False
-        self.dispatch_thread.join()
+        self.release_held()
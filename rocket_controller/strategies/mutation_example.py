@@ -1,12 +1,13 @@
 """This module contains the class that implements an example Strategy using simple mutation."""
 
 from datetime import datetime
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Tuple, Union, cast
 
 from xrpl.utils import datetime_to_ripple_time
 
 from protos import packet_pb2, ripple_pb2
 from rocket_controller.encoder_decoder import (
+    DecodedPacket,
     DecodingNotSupportedError,
     PacketEncoderDecoder,
 )
@@ -24,6 +25,7 @@ class MutationExample(Strategy):
         iteration_type: TimeBasedIteration | None = None,
         network_overrides: Dict[str, Any] | None = None,
         strategy_overrides: Dict[str, Any] | None = None,
+        log_dir: str | None = None,
     ):
         """Initialize the MutationExample class.
 
@@ -33,6 +35,7 @@ class MutationExample(Strategy):
             iteration_type: The type of iteration to keep track of.
             network_overrides: A dictionary containing parameter names and values which override the network config.
             strategy_overrides: A dictionary containing parameter names and values which override the strategy config.
+            log_dir: The directory under ./logs the logs of all iterations are written to, defaults to the start time.
         """
         super().__init__(
             network_config_path=network_config_path,
@@ -40,31 +43,38 @@ class MutationExample(Strategy):
             iteration_type=iteration_type,
             network_overrides=network_overrides,
             strategy_overrides=strategy_overrides,
+            log_dir=log_dir,
         )
 
     def setup(self):
         """Setup method for MutationExample."""
 
-    def handle_packet(self, packet: packet_pb2.Packet) -> Tuple[bytes, int, int]:
+    def handle_packet(
+        self, packet: Union[packet_pb2.Packet, DecodedPacket]
+    ) -> Tuple[bytes, int, int]:
         """
         Handler method for receiving a packet.
 
         Args:
-            packet: Packet to handle.
+            packet: Packet to handle, a Packet gets wrapped in a DecodedPacket.
 
         Returns:
             Tuple[bytes, int, int]: A tuple of the possible mutated message as bytes, an action as int and the send amount.
         """
-        # Decode the packet to figure out the type and length
+        packet = DecodedPacket.wrap(packet)
+        # Decode the packet to figure out the type
         try:
-            message, message_type_no = PacketEncoderDecoder.decode_packet(packet)
+            decoded_message = packet.message
         except DecodingNotSupportedError:
             return packet.data, 0, 1
 
         # Check whether message is of type TMProposeSet
-        if not isinstance(message, ripple_pb2.TMProposeSet):
+        if not isinstance(decoded_message, ripple_pb2.TMProposeSet):
             return packet.data, 0, 1
 
+        # The decoded message is shared with the rest of the pipeline, so mutate a copy
+        message = cast(ripple_pb2.TMProposeSet, packet.copy_message())
+
         # Mutate the closeTime of each message
         message.closeTime = datetime_to_ripple_time(datetime.now())
 
@@ -75,7 +85,7 @@ class MutationExample(Strategy):
         )
 
         return (
-            PacketEncoderDecoder.encode_message(signed_message, message_type_no),
+            PacketEncoderDecoder.encode_message(signed_message, packet.message_type),
             0,
             1,
         )
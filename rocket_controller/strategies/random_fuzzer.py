@@ -3,7 +3,7 @@
 import random
 from typing import Any, Dict, Tuple
 
-from protos import packet_pb2
+from rocket_controller.encoder_decoder import DecodedPacket
 from rocket_controller.helper import MAX_U32
 from rocket_controller.iteration_type import TimeBasedIteration, LedgerBasedIteration
 from rocket_controller.strategies.strategy import Strategy
@@ -21,6 +21,7 @@ class RandomFuzzer(Strategy):
         iteration_type: TimeBasedIteration | None = LedgerBasedIteration(10, 10, 60),
         network_overrides: Dict[str, Any] | None = None,
         strategy_overrides: Dict[str, Any] | None = None,
+        log_dir: str | None = None,
     ):
         """
         Initializes the random fuzzer.
@@ -33,6 +34,7 @@ class RandomFuzzer(Strategy):
             iteration_type: The type of iteration to keep track of.
             network_overrides: A dictionary containing parameter names and values which override the network config.
             strategy_overrides: A dictionary containing parameter names and values which override the strategy config.
+            log_dir: The directory under ./logs the logs of all iterations are written to, defaults to the start time.
 
         Raises:
             ValueError: If retrieved probabilities or delays are invalid.
@@ -45,6 +47,7 @@ class RandomFuzzer(Strategy):
             iteration_type=iteration_type,
             network_overrides=network_overrides,
             strategy_overrides=strategy_overrides,
+            log_dir=log_dir,
         )
 
         if self.params["seed"] is not None:
@@ -79,7 +82,7 @@ class RandomFuzzer(Strategy):
     def setup(self):
         """Setup method for RandomFuzzer."""
 
-    def handle_packet(self, packet: packet_pb2.Packet) -> Tuple[bytes, int, int]:
+    def handle_packet(self, packet: DecodedPacket) -> Tuple[bytes, int, int]:
         """
         Implements the handle_packet method with a random action.
 
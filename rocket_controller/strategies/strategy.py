@@ -2,15 +2,13 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Tuple
+from typing import Any, Awaitable, Dict, List, Sequence, Tuple, Union
 
 from loguru import logger
 
 from protos import packet_pb2, ripple_pb2
-from rocket_controller.encoder_decoder import (
-    DecodingNotSupportedError,
-    PacketEncoderDecoder,
-)
+from rocket_controller.action_log_filter import ActionLogFilter
+from rocket_controller.encoder_decoder import DecodedPacket, MessageTypeFlag
 from rocket_controller.helper import (
     MAX_U32,
     format_datetime,
@@ -18,6 +16,7 @@ from rocket_controller.helper import (
 )
 from rocket_controller.iteration_type import LedgerBasedIteration, TimeBasedIteration
 from rocket_controller.network_manager import NetworkManager
+from rocket_controller.stage_timer import NullStageTimer, StageTimer
 from rocket_controller.validator_node_info import ValidatorNode
 
 
@@ -35,6 +34,11 @@ class Strategy(ABC):
         iteration_type: TimeBasedIteration | None = None,
         network_overrides: Dict[str, Any] | None = None,
         strategy_overrides: Dict[str, Any] | None = None,
+        action_log_format: str = "csv",
+        action_log_text_types: MessageTypeFlag | None = None,
+        action_log_filter: ActionLogFilter | None = None,
+        stage_timer: StageTimer | None = None,
+        log_dir: str | None = None,
     ):
         """
         Initialize the Strategy interface with necessary fields.
@@ -49,6 +53,14 @@ class Strategy(ABC):
             iteration_type (TimeBasedIteration, optional): Type of iteration logic to use.
             network_overrides (dict, optional): A dictionary containing parameter names and values which override the network config.
             strategy_overrides (dict, optional): A dictionary containing parameter names and values which override the strategy config.
+            action_log_format (str, optional): Format of the action log, "csv" for decoded messages or "binary" for raw packets. Defaults to "csv".
+            action_log_text_types (MessageTypeFlag, optional): The message types logged as text in the csv action log, other types are logged as raw hex. Defaults to all types.
+            action_log_filter (ActionLogFilter, optional): Filter which samples the actions kept in the action log per message type. Defaults to logging every action.
+            stage_timer (StageTimer, optional): Timer which collects latency histograms of the stages of processing a packet. Defaults to no timing.
+            log_dir (str, optional): The directory under ./logs the logs of all iterations are written to. Defaults to the start time of the strategy.
+
+        Raises:
+            ValueError: If the action log format is not supported.
         """
         if strategy_config_path is None:
             strategy_config_path = f"./config/default_{self.__class__.__name__}.yaml"
@@ -63,6 +75,16 @@ class Strategy(ABC):
         self.auto_parse_identical = auto_parse_identical
         self.auto_parse_subsets = auto_parse_subsets
         self.keep_action_log = keep_action_log
+        if action_log_format not in ("csv", "binary"):
+            raise ValueError(
+                f"Action log format must be csv or binary, got {action_log_format}."
+            )
+        self.action_log_format = action_log_format
+        self.action_log_text_types = action_log_text_types
+        self.action_log_filter = action_log_filter
+        self.stage_timer: StageTimer = (
+            NullStageTimer() if stage_timer is None else stage_timer
+        )
         self.network.network_config, self.params = self.init_configs(
             network_config_path, strategy_config_path
         )
@@ -90,7 +112,10 @@ class Strategy(ABC):
             if iteration_type is None
             else iteration_type
         )
-        self.iteration_type.set_log_dir(format_datetime(self.start_datetime))
+        self.log_dir: str = (
+            format_datetime(self.start_datetime) if log_dir is None else log_dir
+        )
+        self.iteration_type.set_log_dir(self.log_dir)
 
     @staticmethod
     def init_configs(
@@ -122,59 +147,50 @@ class Strategy(ABC):
         self.iteration_type.set_validator_nodes(validator_node_list)
         self.setup()
 
-    def update_status(self, packet: packet_pb2.Packet):
+    def update_status(self, packet: Union[packet_pb2.Packet, DecodedPacket]):
         """
         Update the iteration's state variables, when a new TMStatusChange is received.
 
         Args:
             packet: The packet to check for a possible status update.
         """
-        try:
-            message, _ = PacketEncoderDecoder.decode_packet(packet)
-            if isinstance(message, ripple_pb2.TMStatusChange):
-                self.iteration_type.on_status_change(
-                    message,
-                    self.network.port_to_id(packet.from_port),
-                    self.network.port_to_id(packet.to_port),
-                )
-        except DecodingNotSupportedError:
-            pass
+        packet = DecodedPacket.wrap(packet)
+        # Only decode the message when the header shows it is a status change
+        if not packet.flag & MessageTypeFlag.STATUS_CHANGE:
+            return
+        message = packet.message
+        if isinstance(message, ripple_pb2.TMStatusChange):
+            self.iteration_type.on_status_change(
+                message,
+                self.network.port_to_id(packet.from_port),
+                self.network.port_to_id(packet.to_port),
+            )
 
     def process_packet(
         self,
-        packet: packet_pb2.Packet,
+        packet: Union[packet_pb2.Packet, DecodedPacket],
     ) -> Tuple[bytes, int, int]:
         """
         Process an incoming packet, applies automatic processes if applicable.
 
         Args:
-            packet: The packet to process.
+            packet: The packet to process, a Packet gets wrapped in a DecodedPacket.
 
         Returns:
             Tuple[bytes, int, int]: The processed packet as bytes, the action and the send amount.
+
+        Raises:
+            TypeError: If handle_packet returns an awaitable, which only an AsyncStrategy can await.
         """
+        packet = DecodedPacket.wrap(packet)
+        timer = self.stage_timer
         peer_from_id = self.network.port_to_id(packet.from_port)
         peer_to_id = self.network.port_to_id(packet.to_port)
 
-        # Check for identical previous messages or for identical messages within broadcasts.
-        # This uses booleans to check whether the functionality has to be applied automatically.
-        # First check whether we want to automatically parse re-sent messages,
-        # then we check whether we want to perform identical actions for defined subsets of processes/peers.
-        if (
-            self.auto_parse_identical
-            and (
-                result := self.network.check_previous_message(
-                    peer_from_id, peer_to_id, packet.data
-                )
-            )[0]
-        ) or (
-            self.auto_parse_subsets
-            and (
-                result := self.network.check_subsets(
-                    peer_from_id, peer_to_id, packet.data
-                )
-            )[0]
-        ):
+        start = timer.now()
+        result = self.match_auto_parse(peer_from_id, peer_to_id, packet.data)
+        timer.record("auto_parse", packet.message_type, start)
+        if result[0]:
             # If result[0] is True, then result[1] will contain usable data
             (final_data, action) = result[1]
             send_amount = 1
@@ -187,17 +203,102 @@ class Strategy(ABC):
             ):
                 (final_data, action, send_amount) = (packet.data, MAX_U32, 1)
             else:
-                (final_data, action, send_amount) = self.handle_packet(packet)
+                start = timer.now()
+                handled = self.handle_packet(packet)
+                if not isinstance(handled, tuple):
+                    raise TypeError(
+                        f"{self.__class__.__name__}.handle_packet returned an awaitable, extend AsyncStrategy instead."
+                    )
+                (final_data, action, send_amount) = handled
+                timer.record("handle_packet", packet.message_type, start)
 
-            # This is needed to keep track of previously sent messages
-            if self.auto_parse_identical or self.auto_parse_subsets:
-                self.network.set_message_action(
-                    peer_from_id, peer_to_id, packet.data, final_data, action
-                )
+            start = timer.now()
+            self.store_message_action(
+                peer_from_id, peer_to_id, packet.data, final_data, action
+            )
+            timer.record("store_message_action", packet.message_type, start)
 
+        start = timer.now()
         self.update_status(packet)
+        timer.record("update_status", packet.message_type, start)
         return final_data, action, send_amount
 
+    def match_auto_parse(
+        self, peer_from_id: int, peer_to_id: int, data: bytes
+    ) -> Tuple[bool, Tuple[bytes, int]]:
+        """
+        Check whether the action for a message can be derived from an identical previously handled message.
+
+        Args:
+            peer_from_id: Sender peer ID.
+            peer_to_id: Receiving peer ID.
+            data: The message to check.
+
+        Returns:
+            Tuple[bool, Tuple[bytes, int]]: Boolean indicating success along with final message and action.
+        """
+        # Check for identical previous messages or for identical messages within broadcasts.
+        # This uses booleans to check whether the functionality has to be applied automatically.
+        # First check whether we want to automatically parse re-sent messages,
+        # then we check whether we want to perform identical actions for defined subsets of processes/peers.
+        if (
+            self.auto_parse_identical
+            and (
+                result := self.network.check_previous_message(
+                    peer_from_id, peer_to_id, data
+                )
+            )[0]
+        ) or (
+            self.auto_parse_subsets
+            and (result := self.network.check_subsets(peer_from_id, peer_to_id, data))[
+                0
+            ]
+        ):
+            return result
+        return False, (data, 0)
+
+    def store_message_action(
+        self,
+        peer_from_id: int,
+        peer_to_id: int,
+        initial_data: bytes,
+        final_data: bytes,
+        action: int,
+    ):
+        """
+        Store the action taken on a message, when automatic parsing of identical messages is enabled.
+
+        Args:
+            peer_from_id: Sender peer ID.
+            peer_to_id: Receiving peer ID.
+            initial_data: The pre-processed message.
+            final_data: The (possibly mutated) processed message.
+            action: The taken action.
+        """
+        # This is needed to keep track of previously sent messages
+        if self.auto_parse_identical or self.auto_parse_subsets:
+            self.network.set_message_action(
+                peer_from_id, peer_to_id, initial_data, final_data, action
+            )
+
+    def process_packets(
+        self,
+        packets: Sequence[Union[packet_pb2.Packet, DecodedPacket]],
+    ) -> List[Tuple[bytes, int, int]]:
+        """
+        Process a batch of incoming packets, e.g. all copies of a broadcast message.
+
+        Strategies can override this method to handle a whole batch at once,
+        by default every packet is processed separately using process_packet.
+
+        Args:
+            packets: The packets to process.
+
+        Returns:
+            List[Tuple[bytes, int, int]]: For every packet, in the same order, the processed packet as bytes, the action and the send amount.
+        """
+        return [self.process_packet(packet) for packet in packets]
+
     @abstractmethod
     def setup(self):  # pragma: no cover
         """
@@ -209,15 +310,17 @@ class Strategy(ABC):
 
     @abstractmethod
     def handle_packet(
-        self, packet: packet_pb2.Packet
-    ) -> Tuple[bytes, int, int]:  # pragma: no cover
+        self, packet: DecodedPacket
+    ) -> Union[
+        Tuple[bytes, int, int], Awaitable[Tuple[bytes, int, int]]
+    ]:  # pragma: no cover
         """
         This method is responsible for returning a possibly mutated packet and an action.
 
         Args:
-            packet: The original packet.
+            packet: The original packet, its decoded message is shared and must not be mutated.
 
         Returns:
-            Tuple[bytes, int]: The new packet, action and send amount..
+            Tuple[bytes, int, int]: The new packet, action and send amount, awaitable for an AsyncStrategy.
         """
         pass
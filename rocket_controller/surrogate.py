@@ -0,0 +1,146 @@
+"""This module contains cheap models of the fitness of encodings, used to pre-screen candidates before running them."""
+
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+
+class Surrogate(ABC):
+    """
+    Model which predicts the fitness of encodings from the fitness of evaluated encodings.
+
+    Besides a prediction, a surrogate estimates its uncertainty, so pre-screening can trade off exploiting
+    promising encodings against exploring encodings unlike anything evaluated before.
+    """
+
+    @abstractmethod
+    def fit(self, encodings: np.ndarray, fitness: np.ndarray):
+        """
+        Fit the model on evaluated encodings.
+
+        Args:
+            encodings: The evaluated encodings, one on every row.
+            fitness: The fitness of every encoding.
+        """
+
+    @abstractmethod
+    def predict(self, encodings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Predict the fitness of encodings.
+
+        Args:
+            encodings: The encodings, one on every row.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The predicted fitness and the uncertainty of every encoding.
+        """
+
+
+class KNearestSurrogate(Surrogate):
+    """
+    Predicts the mean fitness of the k nearest evaluated encodings.
+
+    Distances are Euclidean, with every gene scaled to [0, 1] by the encoding bounds. The uncertainty is the
+    root mean square distance to the neighbours, divided by the largest possible distance, so it lies in [0, 1]
+    and is 0 for encodings which were evaluated before.
+    """
+
+    def __init__(self, low: int, high: int, neighbours: int = 5):
+        """
+        Initialize KNearestSurrogate class.
+
+        Args:
+            low: The minimum value of a gene.
+            high: The maximum value of a gene.
+            neighbours: The amount of nearest evaluated encodings to average.
+
+        Raises:
+            ValueError: If neighbours is smaller than 1.
+        """
+        if neighbours < 1:
+            raise ValueError(f"neighbours should be at least 1, but got {neighbours}")
+        self.low = low
+        self.scale = max(high - low, 1)
+        self.neighbours = neighbours
+        self._encodings = np.empty((0, 0))
+        self._fitness = np.empty(0)
+
+    def fit(self, encodings: np.ndarray, fitness: np.ndarray):
+        """
+        Store the evaluated encodings, encodings with a non-finite fitness are ignored.
+
+        Args:
+            encodings: The evaluated encodings, one on every row.
+            fitness: The fitness of every encoding.
+        """
+        finite = np.isfinite(fitness)
+        self._encodings = self._normalize(encodings[finite])
+        self._fitness = fitness[finite].astype(float)
+
+    def predict(self, encodings: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Predict the fitness of encodings.
+
+        Args:
+            encodings: The encodings, one on every row.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The predicted fitness and the uncertainty of every encoding,
+                without evaluated encodings the prediction is 0 and the uncertainty 1.
+        """
+        if len(self._fitness) == 0:
+            return np.zeros(len(encodings)), np.ones(len(encodings))
+
+        candidates = self._normalize(encodings)
+        # Squared distances of every candidate to every evaluated encoding, as |a|^2 + |b|^2 - 2ab
+        distances = (
+            np.sum(candidates**2, axis=1)[:, np.newaxis]
+            + np.sum(self._encodings**2, axis=1)[np.newaxis, :]
+            - 2 * candidates @ self._encodings.T
+        )
+        np.maximum(distances, 0, out=distances)
+
+        k = min(self.neighbours, len(self._fitness))
+        nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        rows = np.arange(len(candidates))[:, np.newaxis]
+        prediction = self._fitness[nearest].mean(axis=1)
+        uncertainty = np.sqrt(
+            distances[rows, nearest].mean(axis=1) / candidates.shape[1]
+        )
+        return prediction, uncertainty
+
+    def _normalize(self, encodings: np.ndarray) -> np.ndarray:
+        """
+        Scale every gene to [0, 1].
+
+        Args:
+            encodings: The encodings, one on every row.
+
+        Returns:
+            np.ndarray: The scaled encodings.
+        """
+        return (np.asarray(encodings, dtype=float) - self.low) / self.scale
+
+
+# The surrogates which can be configured, constructed with the encoding bounds and their options.
+SURROGATES: Dict[str, Callable[..., Surrogate]] = {"knn": KNearestSurrogate}
+
+
+def screen(
+    prediction: np.ndarray, uncertainty: np.ndarray, budget: int, exploration: float
+) -> np.ndarray:
+    """
+    Pick the encodings worth evaluating, those with the highest upper confidence bound prediction + exploration * uncertainty.
+
+    Args:
+        prediction: The predicted fitness of every candidate encoding.
+        uncertainty: The uncertainty of every prediction.
+        budget: The amount of encodings to pick.
+        exploration: The weight of the uncertainty, 0 only picks the most promising encodings.
+
+    Returns:
+        np.ndarray: The sorted indices of the picked encodings.
+    """
+    scores = prediction + exploration * uncertainty
+    return np.sort(np.argsort(-scores, kind="stable")[:budget])
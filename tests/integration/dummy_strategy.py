@@ -1,5 +1,8 @@
 """This module contains a dummy strategy. It is used for testing purposes."""
 
+import asyncio
+
+from rocket_controller.strategies.async_strategy import AsyncStrategy
 from rocket_controller.strategies.strategy import Strategy
 
 
@@ -27,3 +30,26 @@ class DummyStrategy(Strategy):
     def setup(self):
         """Ignore setup."""
         pass
+
+
+class DummyAsyncStrategy(AsyncStrategy):
+    """Dummy asynchronous strategy to be used for tests, configured the same as DummyStrategy."""
+
+    def __init__(self, iteration_type):
+        """Initialize the dummy asynchronous strategy."""
+        super().__init__(
+            auto_partition=False,
+            auto_parse_identical=False,
+            auto_parse_subsets=False,
+            keep_action_log=False,
+            iteration_type=iteration_type,
+        )
+
+    async def handle_packet(self, packet):
+        """Yield to the event loop, then return the packet as is."""
+        await asyncio.sleep(0)
+        return packet.data, 0, 1
+
+    def setup(self):
+        """Ignore setup."""
+        pass
@@ -5,9 +5,19 @@ import datetime
 import os
 import unittest
 
-from rocket_controller.csv_logger import ActionLogger, action_log_columns
+from protos import packet_pb2
+from rocket_controller.csv_logger import (
+    ActionLogger,
+    action_log_columns,
+    render_action_log,
+)
+from rocket_controller.encoder_decoder import (
+    DecodedPacket,
+    MessageTypeFlag,
+    PacketEncoderDecoder,
+)
 from rocket_controller.helper import MAX_U32, format_datetime
-from tests.default_test_variables import node_0
+from tests.default_test_variables import node_0, status_msg_1, status_msg_2
 
 
 class TestActionLogger(unittest.TestCase):
@@ -33,6 +43,7 @@ class TestActionLogger(unittest.TestCase):
         logger.log_action(0, 1, 0, 1, "propose", "orig data", "new data")
         logger.log_action(3, 1, 0, 1, "validata", "orig data", "new data")
         logger.log_action(MAX_U32, 1, 0, 1, "close", "orig data", "new data")
+        logger.close()
 
         with open(path_actions) as file:
             csv_reader = csv.reader(file)
@@ -74,3 +85,52 @@ class TestActionLogger(unittest.TestCase):
         os.remove(path_nodes)
         os.rmdir(directory)
         os.rmdir(base_dir)
+
+    def test_action_log_text_types(self):
+        """Test whether only the selected message types are logged as text, and the others can be rendered later."""
+        base_dir = "./logs/TEST_ACTION_LOG_TEXT_DIR"
+        path_actions = f"{base_dir}/action_log.csv"
+        path_rendered = f"{base_dir}/rendered.csv"
+        original = DecodedPacket(
+            packet_pb2.Packet(
+                data=PacketEncoderDecoder.encode_message(status_msg_1, 34)
+            )
+        )
+        mutated = DecodedPacket(
+            packet_pb2.Packet(
+                data=PacketEncoderDecoder.encode_message(status_msg_2, 34)
+            )
+        )
+        unsupported = DecodedPacket(packet_pb2.Packet(data=b"\x00\x00\x00\x00\x00\x63"))
+
+        logger = ActionLogger(
+            "TEST_ACTION_LOG_TEXT_DIR", [node_0], text_types=MessageTypeFlag.NONE
+        )
+        logger.log_packet(0, 1, 0, 1, original, mutated, custom_timestamp=5)
+        logger.log_packet(0, 1, 0, 1, unsupported, unsupported, custom_timestamp=6)
+        logger.text_types = MessageTypeFlag.STATUS_CHANGE
+        logger.log_packet(0, 1, 0, 1, original, mutated, custom_timestamp=7)
+        logger.close()
+
+        with open(path_actions) as file:
+            rows = list(csv.reader(file))[1:]
+        assert rows[0][5:] == [
+            "TMStatusChange",
+            "0x" + original.data.hex(),
+            "0x" + mutated.data.hex(),
+        ]
+        assert rows[1][5:] == ["99", "0x000000000063", "0x000000000063"]
+        assert rows[2][5:] == ["TMStatusChange", original.text, mutated.text]
+
+        render_action_log(path_actions, path_rendered)
+        with open(path_rendered) as file:
+            csv_reader = csv.reader(file)
+            assert next(csv_reader) == action_log_columns
+            assert next(csv_reader) == ["5", "0", "1", "0", "1"] + rows[2][5:]
+            assert next(csv_reader) == rows[1]
+            assert next(csv_reader) == ["7"] + rows[2][1:]
+
+        os.remove(path_actions)
+        os.remove(path_rendered)
+        os.remove(f"{base_dir}/node_info.csv")
+        os.rmdir(base_dir)
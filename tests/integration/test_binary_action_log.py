@@ -0,0 +1,90 @@
+"""Tests for BinaryActionLogger and the reader of binary action logs."""
+
+import os
+import shutil
+import unittest
+
+import pytest
+
+from protos import packet_pb2
+from rocket_controller.binary_action_log import (
+    ActionRecord,
+    BinaryActionLogger,
+    read_action_log,
+)
+from rocket_controller.encoder_decoder import DecodedPacket, PacketEncoderDecoder
+from rocket_controller.helper import MAX_U32
+from tests.default_test_variables import node_0, status_msg_1, status_msg_2
+
+base_dir = "./logs/TEST_BINARY_ACTION_LOG_DIR"
+
+
+def _packet(data: bytes) -> DecodedPacket:
+    return DecodedPacket(packet_pb2.Packet(data=data, from_port=10, to_port=11))
+
+
+class TestBinaryActionLogger(unittest.TestCase):
+    """Test BinaryActionLogger class."""
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove test directories."""
+        shutil.rmtree(base_dir, ignore_errors=True)
+        if len(os.listdir("./logs/")) == 0:
+            os.rmdir("./logs/")
+
+    def test_binary_action_log(self):
+        """Test whether logged actions are read back identically, and decoded on demand."""
+        original = _packet(PacketEncoderDecoder.encode_message(status_msg_1, 34))
+        mutated = _packet(PacketEncoderDecoder.encode_message(status_msg_2, 34))
+        unsupported = _packet(b"\x00\x00\x00\x00\x00\x63")
+
+        logger = BinaryActionLogger("TEST_BINARY_ACTION_LOG_DIR/log", [node_0])
+        logger.log_packet(0, 1, 0, 1, original, original, custom_timestamp=5)
+        logger.log_packet(MAX_U32, 2, 1, 0, original, mutated, custom_timestamp=6)
+        logger.log_packet(0, 1, 0, 1, unsupported, unsupported, custom_timestamp=7)
+        logger.close()
+        logger.close()
+
+        records = list(read_action_log(f"{base_dir}/log/action_log.bin"))
+        assert records == [
+            ActionRecord(5, 0, 1, 0, 1, 34, original.data, original.data),
+            ActionRecord(6, MAX_U32, 2, 1, 0, 34, original.data, mutated.data),
+            ActionRecord(7, 0, 1, 0, 1, 99, unsupported.data, unsupported.data),
+        ]
+
+        assert records[1].original().message == status_msg_1
+        assert records[1].possibly_mutated().message == status_msg_2
+        assert records[1].to_csv_row() == [
+            6,
+            MAX_U32,
+            2,
+            1,
+            0,
+            "TMStatusChange",
+            original.text,
+            mutated.text,
+        ]
+        assert records[2].to_csv_row()[5:] == ["99", "000000000063", "000000000063"]
+
+        # Actions of packets in flight when the logger is closed are dropped
+        logger.log_packet(0, 1, 0, 1, original, original)
+        assert list(read_action_log(f"{base_dir}/log/action_log.bin")) == records
+
+    def test_read_invalid_action_log(self):
+        """Test whether files which are not binary action logs, or are truncated, are rejected."""
+        os.makedirs(base_dir, exist_ok=True)
+        path = f"{base_dir}/invalid.bin"
+        with open(path, "wb") as f:
+            f.write(b"no log")
+        with pytest.raises(ValueError):
+            list(read_action_log(path))
+
+        logger = BinaryActionLogger("TEST_BINARY_ACTION_LOG_DIR/truncated", [node_0])
+        logger.log_packet(0, 1, 0, 1, _packet(b"testtest"), _packet(b"testtest"))
+        logger.close()
+        path = f"{base_dir}/truncated/action_log.bin"
+        with open(path, "rb+") as f:
+            f.truncate(os.path.getsize(path) - 1)
+        with pytest.raises(ValueError):
+            list(read_action_log(path))
@@ -6,7 +6,7 @@ import unittest
 
 import pytest
 
-from rocket_controller.csv_logger import CSVLogger
+from rocket_controller.csv_logger import BufferedCSVLogger, CSVLogger
 
 test_dir = "TEST_LOG_DIR"
 
@@ -70,3 +70,44 @@ class TestCSVLogger(unittest.TestCase):
 
         path = "./logs/" + test_dir + "/TEST_INVALID.csv"
         os.remove(path)
+
+    def test_buffered_rows(self):
+        """Test writing of rows on the writer thread, in batches and from functions."""
+        cols = ["col1"]
+        logger = BufferedCSVLogger("TEST_BUFFERED", cols, test_dir, batch_size=2)
+        logger.log_row(["1"])
+        logger.log_rows([["2"], ["3"]])
+        logger.log_row(lambda: ["4"])
+        logger.flush()
+
+        path = "./logs/" + test_dir + "/TEST_BUFFERED.csv"
+        with open(path) as file:
+            assert list(csv.reader(file)) == [cols, ["1"], ["2"], ["3"], ["4"]]
+
+        logger.log_row(["5"])
+        logger.close()
+        with open(path) as file:
+            assert list(csv.reader(file))[-1] == ["5"]
+
+        # Rows of packets in flight when the logger is closed are dropped
+        logger.log_row(["6"])
+        with open(path) as file:
+            assert list(csv.reader(file))[-1] == ["5"]
+        with pytest.raises(ValueError):
+            logger.log_row(["1", "2"])
+
+        os.remove(path)
+
+    def test_buffered_failing_row(self):
+        """Test whether a row which can not be built is skipped without stopping the writer."""
+        cols = ["col1"]
+        logger = BufferedCSVLogger("TEST_BUFFERED_FAILING", cols, test_dir)
+        logger.log_row(lambda: [1 / 0])
+        logger.log_row(["1"])
+        logger.close()
+
+        path = "./logs/" + test_dir + "/TEST_BUFFERED_FAILING.csv"
+        with open(path) as file:
+            assert list(csv.reader(file)) == [cols, ["1"]]
+
+        os.remove(path)
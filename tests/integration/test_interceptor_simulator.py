@@ -0,0 +1,53 @@
+"""Integration tests for the interceptor simulator."""
+
+from unittest.mock import Mock, patch
+
+from rocket_controller.interceptor_simulator import InterceptorSimulator
+from rocket_controller.packet_server import serve
+from tests.default_test_variables import configs
+from tests.integration.dummy_strategy import DummyStrategy
+
+PORT = 50061
+
+
+@patch(
+    "tests.integration.dummy_strategy.Strategy.init_configs",
+    return_value=({**configs[0], "unl_partition": []}, configs[1]),
+)
+def test_simulate_interceptor(mock_configs):
+    """Test whether the simulator announces the network and gets every packet acknowledged."""
+    strategy = DummyStrategy(iteration_type=Mock())
+    server = serve(strategy, port=PORT)
+
+    simulator = InterceptorSimulator(f"localhost:{PORT}", concurrency=4, seed=1)
+    try:
+        config = simulator.connect()
+        assert config.number_of_nodes == 3
+        assert strategy.network.port_to_id_dict == {60000: 0, 60001: 1, 60002: 2}
+
+        report = simulator.run(100)
+        assert report.packets == 100
+        assert len(report.latencies) == 100
+        assert report.packets_per_second > 0
+    finally:
+        simulator.close()
+        server.stop(grace=1)
+
+
+@patch(
+    "tests.integration.dummy_strategy.Strategy.init_configs",
+    return_value=({**configs[0], "unl_partition": []}, configs[1]),
+)
+def test_simulate_interceptor_rate(mock_configs):
+    """Test whether the simulator does not send faster than the given rate."""
+    server = serve(DummyStrategy(iteration_type=Mock()), port=PORT + 1)
+
+    simulator = InterceptorSimulator(f"localhost:{PORT + 1}", rate=200, seed=1)
+    try:
+        simulator.connect()
+        report = simulator.run(40)
+        assert report.packets == 40
+        assert report.seconds >= 39 / 200
+    finally:
+        simulator.close()
+        server.stop(grace=1)
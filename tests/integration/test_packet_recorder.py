@@ -0,0 +1,148 @@
+"""Tests for PacketRecorder, the reader of packet traces and the replay driver."""
+
+import os
+import shutil
+import unittest
+from unittest.mock import Mock, patch
+
+import pytest
+
+from protos import packet_pb2
+from rocket_controller.encoder_decoder import PacketEncoderDecoder
+from rocket_controller.helper import MAX_U32
+from rocket_controller.packet_recorder import (
+    PacketRecorder,
+    TracedNodeInfo,
+    TracedPacket,
+    read_trace,
+)
+from rocket_controller.packet_replay import replay_trace
+from rocket_controller.packet_server import PacketService
+from tests.default_test_variables import configs, status_msg_1, status_msg_2
+from tests.integration.dummy_strategy import DummyAsyncStrategy, DummyStrategy
+
+base_dir = "./logs/TEST_PACKET_RECORDER_DIR"
+
+nodes = [
+    packet_pb2.ValidatorNodeInfo(
+        peer_port=port,
+        ws_public_port=port + 100,
+        ws_admin_port=port + 200,
+        rpc_port=port + 300,
+        status="success",
+        validation_key=f"key_{port}",
+    )
+    for port in (10, 11)
+]
+
+packets = [
+    packet_pb2.Packet(
+        data=PacketEncoderDecoder.encode_message(status_msg_1, 34),
+        from_port=10,
+        to_port=11,
+    ),
+    packet_pb2.Packet(
+        data=PacketEncoderDecoder.encode_message(status_msg_2, 34),
+        from_port=11,
+        to_port=10,
+    ),
+    packet_pb2.Packet(data=b"\x00\x00\x00\x00\x00\x63", from_port=10, to_port=11),
+]
+
+
+@patch(
+    "tests.integration.dummy_strategy.Strategy.init_configs",
+    return_value=configs,
+)
+def dummy_strategy(mock_configs) -> DummyStrategy:
+    """Create a dummy strategy which returns every packet as is."""
+    return DummyStrategy(iteration_type=Mock())
+
+
+class TestPacketRecorder(unittest.TestCase):
+    """Test PacketRecorder class and the replay of its traces."""
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove test directories."""
+        shutil.rmtree(base_dir, ignore_errors=True)
+        if len(os.listdir("./logs/")) == 0:
+            os.rmdir("./logs/")
+
+    def record(self, filename: str) -> str:
+        """Record the test traffic through a PacketService, and return the path of the trace."""
+        filepath = f"{base_dir}/{filename}"
+        recorder = PacketRecorder(filepath)
+        service = PacketService(dummy_strategy(), recorder=recorder)
+        service.send_validator_node_info(nodes, None)
+        for packet in packets:
+            service.send_packet(packet, None)
+        recorder.close()
+        return filepath
+
+    def test_record(self):
+        """Test whether the node info, packets and acks are read back identically."""
+        records = list(read_trace(self.record("trace.bin")))
+
+        assert len(records) == len(packets) + 1
+        assert isinstance(records[0], TracedNodeInfo)
+        assert records[0].nodes == nodes
+        for record, packet in zip(records[1:], packets, strict=True):
+            assert isinstance(record, TracedPacket)
+            assert record.packet == packet
+            assert record.ack == packet_pb2.PacketAck(
+                data=packet.data, action=0, send_amount=1
+            )
+            assert record.timestamp >= records[0].timestamp
+
+    def test_replay(self):
+        """Test whether a replay reproduces the recorded acks, and reports the packets which differ."""
+        filepath = self.record("replay.bin")
+
+        result = replay_trace(dummy_strategy(), filepath)
+        assert result.packets == len(packets)
+        assert result.mismatches == []
+        assert result.seconds >= 0
+
+        dropping_strategy = dummy_strategy()
+        dropping_strategy.handle_packet = lambda packet: (packet.data, MAX_U32, 1)
+        result = replay_trace(dropping_strategy, filepath)
+        assert result.mismatches == [0, 1, 2]
+
+    @patch(
+        "tests.integration.dummy_strategy.AsyncStrategy.init_configs",
+        return_value=configs,
+    )
+    def test_replay_async_strategy(self, mock_configs):
+        """Test whether a trace can be replayed through an AsyncStrategy."""
+        filepath = self.record("replay_async.bin")
+
+        result = replay_trace(DummyAsyncStrategy(iteration_type=Mock()), filepath)
+        assert result.packets == len(packets)
+        assert result.mismatches == []
+
+    def test_replay_without_node_info(self):
+        """Test whether a trace starting with a packet can not be replayed."""
+        filepath = f"{base_dir}/no_node_info.bin"
+        recorder = PacketRecorder(filepath)
+        recorder.record_packet(packets[0], packet_pb2.PacketAck(data=packets[0].data))
+        recorder.close()
+
+        with pytest.raises(ValueError):
+            replay_trace(dummy_strategy(), filepath)
+
+    def test_invalid_trace(self):
+        """Test whether files which are not traces, or which are truncated, are rejected."""
+        filepath = self.record("truncated.bin")
+        with open(filepath, "rb") as f:
+            data = f.read()
+
+        with open(filepath, "wb") as f:
+            f.write(data[:-3])
+        with pytest.raises(ValueError):
+            list(read_trace(filepath))
+
+        with open(filepath, "wb") as f:
+            f.write(b"NOTATRACE")
+        with pytest.raises(ValueError):
+            list(read_trace(filepath))
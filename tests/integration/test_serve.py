@@ -1,13 +1,16 @@
 """Integration tests for the packet server."""
 
+import asyncio
 from unittest.mock import Mock, patch
 
 import grpc
+import pytest
 
 from protos import packet_pb2, packet_pb2_grpc
+from rocket_controller.async_packet_server import serve_async
 from rocket_controller.packet_server import serve
 from tests.default_test_variables import configs
-from tests.integration.dummy_strategy import DummyStrategy
+from tests.integration.dummy_strategy import DummyAsyncStrategy, DummyStrategy
 
 
 @patch(
@@ -39,4 +42,63 @@ def test_serve_integration():
     assert response.action == 0
     assert response.send_amount == 1
 
+    # Send a batch of packets
+    batch_ack = stub.send_packets(packet_pb2.PacketBatch(packets=[packet, packet]))
+    assert len(batch_ack.acks) == 2
+    assert all(ack.data == b"testtest" for ack in batch_ack.acks)
+
+    # Send a stream of sequence-tagged packets, acks can arrive out of order
+    requests = [
+        packet_pb2.SequencedPacket(sequence=i, packet=packet) for i in range(10)
+    ]
+    acks = list(stub.stream_packets(iter(requests)))
+    assert sorted(ack.sequence for ack in acks) == list(range(10))
+    assert all(ack.ack.data == b"testtest" for ack in acks)
+    assert all(ack.ack.action == 0 for ack in acks)
+
     server.stop(grace=1)
+
+
+@patch(
+    "tests.integration.dummy_strategy.AsyncStrategy.init_configs",
+    return_value=configs,
+)
+def test_serve_async_integration(mock_configs):
+    """Test the async server by sending packets to it."""
+    mock_iteration_type = Mock()
+    strategy = DummyAsyncStrategy(iteration_type=mock_iteration_type)
+    strategy.network.port_to_id_dict = {10: 0, 20: 1}
+
+    async def run():
+        server = await serve_async(strategy)
+        mock_iteration_type.set_server.assert_called_once()
+        mock_iteration_type.add_iteration.assert_called_once()
+        async with grpc.aio.insecure_channel("localhost:50051") as channel:
+            stub = packet_pb2_grpc.PacketServiceStub(channel)
+            packet = packet_pb2.Packet(data=b"testtest", from_port=10, to_port=20)
+            response = await stub.send_packet(packet)
+            assert (response.data, response.action, response.send_amount) == (
+                b"testtest",
+                0,
+                1,
+            )
+
+            requests = [
+                packet_pb2.SequencedPacket(sequence=i, packet=packet) for i in range(10)
+            ]
+            acks = [ack async for ack in stub.stream_packets(iter(requests))]
+            assert sorted(ack.sequence for ack in acks) == list(range(10))
+        await server.stop(grace=1)
+
+    asyncio.run(run())
+
+
+@patch(
+    "tests.integration.dummy_strategy.AsyncStrategy.init_configs",
+    return_value=configs,
+)
+def test_serve_async_strategy_sync_mode(mock_configs):
+    """Test whether serving an AsyncStrategy without async mode is refused."""
+    strategy = DummyAsyncStrategy(iteration_type=Mock())
+    with pytest.raises(ValueError):
+        serve(strategy)
@@ -0,0 +1,63 @@
+"""Tests for the ActionLogFilter class."""
+
+import pytest
+
+from rocket_controller.action_log_filter import ActionLogFilter
+from rocket_controller.encoder_decoder import MessageTypeFlag
+from rocket_controller.helper import MAX_U32
+
+
+def test_sample_rates():
+    """Test whether every message type gets the rate of the first flag containing it."""
+    log_filter = ActionLogFilter(
+        {
+            MessageTypeFlag.PING: 0.01,
+            MessageTypeFlag.LEDGER_DATA | MessageTypeFlag.GET_LEDGER: 0,
+            MessageTypeFlag.CONSENSUS: 0.5,
+        },
+        default_rate=0.9,
+    )
+    assert log_filter.sample_rate(3) == 0.01
+    assert log_filter.sample_rate(31) == 0
+    assert log_filter.sample_rate(32) == 0
+    assert log_filter.sample_rate(33) == 0.5
+    assert log_filter.sample_rate(2) == 0.9
+    assert log_filter.sample_rate(99) == 0.9
+
+
+def test_should_log():
+    """Test whether actions are sampled with the rate of their message type."""
+    log_filter = ActionLogFilter(
+        {MessageTypeFlag.PING: 0.25, MessageTypeFlag.LEDGER_DATA: 0}, seed=10
+    )
+    assert log_filter.should_log(33, 0, False)
+    assert not log_filter.should_log(32, 0, False)
+    logged = sum(log_filter.should_log(3, 0, False) for _ in range(10000))
+    assert 2000 < logged < 3000
+
+
+def test_always_log():
+    """Test whether drops, mutations and optionally delays are logged regardless of the sample rate."""
+    log_filter = ActionLogFilter(default_rate=0)
+    assert log_filter.should_log(32, MAX_U32, False)
+    assert log_filter.should_log(32, 0, True)
+    assert not log_filter.should_log(32, 100, False)
+    assert not log_filter.should_log(32, 0, False)
+
+    log_filter = ActionLogFilter(
+        default_rate=0,
+        always_log_drops=False,
+        always_log_mutations=False,
+        always_log_delays=True,
+    )
+    assert not log_filter.should_log(32, MAX_U32, False)
+    assert not log_filter.should_log(32, 0, True)
+    assert log_filter.should_log(32, 100, False)
+
+
+def test_invalid_rates():
+    """Test whether rates outside of [0, 1] are rejected."""
+    with pytest.raises(ValueError):
+        ActionLogFilter({MessageTypeFlag.PING: 2})
+    with pytest.raises(ValueError):
+        ActionLogFilter(default_rate=-0.5)
@@ -0,0 +1,128 @@
+"""Tests for the AsyncPacketService class."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+from protos import packet_pb2
+from rocket_controller.async_packet_server import AsyncPacketService
+from rocket_controller.helper import MAX_U32
+from rocket_controller.stage_timer import NullStageTimer
+from rocket_controller.strategies.async_strategy import AsyncStrategy
+
+
+async def _as_async_iterator(items):
+    for item in items:
+        yield item
+
+
+def test_send_packet_sync_strategy():
+    """Test whether a regular Strategy is used in async mode."""
+    packet = packet_pb2.Packet(data=b"test", from_port=10, to_port=20)
+    mock_strategy = Mock()
+    mock_strategy.process_packet.return_value = (packet.data, 0, 1)
+    mock_strategy.keep_action_log = False
+    packet_server = AsyncPacketService(mock_strategy)
+    packet_ack = asyncio.run(packet_server.send_packet(packet, None))
+    assert (packet_ack.data, packet_ack.action, packet_ack.send_amount) == (
+        b"test",
+        0,
+        1,
+    )
+    mock_strategy.process_packet.assert_called_once()
+    assert mock_strategy.process_packet.call_args.args[0].packet is packet
+
+
+def test_send_packets_async_strategy():
+    """Test whether an AsyncStrategy is awaited for a batch of packets."""
+    packets = [packet_pb2.Packet(data=b"test", from_port=10, to_port=20)] * 3
+    mock_strategy = Mock(spec=AsyncStrategy)
+    mock_strategy.process_packets = AsyncMock(return_value=[(b"test", 3, 1)] * 3)
+    mock_strategy.keep_action_log = False
+    mock_strategy.stage_timer = NullStageTimer()
+    packet_server = AsyncPacketService(mock_strategy)
+    batch_ack = asyncio.run(
+        packet_server.send_packets(packet_pb2.PacketBatch(packets=packets), None)
+    )
+    assert [ack.action for ack in batch_ack.acks] == [3, 3, 3]
+    mock_strategy.process_packets.assert_awaited_once()
+
+
+def test_stream_packets():
+    """Test whether every streamed packet gets an ack with its sequence number."""
+    mock_strategy = Mock(spec=AsyncStrategy)
+    mock_strategy.keep_action_log = False
+    mock_strategy.stage_timer = NullStageTimer()
+
+    async def process_packet(packet):
+        # Let later packets finish first
+        await asyncio.sleep(0.001 * (10 - packet.from_port))
+        return packet.data, packet.from_port, 1
+
+    mock_strategy.process_packet = process_packet
+    packet_server = AsyncPacketService(mock_strategy)
+    requests = [
+        packet_pb2.SequencedPacket(
+            sequence=i,
+            packet=packet_pb2.Packet(data=b"test", from_port=i, to_port=20),
+        )
+        for i in range(10)
+    ]
+
+    async def run():
+        return [
+            ack
+            async for ack in packet_server.stream_packets(
+                _as_async_iterator(requests), None
+            )
+        ]
+
+    acks = asyncio.run(run())
+    assert sorted(ack.sequence for ack in acks) == list(range(10))
+    assert all(ack.ack.action == ack.sequence for ack in acks)
+
+
+def test_stream_packets_invalid_ports():
+    """Test whether a packet containing equal ports is dropped, without ending the stream."""
+    mock_strategy = Mock(spec=AsyncStrategy)
+    mock_strategy.keep_action_log = False
+    mock_strategy.stage_timer = NullStageTimer()
+    mock_strategy.process_packet = AsyncMock(
+        side_effect=lambda packet: (packet.data, 0, 1)
+    )
+    packet_server = AsyncPacketService(mock_strategy)
+    requests = [
+        packet_pb2.SequencedPacket(
+            sequence=0, packet=packet_pb2.Packet(data=b"test", from_port=1, to_port=1)
+        ),
+        packet_pb2.SequencedPacket(
+            sequence=1, packet=packet_pb2.Packet(data=b"next", from_port=1, to_port=2)
+        ),
+    ]
+
+    async def run():
+        return [
+            ack
+            async for ack in packet_server.stream_packets(
+                _as_async_iterator(requests), None
+            )
+        ]
+
+    acks = {ack.sequence: ack.ack for ack in asyncio.run(run())}
+    assert acks[0].action == MAX_U32
+    assert acks[0].data == b"test"
+    assert acks[1].action == 0
+    mock_strategy.process_packet.assert_awaited_once()
+
+
+def test_send_validator_node_info():
+    """Test whether the streamed validator node info is passed to the strategy."""
+    mock_strategy = Mock()
+    mock_strategy.keep_action_log = False
+    packet_server = AsyncPacketService(mock_strategy)
+    response = asyncio.run(
+        packet_server.send_validator_node_info(
+            _as_async_iterator([packet_pb2.ValidatorNodeInfo(peer_port=10)]), None
+        )
+    )
+    assert response.status == "Received validator node info"
+    mock_strategy.update_network.assert_called_once()
@@ -0,0 +1,129 @@
+"""Tests for the AsyncStrategy class."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+from protos import packet_pb2
+from rocket_controller.helper import MAX_U32
+from rocket_controller.strategies.async_strategy import AsyncStrategy
+from rocket_controller.strategies.evo_priority_strategy import EvoPriorityStrategy
+from tests.default_test_variables import configs, node_0, node_1, node_2
+
+
+class HoldingStrategy(AsyncStrategy):
+    """AsyncStrategy which holds every packet until it is released."""
+
+    def __init__(self):
+        """Initialize the strategy with all automatic processes enabled."""
+        super().__init__(iteration_type=Mock())
+        self.release = asyncio.Event()
+        self.held = 0
+
+    def setup(self):
+        """Ignore setup."""
+        pass
+
+    async def handle_packet(self, packet):
+        """Hold the packet until released."""
+        self.held += 1
+        await self.release.wait()
+        return packet.data + b"-released", 5, 1
+
+
+@patch(
+    "rocket_controller.strategies.async_strategy.Strategy.init_configs",
+    return_value=configs,
+)
+def test_process_packets_concurrently(mock_init_configs):
+    """Test whether held packets do not block other packets from being processed."""
+    strategy = HoldingStrategy()
+    strategy.update_network([node_0, node_1, node_2])
+    packets = [
+        packet_pb2.Packet(data=bytes([i]) * 8, from_port=10, to_port=11 + i % 2)
+        for i in range(100)
+    ]
+
+    async def run():
+        batch = asyncio.create_task(strategy.process_packets(packets))
+        while strategy.held < len(packets):
+            await asyncio.sleep(0)
+        strategy.release.set()
+        return await batch
+
+    results = asyncio.run(run())
+    assert results == [(bytes([i]) * 8 + b"-released", 5, 1) for i in range(100)]
+
+
+@patch(
+    "rocket_controller.strategies.async_strategy.Strategy.init_configs",
+    return_value=configs,
+)
+def test_process_packet_automatic_processes(mock_init_configs):
+    """Test whether partitions and identical messages are handled without calling handle_packet."""
+    strategy = HoldingStrategy()
+    strategy.update_network([node_0, node_1, node_2])
+    strategy.release.set()
+
+    packet = packet_pb2.Packet(data=b"testtest", from_port=10, to_port=11)
+    assert asyncio.run(strategy.process_packet(packet)) == (b"testtest-released", 5, 1)
+    assert asyncio.run(strategy.process_packet(packet)) == (b"testtest-released", 5, 1)
+    assert strategy.held == 1
+
+    strategy.network.partition_network([[0, 1], [2]])
+    packet = packet_pb2.Packet(data=b"partitioned", from_port=10, to_port=12)
+    assert asyncio.run(strategy.process_packet(packet)) == (b"partitioned", MAX_U32, 1)
+    assert strategy.held == 1
+
+
+@patch(
+    "rocket_controller.strategies.async_strategy.Strategy.init_configs",
+    return_value=(configs[0], {**configs[1], "encoding": [0] * 42}),
+)
+def test_evo_priority_strategy_releases_by_priority(mock_init_configs):
+    """Test whether EvoPriorityStrategy holds packets on the event loop, and releases the lowest priority first."""
+    strategy = EvoPriorityStrategy(iteration_type=Mock())
+    strategy.max_events = strategy.r = 1000
+    released = []
+
+    async def hold(priority):
+        await strategy.hold(priority)
+        released.append(priority)
+
+    async def run():
+        # Every packet is held before the dispatcher releases the first one
+        await asyncio.gather(*(hold(priority) for priority in [5, 1, 3, 2, 4]))
+
+    asyncio.run(run())
+    strategy.stop()
+    assert released == [1, 2, 3, 4, 5]
+
+
+@patch(
+    "rocket_controller.strategies.async_strategy.Strategy.init_configs",
+    return_value=(configs[0], {**configs[1], "encoding": [0] * 42}),
+)
+def test_evo_priority_strategy_setup_releases_held(mock_init_configs):
+    """Test whether a new network cancels the dispatcher and releases the held packets, and dispatching restarts."""
+    strategy = EvoPriorityStrategy(iteration_type=Mock())
+    # Release at most one packet per second, so the packets are still held when the network changes
+    strategy.max_events = strategy.r = 1
+
+    async def run():
+        held = [asyncio.create_task(strategy.hold(priority)) for priority in range(3)]
+        # The dispatcher releases the first packet right away
+        await held[0]
+        assert strategy.queue.qsize() == 2
+        dispatcher = strategy.dispatch_task
+
+        strategy.update_network([node_0, node_1, node_2])
+        await asyncio.wait_for(asyncio.gather(*held), timeout=0.5)
+        assert strategy.queue.empty()
+        await asyncio.sleep(0)
+        assert dispatcher.cancelled()
+
+        strategy.max_events = strategy.r = 1000
+        await asyncio.wait_for(strategy.hold(0), timeout=0.5)
+
+    asyncio.run(run())
+    strategy.stop()
+    assert strategy.dispatch_task is None
@@ -104,6 +104,49 @@ def test_auto_parsing_subsets_4_nodes():
     assert network.check_subsets(2, 3, b"testtest") == (True, (b"mutated2", 42))
 
 
+def test_auto_parsing_subsets_only():
+    """Test whether subsets are parsed when identical messages are not parsed automatically."""
+    network = NetworkManager(auto_parse_identical=False, auto_parse_subsets=True)
+    network.update_network([node_0, node_1, node_2])
+    network.set_subsets_dict({2: [0, 1]})
+
+    network.set_message_action(2, 0, b"testtest", b"mutated", 42)
+    assert network.check_subsets(2, 1, b"testtest") == (True, (b"mutated", 42))
+
+
+def test_auto_parsing_subsets_evicted():
+    """Test whether a message evicted from the buffer of a receiver is no longer used for subsets."""
+    network = NetworkManager()
+    network.network_config = {"message_buffer_capacity": 1}
+    network.update_network([node_0, node_1, node_2])
+    network.set_subsets_dict({2: [0, 1]})
+
+    network.set_message_action(2, 0, b"testtest", b"mutated", 42)
+    assert set(network.message_action_index[2][b"testtest"]) == {0}
+    network.set_message_action(2, 0, b"testtest2", b"mutated2", 43)
+    assert b"testtest" not in network.message_action_index[2]
+
+    assert network.check_subsets(2, 1, b"testtest") == (False, (b"testtest", 0))
+    assert network.check_subsets(2, 1, b"testtest2") == (True, (b"mutated2", 43))
+    assert set(network.message_action_index[2][b"testtest2"]) == {0, 1}
+
+
+def test_auto_parsing_subsets_recently_used():
+    """Test whether a message used for subsets is kept over messages of the receiver which were used less recently."""
+    network = NetworkManager()
+    network.network_config = {"message_buffer_capacity": 2}
+    network.update_network([node_0, node_1, node_2])
+    network.set_subsets_dict({2: [0, 1]})
+
+    network.set_message_action(2, 0, b"testtest", b"mutated", 42)
+    network.set_message_action(2, 0, b"testtest2", b"mutated2", 43)
+    assert network.check_subsets(2, 1, b"testtest") == (True, (b"mutated", 42))
+
+    network.set_message_action(2, 0, b"testtest3", b"mutated3", 44)
+    assert b"testtest2" not in network.message_action_index[2]
+    assert set(network.message_action_index[2][b"testtest"]) == {0, 1}
+
+
 def test_raises():
     """Test whether exceptions get raised."""
     network = NetworkManager(auto_parse_identical=False, auto_parse_subsets=False)
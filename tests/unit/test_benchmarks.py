@@ -0,0 +1,64 @@
+"""Tests for the payloads, runner and comparison of the benchmark suite."""
+
+from benchmarks.compare import Comparison, compare_results, format_comparison
+from benchmarks.payloads import realistic_messages, realistic_packets
+from benchmarks.suite import Benchmark, measure
+from rocket_controller.encoder_decoder import PacketEncoderDecoder
+
+
+def test_realistic_messages():
+    """Test whether there is a complete message for every supported message type, which survives a round trip."""
+    messages = realistic_messages()
+    assert messages.keys() == PacketEncoderDecoder.message_type_map.keys()
+    for message_type, packet in realistic_packets().items():
+        (message, decoded_type) = PacketEncoderDecoder.decode_packet(packet)
+        assert decoded_type == message_type
+        assert message == messages[message_type]
+        assert message.IsInitialized()
+
+
+def test_measure():
+    """Test whether the amount of operations is calibrated, and finish is called after every repeat."""
+    calls = []
+    finished = []
+    result = measure(
+        Benchmark("test", lambda: calls.append(1), finish=lambda: finished.append(1)),
+        repeat=3,
+        min_time=0.001,
+    )
+    assert result.number > 1
+    assert result.repeat == 3
+    assert len(finished) >= 3
+    assert 0 < result.min_ns <= result.median_ns
+    assert result.operations_per_second > 0
+
+    result = measure(Benchmark("test", lambda: None, number=10), repeat=2)
+    assert result.number == 10
+
+
+def test_compare_results():
+    """Test whether regressions beyond the threshold are detected for the benchmarks in both runs."""
+    baseline = {
+        "results": {
+            "a": {"median_ns": 100.0},
+            "b": {"median_ns": 100.0},
+            "removed": {"median_ns": 100.0},
+        }
+    }
+    current = {
+        "results": {
+            "a": {"median_ns": 105.0},
+            "b": {"median_ns": 150.0},
+            "added": {"median_ns": 100.0},
+        }
+    }
+    comparisons = compare_results(baseline, current)
+    assert [c.name for c in comparisons] == ["a", "b"]
+    assert not comparisons[0].is_regression(0.1)
+    assert comparisons[1].is_regression(0.1)
+    assert comparisons[1].ratio == 1.5
+
+    table = format_comparison(comparisons, 0.1)
+    assert "REGRESSION" in table.splitlines()[2]
+    assert "REGRESSION" not in table.splitlines()[1]
+    assert Comparison("zero", 0, 10).ratio == 1
@@ -0,0 +1,23 @@
+"""Tests for the argument parsers in cli_helper.py."""
+
+import argparse
+
+import pytest
+
+from rocket_controller.cli_helper import check_valid_sample_rates
+from rocket_controller.encoder_decoder import MessageTypeFlag
+
+
+def test_check_valid_sample_rates():
+    """Test whether sample rates are parsed per message type."""
+    assert check_valid_sample_rates("PING=0.01, ledger_data=0") == {
+        MessageTypeFlag.PING: 0.01,
+        MessageTypeFlag.LEDGER_DATA: 0.0,
+    }
+
+
+@pytest.mark.parametrize("sample_rates", ["PING", "PING=fast", "PING=1.5", "UNKNOWN=0"])
+def test_check_valid_sample_rates_invalid(sample_rates):
+    """Test whether missing or invalid rates and unknown message types are refused."""
+    with pytest.raises(argparse.ArgumentTypeError):
+        check_valid_sample_rates(sample_rates)
@@ -7,9 +7,12 @@ from google.protobuf.message import EncodeError
 from protos import packet_pb2, ripple_pb2
 from protos.ripple_pb2 import TMProposeSet
 from rocket_controller.encoder_decoder import (
+    DecodedPacket,
     DecodingNotSupportedError,
+    MessageTypeFlag,
     PacketEncoderDecoder,
 )
+from tests.default_test_variables import status_msg_1
 
 
 # TODO: make a method to create a TMProposeSet message.
@@ -191,3 +194,70 @@ def test_signature_error():
         "No signing method implemented for <class 'protos.ripple_pb2.TMTransaction'>"
         in str(excinfo.value)
     )
+
+
+def test_decoded_packet():
+    """Tests that a DecodedPacket decodes the header eagerly and the message once."""
+    data = PacketEncoderDecoder.encode_message(status_msg_1, 34)
+    packet = DecodedPacket(packet_pb2.Packet(data=data, from_port=10, to_port=11))
+    assert (packet.data, packet.from_port, packet.to_port) == (data, 10, 11)
+    assert packet.length == len(data) - 6
+    assert packet.message_type == 34
+    assert packet.supported
+    assert packet.message_name == "TMStatusChange"
+    assert packet.message == status_msg_1
+    assert packet.message is packet.message
+    assert packet.text == str(status_msg_1).replace("\n", "; ")
+    assert DecodedPacket.wrap(packet) is packet
+
+
+def test_decoded_packet_copy_message():
+    """Tests that mutating a copy of the message does not affect the shared message."""
+    data = PacketEncoderDecoder.encode_message(status_msg_1, 34)
+    packet = DecodedPacket(packet_pb2.Packet(data=data, from_port=10, to_port=11))
+    message = packet.copy_message()
+    message.ledgerSeq = 100
+    assert packet.message.ledgerSeq == status_msg_1.ledgerSeq
+
+
+def test_decoded_packet_not_supported():
+    """Tests a DecodedPacket of a message type which is not supported or a packet without header."""
+    packet = DecodedPacket(
+        packet_pb2.Packet(data=b"\x00\x00\x00\x00\x00\x00", from_port=10, to_port=11)
+    )
+    assert packet.message_type == 0
+    assert not packet.supported
+    with pytest.raises(DecodingNotSupportedError):
+        _ = packet.message_name
+    with pytest.raises(DecodingNotSupportedError):
+        _ = packet.message
+
+    packet = DecodedPacket(packet_pb2.Packet(data=b"test", from_port=10, to_port=11))
+    assert packet.message_type == -1
+    assert not packet.supported
+
+
+def test_peek_header():
+    """Tests that only the header of a packet is decoded."""
+    data = PacketEncoderDecoder.encode_message(status_msg_1, 34)
+    assert PacketEncoderDecoder.peek_header(data) == (len(data) - 6, 34)
+    assert PacketEncoderDecoder.peek_header(b"\x00\x00\x00\x00\x00\x63") == (0, 99)
+    with pytest.raises(DecodingNotSupportedError):
+        PacketEncoderDecoder.peek_header(b"test")
+
+
+def test_message_type_flags():
+    """Tests that every supported message type has its own flag."""
+    assert (
+        PacketEncoderDecoder.message_type_flags.keys()
+        == PacketEncoderDecoder.message_type_map.keys()
+    )
+    flags = list(PacketEncoderDecoder.message_type_flags.values())
+    assert len(set(flags)) == len(flags)
+    assert PacketEncoderDecoder.message_type_flag(34) == MessageTypeFlag.STATUS_CHANGE
+    assert PacketEncoderDecoder.message_type_flag(99) == MessageTypeFlag.NONE
+    assert [
+        message_type
+        for message_type, flag in PacketEncoderDecoder.message_type_flags.items()
+        if flag & MessageTypeFlag.CONSENSUS
+    ] == [30, 31, 32, 33, 34, 35, 41]
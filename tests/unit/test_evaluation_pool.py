@@ -0,0 +1,96 @@
+"""Tests for the EvaluationPool class."""
+
+import os
+import subprocess
+import sys
+import time
+from typing import List
+
+import pytest
+
+from rocket_controller.evaluation_pool import EvaluationPool
+from rocket_controller.parallel_executor import WorkerConfig, plan_workers
+
+network_config = {
+    "number_of_nodes": 2,
+    "base_port_peer": 60000,
+    "base_port_ws": 61000,
+    "base_port_ws_admin": 62000,
+    "base_port_rpc": 63000,
+}
+
+
+def evaluate_sum(encoding: List[int], worker: WorkerConfig):
+    """Evaluate an encoding by summing it, together with the port of the worker."""
+    return sum(encoding), worker.controller_port, worker.log_dir
+
+
+def evaluate_flaky(encoding: List[int], worker: WorkerConfig):
+    """Fail the first attempt of every encoding, using a marker file in the directory given as first value."""
+    marker = os.path.join(worker.log_dir.split("/evaluation-")[0], str(encoding[1]))
+    if not os.path.exists(marker):
+        open(marker, "w").close()
+        raise RuntimeError("first attempt fails")
+    return encoding[1]
+
+
+def evaluate_crash(encoding: List[int], worker: WorkerConfig):
+    """Exit the process without a result."""
+    os._exit(1)
+
+
+def evaluate_hang(encoding: List[int], worker: WorkerConfig):
+    """Start a child process like the interceptor, write its pid to the file given as log directory and hang."""
+    child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+    with open(worker.log_dir.split("/evaluation-")[0], "w") as f:
+        f.write(str(child.pid))
+    time.sleep(60)
+
+
+def test_map():
+    """Test whether every encoding is evaluated once, in order, on the ports of a worker."""
+    workers = plan_workers(2, 2, network_config, "campaign")
+    pool = EvaluationPool(evaluate_sum, workers)
+    results = pool.map([[1, 2], [3, 4], [5, 6]])
+    assert [result[0] for result in results] == [3, 7, 11]
+    assert {result[1] for result in results} <= {50051, 50052}
+    assert len({result[2] for result in results}) == 3
+
+
+def test_retries(tmp_path):
+    """Test whether a failed evaluation is retried."""
+    workers = plan_workers(1, 1, network_config, str(tmp_path))
+    workers = [workers[0]._replace(log_dir=str(tmp_path))]
+    assert EvaluationPool(evaluate_flaky, workers, retries=1).map([[0, 7]]) == [7]
+    assert EvaluationPool(evaluate_flaky, workers, retries=0).map([[0, 8]]) == [None]
+
+
+def test_crash():
+    """Test whether a process which exits without a result counts as a failed evaluation."""
+    workers = plan_workers(1, 1, network_config, "campaign")
+    assert EvaluationPool(evaluate_crash, workers, retries=0).map([[1]]) == [None]
+
+
+@pytest.mark.skipif(
+    not os.path.exists("/proc"), reason="requires process groups and /proc"
+)
+def test_timeout(tmp_path):
+    """Test whether a timed out evaluation is terminated together with the processes it started."""
+    pid_file = str(tmp_path / "child.pid")
+    workers = plan_workers(1, 1, network_config, "campaign")
+    workers = [workers[0]._replace(log_dir=pid_file)]
+    pool = EvaluationPool(evaluate_hang, workers, retries=0, timeout=5)
+    assert pool.map([[1]]) == [None]
+
+    # The orphaned child is killed, it may linger as a zombie until it is reaped
+    stat = f"/proc/{int(open(pid_file).read())}/stat"
+    assert not os.path.exists(stat) or open(stat).read().split(") ")[1][0] == "Z"
+
+
+def test_invalid():
+    """Test whether a pool without workers or with negative retries is rejected."""
+    with pytest.raises(ValueError):
+        EvaluationPool(evaluate_sum, [])
+    workers = plan_workers(1, 1, network_config, "campaign")
+    with pytest.raises(ValueError):
+        EvaluationPool(evaluate_sum, workers, retries=-1)
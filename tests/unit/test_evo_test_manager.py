@@ -0,0 +1,340 @@
+"""Tests for the EvoTestManager class."""
+
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+import yaml
+
+from evo_test_manager import EvoTestManager, run_islands
+from rocket_controller.fitness_cache import FitnessCache
+from rocket_controller.parallel_executor import plan_workers
+
+
+def write_config(tmp_path, cache=None, surrogate=None, **evolution) -> str:
+    """Write a config file of the EvoTestManager, with the given evolution parameters."""
+    config = {
+        "general": {"nodes": 3, "strategy": "EvoDelayStrategy", "seed": 1},
+        "evolution": {"population_size": 4, "generations": 2, **evolution},
+        "encoding": {"min_value": 0, "max_value": 10},
+    }
+    if cache is not None:
+        config["cache"] = cache
+    if surrogate is not None:
+        config["surrogate"] = surrogate
+    config_path = tmp_path / "evo_test_manager.yaml"
+    config_path.write_text(yaml.dump(config))
+    return str(config_path)
+
+
+def test_init(tmp_path):
+    """Test whether the evaluation parameters are read from the config."""
+    manager = EvoTestManager(write_config(tmp_path, parallelism=4, retries=2))
+    assert manager.encoding_length == 3 * 2 * 7
+    assert manager.parallelism == 4
+    assert manager.retries == 2
+    assert manager.evaluation_timeout is None
+
+    with pytest.raises(ValueError):
+        EvoTestManager(write_config(tmp_path, parallelism=0))
+
+
+@patch("evo_test_manager.prepare_interceptor_dir")
+@patch("evo_test_manager.InterceptorManager")
+def test_run_evolution_round(mock_interceptor_manager, mock_prepare, tmp_path):
+    """Test whether the populations are evaluated by a pool of workers with separate ports."""
+    manager = EvoTestManager(write_config(tmp_path, parallelism=2))
+    populations = [manager.initial_population() for _ in range(3)]
+    with patch("evo_test_manager.EvaluationPool") as mock_pool:
+        mock_pool.return_value.map.return_value = [
+            ({"iterations": [], "aborted": False}, populations[0]),
+            None,
+            ({"iterations": [], "aborted": False}, populations[2]),
+        ]
+        results = manager.run_evolution_round(populations)
+
+    workers = mock_pool.call_args.args[1]
+    assert [worker.controller_port for worker in workers] == [50051, 50052]
+    assert workers[1].network_overrides["base_port_peer"] == 60003
+    assert workers[0].log_dir == f"{manager.log_dir}/generation-1/worker-0"
+    assert results == [
+        (0.0, populations[0]),
+        (-np.inf, populations[1]),
+        (0.0, populations[2]),
+    ]
+    assert mock_prepare.call_count == 2
+    mock_interceptor_manager.cleanup_docker_containers.assert_called_once()
+
+
+@patch("evo_test_manager.serve")
+def test_run_rocket_on_worker(mock_serve, tmp_path):
+    """Test whether a run on a worker uses the ports and log directory of the worker, and returns its metrics."""
+
+    def serve(strategy, port):
+        run_metrics = strategy.iteration_type.set_run_metrics.call_args.args[0]
+        run_metrics.start_iteration(1)
+        run_metrics.add_spec_check(1, False, True, True)
+        return Mock()
+
+    mock_serve.side_effect = serve
+    manager = EvoTestManager(write_config(tmp_path, parallelism=2))
+    worker = plan_workers(2, 2, manager.network_config(), "campaign")[1]
+    with patch("evo_test_manager.str_to_strategy") as mock_str_to_strategy:
+        result, _ = manager.run_rocket(manager.initial_population(), worker)
+
+    params = mock_str_to_strategy.return_value.call_args.kwargs
+    assert params["network_overrides"]["base_port_peer"] == 60003
+    assert params["network_overrides"]["number_of_nodes"] == 3
+    assert params["log_dir"] == "campaign/worker-1"
+    strategy = mock_str_to_strategy.return_value.return_value
+    mock_serve.assert_called_once_with(strategy, port=50052)
+
+    assert result["iterations"][0]["reached_goal_ledger"] is False
+    assert not result["aborted"]
+    assert manager.fitness(result) == 10.0
+    assert manager.fitness(None) == -np.inf
+
+
+def test_run_evolution_round_cached(tmp_path):
+    """Test whether cached and duplicate populations are not evaluated again, and scored by all their samples."""
+    cache = {"path": str(tmp_path / "cache.sqlite")}
+    manager = EvoTestManager(write_config(tmp_path, cache=cache))
+    manager.fitness = lambda result: result["runs"]
+    first, second = manager.initial_population(), manager.initial_population()
+    evaluated = []
+    # Results in an older format are cached under another key, so they are not used
+    old_key = FitnessCache.key(manager.strategy, manager.nodes, first, manager.seed)
+    manager.cache.add(old_key, [], first)
+
+    def evaluate_populations(populations):
+        evaluated.append(populations)
+        return [({"runs": 1}, population) for population in populations]
+
+    with patch.object(manager, "evaluate_populations", evaluate_populations):
+        results = manager.run_evolution_round([first, first, second])
+        assert evaluated == [[first, second]]
+        assert results == [(1.0, first), (1.0, first), (1.0, second)]
+
+        manager.cache.add(manager.cache_key(second), {"runs": 3}, second)
+        manager.cache.close()
+        manager = EvoTestManager(write_config(tmp_path, cache=cache))
+        manager.fitness = lambda result: result["runs"]
+        with patch.object(manager, "evaluate_populations", evaluate_populations):
+            assert manager.run_evolution_round([second])[0] == (2.0, second)
+        assert len(evaluated) == 1
+        assert manager.__getstate__()["cache"] is None
+        manager.cache.close()
+
+
+def test_init_genetic_operators(tmp_path):
+    """Test whether the parameters of the genetic operators are validated."""
+    manager = EvoTestManager(
+        write_config(tmp_path, selection="rank", crossover="k_point", elitism=2)
+    )
+    assert manager.selection_method == "rank"
+    assert manager.crossover_method == "k_point"
+    assert manager.mutation_method == "gaussian"
+    assert manager.elitism == 2
+
+    for invalid in [
+        {"selection": "roulette"},
+        {"crossover": "one_point"},
+        {"mutation": "swap"},
+        {"mutation_rate": 1.5},
+        {"elitism": 4},
+    ]:
+        with pytest.raises(ValueError):
+            EvoTestManager(write_config(tmp_path, **invalid))
+
+
+@pytest.mark.parametrize(
+    "operators",
+    [
+        {"selection": "tournament", "crossover": "uniform", "mutation": "gaussian"},
+        {"selection": "rank", "crossover": "k_point", "mutation": "uniform"},
+    ],
+)
+def test_selection_and_reproduction(tmp_path, operators):
+    """Test whether the next generation keeps the elites and stays within the encoding constraints."""
+    manager = EvoTestManager(
+        write_config(tmp_path, elitism=1, mutation_rate=0.5, **operators)
+    )
+    populations = manager.initial_populations(manager.population_size)
+    assert populations.shape == (4, manager.encoding_length)
+
+    fitness = np.array([0.0, 1.0, 2.0, -np.inf])
+    elites, parents = manager.selection(populations, fitness)
+    assert elites.tolist() == [populations[2].tolist()]
+    assert parents.shape == (6, manager.encoding_length)
+
+    next_populations = manager.reproduction(elites, parents)
+    assert next_populations.shape == populations.shape
+    assert next_populations[0].tolist() == populations[2].tolist()
+    assert next_populations.min() >= manager.encoding_min
+    assert next_populations.max() <= manager.encoding_max
+
+
+def test_pre_screen(tmp_path):
+    """Test whether the surrogate picks the populations to run once enough populations are cached."""
+    cache = {"path": str(tmp_path / "cache.sqlite")}
+    surrogate = {
+        "model": "knn",
+        "options": {"neighbours": 1},
+        "evaluations": 2,
+        "exploration": 0.0,
+        "min_samples": 2,
+    }
+    manager = EvoTestManager(write_config(tmp_path, cache=cache, surrogate=surrogate))
+    populations = np.array(
+        [np.full(manager.encoding_length, value) for value in [0, 2, 8, 10]]
+    )
+
+    selected, prediction = manager.pre_screen(populations)
+    assert selected.tolist() == [0, 1, 2, 3]
+    assert np.all(prediction == -np.inf)
+
+    for value, fitness in [(0, 1.0), (10, 5.0)]:
+        encoding = [value] * manager.encoding_length
+        manager.cache.add(manager.cache_key(encoding), fitness, encoding)
+    with patch.object(manager, "fitness", lambda result: result):
+        selected, prediction = manager.pre_screen(populations)
+        assert selected.tolist() == [2, 3]
+        assert prediction.tolist() == [1.0, 1.0, 5.0, 5.0]
+
+        with patch.object(manager, "run_evolution_round") as mock_round:
+            mock_round.return_value = [(4.0, None), (6.0, None)]
+            fitness, measured = manager.evaluate_generation(populations)
+        assert mock_round.call_args.args[0] == populations[[2, 3]].tolist()
+        assert fitness.tolist() == [1.0, 1.0, 4.0, 6.0]
+        assert measured.tolist() == [False, False, True, True]
+
+        # Populations with a predicted fitness do not become elites
+        fitness = np.array([9.0, 1.0, 4.0, 6.0])
+        elites, parents = manager.selection(populations, fitness, measured)
+        assert elites.tolist() == [populations[3].tolist()]
+        assert len(parents) == 2 * (manager.population_size - 1)
+    manager.cache.close()
+
+    with pytest.raises(ValueError):
+        EvoTestManager(write_config(tmp_path, surrogate=surrogate))
+
+
+def test_update_best(tmp_path):
+    """Test whether the fittest distinct populations of all generations are kept."""
+    manager = EvoTestManager(write_config(tmp_path, best_populations=2))
+    populations = manager.initial_populations(3)
+    manager.update_best(populations, np.array([1.0, 3.0, 2.0]))
+    assert manager.best_populations.tolist() == populations[[1, 2]].tolist()
+
+    manager.update_best(populations[[1, 0]], np.array([3.0, 4.0]))
+    assert manager.best_populations.tolist() == populations[[0, 1]].tolist()
+    assert manager.best_fitness.tolist() == [4.0, 3.0]
+
+
+def test_resume_from_checkpoint(tmp_path, monkeypatch):
+    """Test whether a resumed run continues exactly like a run which was not interrupted."""
+    monkeypatch.chdir(tmp_path)
+    config_path = write_config(tmp_path, generations=3)
+
+    def run(manager, crash_at=None, checkpoint=None):
+        evaluated = []
+
+        def evaluate_generation(populations):
+            manager.generation += 1
+            if manager.generation == crash_at:
+                raise RuntimeError("crash")
+            evaluated.append(populations.tolist())
+            return populations.sum(axis=1).astype(float), np.ones(
+                len(populations), bool
+            )
+
+        with patch.object(manager, "evaluate_generation", evaluate_generation):
+            manager.main(checkpoint)
+        return evaluated
+
+    uninterrupted = run(EvoTestManager(config_path))
+
+    crashed = EvoTestManager(config_path)
+    with pytest.raises(RuntimeError):
+        run(crashed, crash_at=3)
+    checkpoint = crashed.checkpoint_path(2)
+
+    resumed = EvoTestManager(config_path)
+    assert run(resumed, checkpoint=checkpoint) == uninterrupted[2:]
+    assert resumed.log_dir == crashed.log_dir
+    assert resumed.generation == 3
+    assert resumed.best_fitness[0] == max(sum(p) for g in uninterrupted for p in g)
+
+    config = yaml.safe_load(Path(config_path).read_text())
+    config["general"]["nodes"] = 4
+    other_config_path = tmp_path / "other.yaml"
+    other_config_path.write_text(yaml.dump(config))
+    with pytest.raises(ValueError):
+        EvoTestManager(str(other_config_path)).load_checkpoint(checkpoint)
+
+
+def test_islands(tmp_path):
+    """Test whether islands use their own seed, ports and log directory, and exchange migrants."""
+    islands = {"count": 2, "migration_interval": 2, "migrants": 1}
+    islands["exchange_dir"] = str(tmp_path / "islands")
+    config_path = write_config(tmp_path, parallelism=2, generations=4)
+    config = yaml.safe_load(Path(config_path).read_text())
+    config["islands"] = islands
+    Path(config_path).write_text(yaml.dump(config))
+    managers = [EvoTestManager(config_path, island) for island in range(2)]
+    assert [manager.seed for manager in managers] == [1, 2]
+    assert managers[1].log_dir.endswith("-island-1")
+
+    with patch("evo_test_manager.EvaluationPool") as mock_pool, patch(
+        "evo_test_manager.prepare_interceptor_dir"
+    ), patch("evo_test_manager.InterceptorManager") as mock_interceptor_manager:
+        mock_pool.return_value.map.return_value = [None, None]
+        managers[1].evaluate_populations([[0], [1]])
+    workers = mock_pool.call_args.args[1]
+    assert [worker.controller_port for worker in workers] == [50053, 50054]
+    mock_interceptor_manager.cleanup_docker_containers.assert_called_once_with(
+        [port for worker in workers for port in worker.node_ports]
+    )
+
+    populations = [manager.initial_populations(4) for manager in managers]
+    fitness = [np.array([1.0, 2.0, 3.0, 4.0]), np.array([5.0, 6.0, 7.0, 8.0])]
+    managers[0].generation = managers[1].generation = 1
+    assert managers[0].migrate(populations[0], fitness[0])[0] is populations[0]
+
+    managers[0].generation = managers[1].generation = 2
+    managers[1].migration_timeout = 0
+    assert managers[1].migrate(populations[1], fitness[1])[1].tolist() == [
+        5.0,
+        6.0,
+        7.0,
+        8.0,
+    ]
+    measured = np.array([False, True, True, True])
+    migrated, migrated_fitness, migrated_measured = managers[0].migrate(
+        populations[0], fitness[0], measured
+    )
+    assert migrated_fitness.tolist() == [8.0, 2.0, 3.0, 4.0]
+    assert migrated_measured.tolist() == [True, True, True, True]
+    assert migrated[0].tolist() == populations[1][3].tolist()
+    assert migrated[1:].tolist() == populations[0][1:].tolist()
+
+    del config["general"]["seed"]
+    Path(config_path).write_text(yaml.dump(config))
+    with pytest.raises(ValueError):
+        EvoTestManager(config_path)
+
+
+@patch("evo_test_manager.InterceptorManager")
+@patch("evo_test_manager.multiprocessing")
+def test_run_islands_cleanup(mock_multiprocessing, mock_interceptor_manager, tmp_path):
+    """Test whether only the containers of the workers of the islands are stopped after the islands finished."""
+    config_path = write_config(tmp_path, parallelism=2)
+    mock_multiprocessing.get_context.return_value.Process.return_value.is_alive.return_value = False
+    run_islands(config_path, 2)
+
+    manager = EvoTestManager(config_path)
+    workers = plan_workers(4, 4, manager.network_config(), "islands")
+    ports = [port for worker in workers for port in worker.node_ports]
+    assert len(set(ports)) == 4 * 3 * 4
+    mock_interceptor_manager.cleanup_docker_containers.assert_called_once_with(ports)
@@ -0,0 +1,109 @@
+"""Tests for the metrics and fitness of runs."""
+
+import pytest
+
+from rocket_controller.fitness import (
+    FitnessWeights,
+    RunMetrics,
+    iteration_fitness,
+    run_fitness,
+)
+
+
+def test_run_metrics():
+    """Test whether the metrics of every iteration are updated incrementally."""
+    metrics = RunMetrics()
+    metrics.add_ledger_result(2, 4, 1.0)
+    metrics.add_transaction(True)
+    assert metrics.summary() == {"iterations": [], "aborted": False}
+
+    metrics.start_iteration(1)
+    metrics.add_ledger_result(2, 4, 1.0)
+    metrics.add_ledger_result(3, 4, 2.0)
+    metrics.add_ledger_result(2, 4, 4.5)
+    metrics.add_transaction(True)
+    metrics.add_transaction(False)
+    metrics.start_iteration(2)
+    metrics.add_spec_check(1, False, True, True)
+
+    first, second = metrics.summary()["iterations"]
+    assert first == {
+        "iteration": 1,
+        "timeout_seconds": 0.0,
+        "goal_ledger_seq": 4,
+        "ledger_results": 3,
+        "max_ledger_seq": 3,
+        "mean_time_to_validation": pytest.approx(2.5),
+        "max_time_to_validation": 4.5,
+        "reached_goal_ledger": False,
+        "same_ledger_hashes": True,
+        "same_ledger_indexes": True,
+        "transactions": 2,
+        "validated_transactions": 1,
+    }
+    assert second["ledger_results"] == 0
+    assert second["reached_goal_ledger"] is None
+
+
+def test_fitness():
+    """Test whether failed spec checks, slow validation and unvalidated transactions increase the fitness."""
+    weights = FitnessWeights(
+        failed_termination=10,
+        failed_agreement=100,
+        time_to_validation=2,
+        unvalidated_transactions=1,
+    )
+    metrics = RunMetrics(weights)
+    metrics.start_iteration(1)
+    metrics.add_ledger_result(2, 4, 1.5)
+    metrics.add_transaction(False)
+    assert metrics.fitness() == 2 * 1.5 + 1
+
+    metrics.add_spec_check(1, False, False, True)
+    iteration = metrics.summary()["iterations"][0]
+    assert iteration_fitness(iteration, weights) == 10 + 100 + 2 * 1.5 + 1
+
+    metrics.start_iteration(2)
+    assert metrics.fitness() == (10 + 100 + 2 * 1.5 + 1) / 2
+    assert run_fitness({"iterations": []}, weights) == 0.0
+
+
+def test_fitness_halted():
+    """Test whether iterations without validated ledgers fail termination and take the whole timeout."""
+    weights = FitnessWeights(time_to_validation=2)
+    metrics = RunMetrics(weights)
+    metrics.start_iteration(1, timeout_seconds=60)
+    assert metrics.fitness() == 0.0
+
+    metrics.add_spec_check(1, False, None, None)
+    assert metrics.fitness() == weights.failed_termination + 2 * 60
+
+    metrics.start_iteration(2, timeout_seconds=60)
+    metrics.add_ledger_result(2, 4, 1.0)
+    metrics.add_spec_check(2, True, True, True)
+    assert metrics.fitness() == (weights.failed_termination + 2 * 60 + 2 * 1.0) / 2
+
+
+def test_should_abort():
+    """Test whether runs are aborted once enough iterations are checked and the fitness is too low."""
+    metrics = RunMetrics(abort_after=2, abort_below=5.0)
+    metrics.start_iteration(1)
+    metrics.add_ledger_result(2, 4, 1.0)
+    metrics.add_spec_check(1, True, True, True)
+    metrics.start_iteration(2)
+    metrics.add_ledger_result(2, 4, 100.0)
+    assert not metrics.should_abort()
+
+    metrics.add_spec_check(2, True, True, True)
+    metrics.start_iteration(3)
+    assert not metrics.should_abort()
+    assert not metrics.summary()["aborted"]
+
+    hopeless = RunMetrics(abort_after=1, abort_below=5.0)
+    hopeless.start_iteration(1)
+    hopeless.add_ledger_result(2, 4, 1.0)
+    hopeless.add_spec_check(1, True, True, True)
+    assert hopeless.should_abort()
+    assert hopeless.summary()["aborted"]
+
+    assert not RunMetrics().should_abort()
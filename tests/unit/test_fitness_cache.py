@@ -0,0 +1,79 @@
+"""Tests for the FitnessCache class."""
+
+import random
+
+import pytest
+
+from rocket_controller.fitness_cache import FitnessCache
+
+
+def test_key():
+    """Test whether keys differ for every parameter of an evaluation."""
+    key = FitnessCache.key("EvoDelayStrategy", 3, [1, 2, 3], 42)
+    assert key == FitnessCache.key("EvoDelayStrategy", 3, [1, 2, 3], 42)
+    assert key != FitnessCache.key("EvoPriorityStrategy", 3, [1, 2, 3], 42)
+    assert key != FitnessCache.key("EvoDelayStrategy", 4, [1, 2, 3], 42)
+    assert key != FitnessCache.key("EvoDelayStrategy", 3, [1, 2, 4], 42)
+    assert key != FitnessCache.key("EvoDelayStrategy", 3, [1, 2, 3], None)
+    assert key != FitnessCache.key("EvoDelayStrategy", 3, [1, 2, 3], 42, 1)
+
+
+def test_persistence(tmp_path):
+    """Test whether results survive reopening the cache."""
+    path = str(tmp_path / "cache.sqlite")
+    cache = FitnessCache(path)
+    assert cache.needs_evaluation("a")
+    cache.add("a", {"fitness": 1.5})
+    cache.add("a", {"fitness": 2.5})
+    cache.close()
+
+    cache = FitnessCache(path)
+    assert cache.samples("a") == [{"fitness": 1.5}, {"fitness": 2.5}]
+    assert cache.samples("b") == []
+    assert len(cache) == 1
+    assert not cache.needs_evaluation("a")
+    cache.close()
+
+
+def test_resample_policy(tmp_path):
+    """Test whether encodings are evaluated until min_samples, and resampled until max_samples."""
+    cache = FitnessCache(
+        str(tmp_path / "cache.sqlite"),
+        min_samples=2,
+        max_samples=3,
+        resample_probability=0.5,
+        rng=random.Random(1),
+    )
+    cache.add("a", 1)
+    assert cache.needs_evaluation("a")
+    cache.add("a", 2)
+    resampled = sum(cache.needs_evaluation("a") for _ in range(1000))
+    assert 400 < resampled < 600
+    cache.add("a", 3)
+    assert not any(cache.needs_evaluation("a") for _ in range(100))
+    cache.close()
+
+
+def test_invalid_policy(tmp_path):
+    """Test whether invalid sample bounds and probabilities are rejected."""
+    path = str(tmp_path / "cache.sqlite")
+    with pytest.raises(ValueError):
+        FitnessCache(path, min_samples=0)
+    with pytest.raises(ValueError):
+        FitnessCache(path, min_samples=3, max_samples=2)
+    with pytest.raises(ValueError):
+        FitnessCache(path, resample_probability=1.5)
+
+
+def test_evaluations(tmp_path):
+    """Test whether the encodings of cached results are stored, so a model can be fitted on them."""
+    cache = FitnessCache(str(tmp_path / "cache.sqlite"), max_samples=2)
+    cache.add("a", 1.0, [1, 2])
+    cache.add("a", 2.0, [1, 2])
+    cache.add("b", 3.0, [3, 4])
+    cache.add("c", 4.0)
+    assert sorted(cache.evaluations()) == [
+        ("a", [1, 2], [1.0, 2.0]),
+        ("b", [3, 4], [3.0]),
+    ]
+    cache.close()
@@ -0,0 +1,102 @@
+"""Tests for the genetic operators of evolutionary testing."""
+
+import numpy as np
+
+from rocket_controller import genetic_operators
+
+
+def test_random_population():
+    """Test whether random populations have the right shape and stay within the bounds."""
+    rng = np.random.default_rng(1)
+    population = genetic_operators.random_population(rng, 8, 42, 1, 3)
+    assert population.shape == (8, 42)
+    assert set(np.unique(population)) == {1, 2, 3}
+
+
+def test_tournament_selection():
+    """Test whether the fittest individual of every tournament is selected."""
+    rng = np.random.default_rng(1)
+    fitness = np.array([0.0, 3.0, 1.0, 2.0])
+    selected = genetic_operators.tournament_selection(rng, fitness, 1000, 2)
+    counts = np.bincount(selected, minlength=4)
+    assert counts[1] > counts[3] > counts[2] > counts[0]
+
+    everyone = genetic_operators.tournament_selection(rng, fitness, 10, 100)
+    assert np.all(everyone == 1)
+
+
+def test_tournament_selection_failed_runs():
+    """Test whether failed runs lose every tournament against a successful run."""
+    rng = np.random.default_rng(1)
+    fitness = np.array([-np.inf, 0.0, -np.inf])
+    selected = genetic_operators.tournament_selection(rng, fitness, 10, 100)
+    assert np.all(selected == 1)
+
+
+def test_rank_selection():
+    """Test whether individuals are selected proportionally to their rank."""
+    rng = np.random.default_rng(1)
+    fitness = np.array([10.0, -np.inf, 5.0])
+    selected = genetic_operators.rank_selection(rng, fitness, 6000)
+    counts = np.bincount(selected, minlength=3)
+    np.testing.assert_allclose(counts / 6000, [3 / 6, 1 / 6, 2 / 6], atol=0.02)
+
+
+def test_elite_indices():
+    """Test whether the fittest individuals are kept, fittest first."""
+    fitness = np.array([1.0, 4.0, -np.inf, 3.0])
+    assert genetic_operators.elite_indices(fitness, 2).tolist() == [1, 3]
+    assert genetic_operators.elite_indices(fitness, 0).tolist() == []
+
+
+def test_uniform_crossover():
+    """Test whether children take every gene from one of their parents."""
+    rng = np.random.default_rng(1)
+    parents_a = np.zeros((50, 100), dtype=np.int64)
+    parents_b = np.ones((50, 100), dtype=np.int64)
+    children = genetic_operators.uniform_crossover(rng, parents_a, parents_b)
+    assert children.shape == (50, 100)
+    assert 0.4 < children.mean() < 0.6
+
+    copies = genetic_operators.uniform_crossover(rng, parents_a, parents_b, 0.0)
+    assert np.all(copies == parents_a)
+
+
+def test_k_point_crossover():
+    """Test whether children switch parents at most k times, starting with the first parent."""
+    rng = np.random.default_rng(1)
+    parents_a = np.zeros((50, 100), dtype=np.int64)
+    parents_b = np.ones((50, 100), dtype=np.int64)
+    children = genetic_operators.k_point_crossover(rng, parents_a, parents_b, 3)
+    switches = np.count_nonzero(np.diff(children, axis=1), axis=1)
+    assert np.all(children[:, 0] == 0)
+    assert np.all(switches <= 3)
+    assert np.any(switches == 3)
+    assert np.all(switches % 2 == children[:, -1])
+
+    copies = genetic_operators.k_point_crossover(rng, parents_a, parents_b, 3, 0.0)
+    assert np.all(copies == parents_a)
+
+
+def test_gaussian_mutation():
+    """Test whether mutated genes stay within the bounds."""
+    rng = np.random.default_rng(1)
+    population = np.full((20, 100), 5, dtype=np.int64)
+    mutated = genetic_operators.gaussian_mutation(rng, population, 0.5, 1.0, 0, 10)
+    assert mutated.dtype == population.dtype
+    assert mutated.min() == 0
+    assert mutated.max() == 10
+    assert 0.3 < np.mean(mutated != 5) < 0.5
+
+    unchanged = genetic_operators.gaussian_mutation(rng, population, 0.0, 1.0, 0, 10)
+    assert np.all(unchanged == population)
+
+
+def test_uniform_mutation():
+    """Test whether mutated genes are replaced by values within the bounds."""
+    rng = np.random.default_rng(1)
+    population = np.full((20, 100), 50, dtype=np.int64)
+    mutated = genetic_operators.uniform_mutation(rng, population, 0.2, 1, 3)
+    changed = mutated[mutated != 50]
+    assert set(np.unique(changed)) == {1, 2, 3}
+    assert 0.15 < changed.size / population.size < 0.25
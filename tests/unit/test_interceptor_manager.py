@@ -17,6 +17,17 @@ def test_start_new():
         mock_popen.assert_called_once()
 
 
+def test_start_new_in_working_dir():
+    """Test starting an interceptor in another directory, for the controller on another port."""
+    with patch("rocket_controller.interceptor_manager.Popen") as mock_popen:
+        mock_popen.return_value.communicate.side_effect = lambda: (None, None)
+        interceptor_manager = InterceptorManager("./rocket_interceptor/worker-1", 50052)
+        interceptor_manager.start_new()
+        kwargs = mock_popen.call_args.kwargs
+        assert kwargs["cwd"] == "./rocket_interceptor/worker-1"
+        assert kwargs["env"]["CONTROLLER_PORT"] == "50052"
+
+
 def test_restart_existing():
     """Test restarting an existing interceptor."""
     with patch("rocket_controller.interceptor_manager.Popen") as mock_popen:
@@ -104,6 +115,37 @@ def test_cleanup_docker():
     mock_container3.stop.assert_called_once()
 
 
+def test_cleanup_docker_containers_by_port():
+    """Test whether only the validator containers publishing the given ports are stopped."""
+    mock_docker_client = MagicMock()
+    own_container = MagicMock(spec=Container)
+    own_container.name = "validator_0"
+    own_container.ports = {"51235/tcp": [{"HostIp": "0.0.0.0", "HostPort": "60005"}]}
+    other_container = MagicMock(spec=Container)
+    other_container.name = "validator_0_worker"
+    other_container.ports = {"51235/tcp": [{"HostIp": "0.0.0.0", "HostPort": "60000"}]}
+    mock_docker_client.containers.list.return_value = [own_container, other_container]
+
+    with patch("docker.from_env", return_value=mock_docker_client):
+        InterceptorManager.cleanup_docker_containers([60005, 60006])
+
+    own_container.stop.assert_called_once()
+    other_container.stop.assert_not_called()
+
+
+def test_stop_own_containers():
+    """Test whether an interceptor with container ports stops its containers whenever it stops."""
+    with (
+        patch("rocket_controller.interceptor_manager.Popen") as mock_popen,
+        patch.object(InterceptorManager, "cleanup_docker_containers") as mock_cleanup,
+    ):
+        mock_popen.return_value.communicate.side_effect = lambda: (None, None)
+        interceptor_manager = InterceptorManager(container_ports=(60005, 60006))
+        interceptor_manager.start_new()
+        interceptor_manager.stop()
+    mock_cleanup.assert_called_once_with((60005, 60006))
+
+
 def test_stop_ungraceful():
     """Test whether the stop behavior functions correctly on a timeout."""
     mock_popen = Mock(spec=Popen)
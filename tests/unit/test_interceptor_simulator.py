@@ -0,0 +1,83 @@
+"""Tests for the synthetic traffic and the report of the interceptor simulator."""
+
+from itertools import islice
+
+import pytest
+
+from protos import packet_pb2
+from rocket_controller.encoder_decoder import DecodedPacket
+from rocket_controller.interceptor_simulator import (
+    InterceptorSimulator,
+    SimulationReport,
+    synthetic_node_info,
+    synthetic_traffic,
+)
+from rocket_controller.network_manager import NetworkManager
+from rocket_controller.packet_server import to_validator_node
+
+config = packet_pb2.Config(
+    base_port_peer=60000,
+    base_port_ws=61000,
+    base_port_ws_admin=62000,
+    base_port_rpc=63000,
+    number_of_nodes=3,
+)
+
+
+def test_synthetic_node_info():
+    """Test whether the generated nodes use the ports of the config, and keys the network manager can decode."""
+    nodes = synthetic_node_info(config, seed=1)
+    assert [node.peer_port for node in nodes] == [60000, 60001, 60002]
+    assert [node.rpc_port for node in nodes] == [63000, 63001, 63002]
+    assert nodes == synthetic_node_info(config, seed=1)
+
+    network = NetworkManager()
+    network.network_config = {}
+    network.update_network([to_validator_node(node) for node in nodes])
+    assert len(network.public_to_private_key_map) == 3
+
+
+def test_synthetic_traffic():
+    """Test whether every node broadcasts a proposal, validation and status change to all other nodes per round."""
+    nodes = synthetic_node_info(config, seed=1)
+    round_packets = [
+        DecodedPacket(packet)
+        for packet in islice(synthetic_traffic(nodes, seed=1), 3 * 3 * 2)
+    ]
+
+    assert [packet.message_type for packet in round_packets[:6]] == [
+        33,
+        33,
+        41,
+        41,
+        34,
+        34,
+    ]
+    assert all(packet.from_port != packet.to_port for packet in round_packets)
+    assert {packet.from_port for packet in round_packets} == {60000, 60001, 60002}
+    assert round_packets[0].data == round_packets[1].data
+    assert round_packets[0].message.nodePubKey == round_packets[1].message.nodePubKey
+    assert round_packets[4].message.ledgerSeq == 2
+
+    next_round = DecodedPacket(next(islice(synthetic_traffic(nodes, seed=1), 22, None)))
+    assert next_round.message.ledgerSeq == 3
+
+
+def test_simulation_report():
+    """Test the throughput and latency percentiles of a report."""
+    report = SimulationReport(4, 2.0, [0.004, 0.001, 0.003, 0.002])
+    assert report.packets_per_second == 2
+    assert report.latency_percentile(0) == 0.001
+    assert report.latency_percentile(100) == 0.004
+    assert "4 packets" in report.summary()
+    assert SimulationReport(0, 0, []).latency_percentile(50) == 0
+
+
+def test_invalid_simulator():
+    """Test whether invalid simulator parameters are rejected."""
+    with pytest.raises(ValueError):
+        InterceptorSimulator(rate=-1)
+    with pytest.raises(ValueError):
+        InterceptorSimulator(concurrency=0)
+    with pytest.raises(RuntimeError):
+        InterceptorSimulator().run(10)
@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, Mock, call, patch
 import grpc
 
 from protos import ripple_pb2
+from rocket_controller.fitness import RunMetrics
 from rocket_controller.interceptor_manager import InterceptorManager
 from rocket_controller.iteration_type import (
     LedgerBasedIteration,
@@ -75,6 +76,59 @@ def test_time_based_iteration_add_done():
     mock_spec_checker.aggregate_spec_checks.assert_called_once()
 
 
+def test_time_based_iteration_abort():
+    """Tests whether a run is aborted after an iteration when its metrics are hopeless."""
+    iteration = TimeBasedIteration(3, 10)
+    mock_interceptor_manager = Mock()
+    iteration._interceptor_manager = mock_interceptor_manager
+    iteration._start_timeout_timer = MagicMock()
+    iteration._start_transactions = MagicMock()
+    mock_spec_checker = Mock()
+    mock_spec_checker.spec_check.return_value = (True, True, True)
+    iteration._spec_checker = mock_spec_checker
+    iteration._log_dir = Mock()
+    run_metrics = RunMetrics(abort_after=1, abort_below=1.0)
+    iteration.set_run_metrics(run_metrics)
+    iteration._ledger_results = Mock()
+
+    with patch("rocket_controller.iteration_type.TransactionLogger"):
+        iteration.add_iteration()
+        run_metrics.add_ledger_result(2, 4, 0.5)
+        iteration.add_iteration()
+
+    mock_interceptor_manager.start_new.assert_called_once()
+    mock_interceptor_manager.cleanup_docker_containers.assert_called_once()
+    mock_spec_checker.aggregate_spec_checks.assert_called_once()
+    summary = run_metrics.summary()
+    assert summary["aborted"]
+    assert [it["iteration"] for it in summary["iterations"]] == [1]
+    assert summary["iterations"][0]["reached_goal_ledger"] is True
+
+
+def test_time_based_iteration_halted_metrics():
+    """Tests whether an iteration without ledger results is recorded as not reaching the goal ledger."""
+    iteration = TimeBasedIteration(1, 10)
+    iteration._interceptor_manager = Mock()
+    iteration._start_timeout_timer = MagicMock()
+    iteration._start_transactions = MagicMock()
+    mock_spec_checker = Mock()
+    mock_spec_checker.spec_check.return_value = None
+    iteration._spec_checker = mock_spec_checker
+    iteration._log_dir = Mock()
+    run_metrics = RunMetrics()
+    iteration.set_run_metrics(run_metrics)
+    iteration._ledger_results = Mock()
+
+    with patch("rocket_controller.iteration_type.TransactionLogger"):
+        iteration.add_iteration()
+        iteration.add_iteration()
+
+    (metrics,) = run_metrics.summary()["iterations"]
+    assert metrics["reached_goal_ledger"] is False
+    assert metrics["timeout_seconds"] == 10
+    assert run_metrics.fitness() > run_metrics.weights.failed_termination
+
+
 def test_time_based_iteration_add_done_no_server():
     """Tests whether cleanup is performed properly when iterations reach maximum with no server."""
     iteration = TimeBasedIteration(1, 10)
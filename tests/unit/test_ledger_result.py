@@ -88,6 +88,18 @@ def test_log_ledger_result(logger_mock):
     )
 
 
+@patch("rocket_controller.ledger_result.ResultLogger")
+def test_log_ledger_result_run_metrics(logger_mock):
+    """Test whether logged results are added to the metrics of the run."""
+    ledger_result = LedgerResult()
+    ledger_result.new_result_logger("test", 1)
+    ledger_result.run_metrics = Mock()
+    ledger_result._fetch_ledger = MagicMock(return_value=mock_response)
+    ledger_result.log_ledger_result(0, 2, 5, 3.00, [node_0, node_1])
+
+    ledger_result.run_metrics.add_ledger_result.assert_called_once_with(2, 5, 3.00)
+
+
 @patch("rocket_controller.ledger_result.ResultLogger")
 def test_log_ledger_result_err(logger_mock):
     """Test whether the logger is called correctly."""
@@ -0,0 +1,38 @@
+"""Tests for the entry point of rocket_controller."""
+
+import argparse
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from rocket_controller.__main__ import main
+from rocket_controller.strategies import AsyncStrategy, Strategy
+
+
+@pytest.mark.parametrize(
+    ("strategy_class", "async_mode", "served_async"),
+    [
+        (Strategy, False, False),
+        (Strategy, True, True),
+        (AsyncStrategy, False, True),
+    ],
+)
+def test_main_chooses_server(strategy_class, async_mode, served_async):
+    """Test whether an AsyncStrategy is served in async mode, also without --async."""
+    strategy = Mock(spec=strategy_class)
+    strategy.stage_timer = Mock()
+    args = argparse.Namespace(strategy="Example", async_mode=async_mode)
+    with (
+        patch("rocket_controller.__main__.process_args", return_value={}),
+        patch(
+            "rocket_controller.__main__.str_to_strategy",
+            return_value=Mock(return_value=strategy),
+        ),
+        patch("rocket_controller.__main__.main_async", new=AsyncMock()) as main_async,
+        patch("rocket_controller.__main__.serve") as serve,
+    ):
+        main(args)
+
+    assert main_async.await_count == int(served_async)
+    assert serve.call_count == int(not served_async)
+    strategy.stage_timer.close.assert_called_once()
@@ -1,5 +1,8 @@
 """Tests for MessageActionStack."""
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from rocket_controller.message_action import MessageAction
@@ -43,3 +46,74 @@ def test_check_message():
     assert stack.match_previous_messages(b"2") == (True, (b"m2", 11))
 
     assert stack.match_previous_messages(b"3") == (False, (b"3", 0))
+
+
+def test_check_message_recently_used():
+    """Test whether a matched message is kept over entries which were used less recently."""
+    stack = MessageActionBuffer(2)
+    msg1 = MessageAction(b"1", b"m1", 10)
+    stack.add(msg1)
+    msg2 = MessageAction(b"2", b"m2", 11)
+    stack.add(msg2)
+
+    assert stack.match_previous_messages(b"1") == (True, (b"m1", 10))
+    msg3 = MessageAction(b"3", b"m3", 13)
+    stack.add(msg3)
+    assert stack.messages == [msg1, msg3]
+    assert stack.match_previous_messages(b"2") == (False, (b"2", 0))
+
+
+def test_add_identical_message():
+    """Test whether adding an identical initial message replaces the previous entry."""
+    stack = MessageActionBuffer(2)
+    stack.add(MessageAction(b"1", b"m1", 10))
+    msg2 = MessageAction(b"2", b"m2", 11)
+    stack.add(msg2)
+    msg3 = MessageAction(b"1", b"m3", 12)
+    stack.add(msg3)
+
+    assert len(stack) == 2
+    assert stack.messages == [msg2, msg3]
+    assert stack.match_previous_messages(b"1") == (True, (b"m3", 12))
+
+
+def test_touch():
+    """Test whether a touched message is kept over entries which were used less recently."""
+    stack = MessageActionBuffer(2)
+    msg1 = MessageAction(b"1", b"m1", 10)
+    stack.add(msg1)
+    msg2 = MessageAction(b"2", b"m2", 11)
+    stack.add(msg2)
+
+    stack.touch(b"1")
+    stack.touch(b"3")
+    msg3 = MessageAction(b"3", b"m3", 13)
+    stack.add(msg3)
+    assert stack.messages == [msg1, msg3]
+
+
+def test_concurrent_match_and_evict():
+    """Test whether matching entries while other threads evict them does not raise."""
+    stack = MessageActionBuffer(2)
+    messages = [bytes([i % 4]) for i in range(20000)]
+
+    def add():
+        for message in messages:
+            stack.add(MessageAction(message, message, 0))
+
+    def match():
+        for message in messages:
+            stack.match_previous_messages(message)
+            stack.touch(message)
+
+    # Switch threads as often as possible, so lookups interleave with evictions
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(task) for task in (add, match, add, match)]
+    finally:
+        sys.setswitchinterval(switch_interval)
+    for future in futures:
+        future.result()
+    assert len(stack) == 2
@@ -0,0 +1,83 @@
+"""Tests for the MetricsExporter class."""
+
+import asyncio
+import urllib.error
+import urllib.request
+from queue import PriorityQueue
+from unittest.mock import Mock
+
+import pytest
+
+from rocket_controller.helper import MAX_U32
+from rocket_controller.metrics_exporter import MetricsExporter
+from rocket_controller.stage_timer import NullStageTimer, StageTimer
+
+
+def mock_strategy() -> Mock:
+    """Create a strategy of which the iteration validated some ledgers."""
+    strategy = Mock(spec=["iteration_type", "stage_timer"])
+    strategy.iteration_type.cur_iteration = 3
+    strategy.iteration_type.ledger_validation_map = {
+        1: {"seq": 7, "time": None},
+        0: {"seq": 8, "time": None},
+    }
+    strategy.iteration_type.to_be_validated_txs = [("alice", "bob", 10, "hash")]
+    strategy.stage_timer = NullStageTimer()
+    return strategy
+
+
+def test_count_packets():
+    """Test whether packets are counted per message type and per kind of action."""
+    exporter = MetricsExporter(mock_strategy())
+    exporter.count_packet(34, 0, False)
+    exporter.count_packet(34, MAX_U32, False)
+    exporter.count_packet(33, 200, True)
+    metrics = exporter.render()
+    assert 'rocket_packets_total{message_type="TMStatusChange"} 2' in metrics
+    assert 'rocket_packets_total{message_type="TMProposeSet"} 1' in metrics
+    assert 'rocket_actions_total{action="send"} 1' in metrics
+    assert 'rocket_actions_total{action="drop"} 1' in metrics
+    assert 'rocket_actions_total{action="delay"} 1' in metrics
+    assert "rocket_mutations_total 1" in metrics
+    assert "# TYPE rocket_packets_total counter" in metrics
+
+
+def test_render_iteration_state():
+    """Test whether the state of the iteration is rendered as gauges."""
+    metrics = MetricsExporter(mock_strategy()).render()
+    assert "rocket_iteration 3" in metrics
+    assert 'rocket_validated_ledger_seq{node="0"} 8' in metrics
+    assert 'rocket_validated_ledger_seq{node="1"} 7' in metrics
+    assert "rocket_outstanding_transactions 1" in metrics
+    assert "rocket_queue_depth" not in metrics
+    assert "rocket_stage_duration_seconds" not in metrics
+
+
+@pytest.mark.parametrize("queue_class", [PriorityQueue, asyncio.PriorityQueue])
+def test_render_queue_and_stages(queue_class):
+    """Test whether the queue of a strategy and the stage timings are rendered if present."""
+    strategy = mock_strategy()
+    strategy.queue = queue_class()
+    strategy.queue.put_nowait((1, "packet"))
+    strategy.stage_timer = StageTimer(summary_interval=0)
+    strategy.stage_timer.record("handle_packet", 34, strategy.stage_timer.now())
+    metrics = MetricsExporter(strategy).render()
+    assert "rocket_queue_depth 1" in metrics
+    labels = 'stage="handle_packet",message_type="TMStatusChange"'
+    assert f'rocket_stage_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in metrics
+    assert f"rocket_stage_duration_seconds_count{{{labels}}} 1" in metrics
+
+
+def test_serve_metrics():
+    """Test whether the metrics are served over HTTP on /metrics only."""
+    exporter = MetricsExporter(mock_strategy(), port=0)
+    port = exporter.start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as response:
+            assert response.status == 200
+            assert response.headers["Content-Type"].startswith("text/plain")
+            assert "rocket_iteration 3" in response.read().decode()
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/")
+    finally:
+        exporter.stop()
@@ -0,0 +1,41 @@
+"""Tests for the MigrationExchange class."""
+
+import numpy as np
+import pytest
+
+from rocket_controller.migration import MigrationExchange
+
+
+def test_ring(tmp_path):
+    """Test whether every island receives the migrants of the previous island."""
+    exchanges = [MigrationExchange(str(tmp_path), island, 3) for island in range(3)]
+    assert [exchange.source for exchange in exchanges] == [2, 0, 1]
+
+    exchanges[0].emigrate(5, np.array([[1, 2], [3, 4]]), np.array([2.0, 1.0]))
+    populations, fitness = exchanges[1].immigrate(5)
+    assert populations.tolist() == [[1, 2], [3, 4]]
+    assert fitness.tolist() == [2.0, 1.0]
+
+    assert exchanges[1].immigrate(10) is None
+    assert exchanges[2].immigrate(5) is None
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_immigrate_timeout(tmp_path):
+    """Test whether immigrating waits for the migrants until the timeout."""
+    exchange = MigrationExchange(str(tmp_path), 0, 2, poll_interval=0.01)
+    assert exchange.immigrate(1, timeout=0.05) is None
+
+    with pytest.raises(ValueError):
+        MigrationExchange(str(tmp_path), 2, 2)
+
+
+def test_namespace(tmp_path):
+    """Test whether runs with different namespaces do not exchange migrants."""
+    MigrationExchange(str(tmp_path), 0, 2, namespace="seed-1-").emigrate(
+        1, np.zeros((1, 2)), np.zeros(1)
+    )
+    assert (
+        MigrationExchange(str(tmp_path), 1, 2, namespace="seed-2-").immigrate(1) is None
+    )
+    assert MigrationExchange(str(tmp_path), 1, 2, namespace="seed-1-").immigrate(1)
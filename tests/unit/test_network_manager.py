@@ -47,6 +47,17 @@ def test_update_network():
         assert len(row) == 2
         for item in row:
             assert len(item.messages) == 0
+            assert item.capacity == 3
+
+
+def test_update_network_buffer_capacity():
+    """Test whether the message buffer capacity can be set in the network config."""
+    network = NetworkManager()
+    network.network_config = {"message_buffer_capacity": 50}
+    network.update_network([node_0, node_1])
+    for row in network.prev_message_action_matrix:
+        for item in row:
+            assert item.capacity == 50
 
 
 def test_port_to_id_invalid():
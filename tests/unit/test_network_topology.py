@@ -0,0 +1,69 @@
+"""Tests for the NetworkTopology class."""
+
+from rocket_controller.network_topology import NetworkTopology
+
+
+def test_init():
+    """Test whether no nodes can communicate in a new topology."""
+    topology = NetworkTopology(2)
+    assert topology.to_matrix() == [[False, False], [False, False]]
+    assert NetworkTopology().to_matrix() == []
+
+
+def test_partition():
+    """Test whether nodes can only communicate within their partition."""
+    topology = NetworkTopology(4)
+    topology.partition([[0, 3], [1, 2]])
+    assert topology.to_matrix() == [
+        [False, False, False, True],
+        [False, False, True, False],
+        [False, True, False, False],
+        [True, False, False, False],
+    ]
+
+
+def test_heal_all():
+    """Test whether all nodes can communicate after healing the topology."""
+    topology = NetworkTopology(3)
+    topology.isolate(0)
+    topology.heal_all()
+    assert topology.to_matrix() == [
+        [False, True, True],
+        [True, False, True],
+        [True, True, False],
+    ]
+
+
+def test_connect_disconnect():
+    """Test whether single connections are changed in both directions."""
+    topology = NetworkTopology(3)
+    topology.connect(0, 2)
+    assert topology.can_communicate(0, 2)
+    assert topology.can_communicate(2, 0)
+    assert not topology.can_communicate(0, 1)
+
+    topology.disconnect(2, 0)
+    assert not topology.can_communicate(0, 2)
+    assert not topology.can_communicate(2, 0)
+
+
+def test_large_topology():
+    """Test whether the topology supports more nodes than fit in a machine word."""
+    topology = NetworkTopology(100)
+    topology.partition([list(range(50)), list(range(50, 100))])
+    assert topology.can_communicate(0, 49)
+    assert topology.can_communicate(99, 50)
+    assert not topology.can_communicate(49, 50)
+    topology.isolate(75)
+    assert not topology.can_communicate(75, 99)
+    assert not topology.can_communicate(99, 75)
+    assert topology.can_communicate(98, 99)
+
+
+def test_cancel_scheduled():
+    """Test whether scheduled changes can be cancelled."""
+    topology = NetworkTopology(2)
+    timer = topology.schedule(60, topology.heal_all)
+    topology.cancel_scheduled()
+    timer.join()
+    assert not topology.can_communicate(0, 1)
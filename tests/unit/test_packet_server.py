@@ -1,12 +1,18 @@
 """Tests for the PacketServer class."""
 
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
 
 from protos import packet_pb2
+from rocket_controller.action_log_filter import ActionLogFilter
 from rocket_controller.encoder_decoder import PacketEncoderDecoder
+from rocket_controller.helper import MAX_U32
+from rocket_controller.metrics_exporter import MetricsExporter
 from rocket_controller.packet_server import PacketService
+from rocket_controller.stage_timer import StageTimer
+from tests.default_test_variables import status_msg_1, status_msg_2
 
 
 def test_send_packet_no_log():
@@ -37,24 +43,219 @@ def test_send_packet_with_log_no_logger():
 
 def test_send_packet_with_log_and_logger():
     """Test the send_packet method of PacketService with logging and an existing logger."""
-    packet = packet_pb2.Packet(data=b"test", from_port=10, to_port=20)
+    packet = packet_pb2.Packet(
+        data=PacketEncoderDecoder.encode_message(status_msg_1, 34),
+        from_port=10,
+        to_port=20,
+    )
     mock_strategy = Mock()
     mock_strategy.process_packet.return_value = (packet.data, 0, 1)
     mock_strategy.keep_action_log = True
     packet_server = PacketService(mock_strategy)
     packet_server.logger = Mock()
-    with patch.object(
-        PacketEncoderDecoder, "decode_packet", return_value=(Mock(), 61)
-    ) as mock_decode_packet:
-        packet_ack = packet_server.send_packet(packet, None)
-    assert mock_decode_packet.call_count == 2
-    assert packet_ack.data == b"test"
+    packet_ack = packet_server.send_packet(packet, None)
+    assert packet_ack.data == packet.data
     assert packet_ack.action == 0
     assert packet_ack.send_amount == 1
-    packet_server.logger.log_action.assert_called_once()
+    packet_server.logger.log_packet.assert_called_once()
+    mock_strategy.process_packet.assert_called_once()
+
+    # The packet is decoded once and shared between the strategy and the action log
+    processed = mock_strategy.process_packet.call_args.args[0]
+    logged = packet_server.logger.log_packet.call_args.kwargs
+    assert logged["original"] is processed
+    assert logged["possibly_mutated"] is processed
+
+
+def test_send_packet_with_log_filtered():
+    """Test the send_packet method of PacketService with an action log filter which skips the packet."""
+    packet = packet_pb2.Packet(
+        data=PacketEncoderDecoder.encode_message(status_msg_1, 34),
+        from_port=10,
+        to_port=20,
+    )
+    mock_strategy = Mock()
+    mock_strategy.process_packet.return_value = (packet.data, 0, 1)
+    mock_strategy.keep_action_log = True
+    mock_strategy.action_log_filter = ActionLogFilter(default_rate=0)
+    packet_server = PacketService(mock_strategy)
+    packet_server.logger = Mock()
+    packet_ack = packet_server.send_packet(packet, None)
+    assert packet_ack.data == packet.data
+    packet_server.logger.log_packet.assert_not_called()
+
+    mock_strategy.process_packet.return_value = (packet.data, MAX_U32, 1)
+    packet_server.send_packet(packet, None)
+    packet_server.logger.log_packet.assert_called_once()
+
+
+def test_send_packet_with_log_mutated():
+    """Test the send_packet method of PacketService with logging, a mutated packet should be decoded separately."""
+    packet = packet_pb2.Packet(
+        data=PacketEncoderDecoder.encode_message(status_msg_1, 34),
+        from_port=10,
+        to_port=20,
+    )
+    mutated_data = PacketEncoderDecoder.encode_message(status_msg_2, 34)
+    mock_strategy = Mock()
+    mock_strategy.process_packet.return_value = (mutated_data, 0, 1)
+    mock_strategy.keep_action_log = True
+    packet_server = PacketService(mock_strategy)
+    packet_server.logger = Mock()
+    packet_server.send_packet(packet, None)
+
+    logged = packet_server.logger.log_packet.call_args.kwargs
+    assert logged["original"].message == status_msg_1
+    assert logged["possibly_mutated"].data == mutated_data
+    assert logged["possibly_mutated"].message == status_msg_2
+
+
+def test_send_packet_stage_timing():
+    """Test whether the stages of send_packet are timed per message type when stage timing is enabled."""
+    packet = packet_pb2.Packet(
+        data=PacketEncoderDecoder.encode_message(status_msg_1, 34),
+        from_port=10,
+        to_port=20,
+    )
+    mock_strategy = Mock()
+    mock_strategy.process_packet.return_value = (packet.data, 0, 1)
+    mock_strategy.keep_action_log = True
+    mock_strategy.action_log_filter = None
+    mock_strategy.stage_timer = StageTimer(summary_interval=0)
+    packet_server = PacketService(mock_strategy)
+    packet_server.logger = Mock()
+    packet_server.send_packet(packet, None)
+
+    stages = mock_strategy.stage_timer.histograms()
+    for stage in ("validate", "process_packet", "log_decode", "log_write"):
+        assert stages[(stage, 34)].count == 1
+
+
+def test_send_packet_metrics():
+    """Test whether processed packets are counted by the metrics exporter."""
+    packet = packet_pb2.Packet(
+        data=PacketEncoderDecoder.encode_message(status_msg_1, 34),
+        from_port=10,
+        to_port=20,
+    )
+    mock_strategy = Mock()
+    mock_strategy.process_packet.return_value = (packet.data, MAX_U32, 1)
+    mock_strategy.keep_action_log = False
+    metrics = Mock(spec=MetricsExporter)
+    packet_server = PacketService(mock_strategy, metrics=metrics)
+    packet_server.send_packet(packet, None)
+    metrics.count_packet.assert_called_once_with(34, MAX_U32, False)
+
+
+def test_send_packets():
+    """Test the send_packets method of PacketService, acks should be in the order of the packets."""
+    packets = [
+        packet_pb2.Packet(data=b"test1", from_port=10, to_port=20),
+        packet_pb2.Packet(data=b"test2", from_port=10, to_port=21),
+    ]
+    mock_strategy = Mock()
+    mock_strategy.process_packets.return_value = [(b"test1", 0, 1), (b"mutated", 5, 2)]
+    mock_strategy.keep_action_log = False
+    mock_strategy.stage_timer = StageTimer(summary_interval=0)
+    packet_server = PacketService(mock_strategy)
+    batch_ack = packet_server.send_packets(
+        packet_pb2.PacketBatch(packets=packets), None
+    )
+    assert [(ack.data, ack.action, ack.send_amount) for ack in batch_ack.acks] == [
+        (b"test1", 0, 1),
+        (b"mutated", 5, 2),
+    ]
+    mock_strategy.process_packets.assert_called_once()
+    mock_strategy.process_packet.assert_not_called()
+    # Every packet of the batch is timed, like a packet sent on its own
+    stages = mock_strategy.stage_timer.summary()["stages"]
+    assert stages["validate"]["total"]["count"] == 2
+    assert stages["process_packet"]["total"]["count"] == 2
+
+
+def test_send_packets_invalid():
+    """Test the send_packets method of PacketService with invalid ports and missing results."""
+    mock_strategy = Mock()
+    mock_strategy.keep_action_log = False
+    packet_server = PacketService(mock_strategy)
+    batch = packet_pb2.PacketBatch(
+        packets=[packet_pb2.Packet(data=b"test", from_port=10, to_port=10)]
+    )
+    with pytest.raises(ValueError):
+        packet_server.send_packets(batch, None)
+    mock_strategy.process_packets.assert_not_called()
+
+    mock_strategy.process_packets.return_value = []
+    batch = packet_pb2.PacketBatch(
+        packets=[packet_pb2.Packet(data=b"test", from_port=10, to_port=20)]
+    )
+    with pytest.raises(ValueError):
+        packet_server.send_packets(batch, None)
+
+
+def test_stream_packets():
+    """Test the stream_packets method of PacketService, acks should carry the sequence of their packet."""
+    mock_strategy = Mock()
+    mock_strategy.process_packet.side_effect = lambda packet: (
+        packet.data + b"-processed",
+        packet.from_port,
+        1,
+    )
+    mock_strategy.keep_action_log = False
+    packet_server = PacketService(mock_strategy)
+    requests = [
+        packet_pb2.SequencedPacket(
+            sequence=i,
+            packet=packet_pb2.Packet(data=bytes([i]), from_port=i + 1, to_port=0),
+        )
+        for i in range(20)
+    ]
+    acks = list(packet_server.stream_packets(iter(requests), None))
+    assert len(acks) == 20
+    for ack in acks:
+        assert ack.ack.data == bytes([ack.sequence]) + b"-processed"
+        assert ack.ack.action == ack.sequence + 1
+        assert ack.ack.send_amount == 1
+    assert sorted(ack.sequence for ack in acks) == list(range(20))
+    assert mock_strategy.process_packet.call_count == 20
+
+    # The threads processing the packets of the stream stop once the stream ended
+    workers = [t for t in threading.enumerate() if t.name.startswith("StreamPacket_")]
+    for worker in workers:
+        worker.join(timeout=5)
+    assert not any(worker.is_alive() for worker in workers)
+
+
+def test_stream_packets_invalid_ports():
+    """Test whether a packet containing equal ports is dropped, without ending the stream."""
+    mock_strategy = Mock()
+    mock_strategy.process_packet.side_effect = lambda packet: (packet.data, 0, 1)
+    mock_strategy.keep_action_log = False
+    packet_server = PacketService(mock_strategy)
+    requests = [
+        packet_pb2.SequencedPacket(
+            sequence=0, packet=packet_pb2.Packet(data=b"test", from_port=10, to_port=10)
+        ),
+        packet_pb2.SequencedPacket(
+            sequence=1, packet=packet_pb2.Packet(data=b"next", from_port=10, to_port=11)
+        ),
+    ]
+    acks = {
+        ack.sequence: ack.ack
+        for ack in packet_server.stream_packets(iter(requests), None)
+    }
+    assert acks[0].action == MAX_U32
+    assert acks[0].data == b"test"
+    assert acks[1].action == 0
     mock_strategy.process_packet.assert_called_once()
 
 
+def test_stream_packets_empty():
+    """Test the stream_packets method of PacketService with an empty stream."""
+    packet_server = PacketService(Mock())
+    assert list(packet_server.stream_packets(iter([]), None)) == []
+
+
 def test_send_validator_node_info_no_log():
     """Test the send_validator_node_info method of PacketService without logging."""
     mock_strategy = Mock()
@@ -91,10 +292,13 @@ def test_send_validator_node_info_with_existing_logger():
     with patch(
         "rocket_controller.packet_server.ActionLogger", return_value=mock_logger
     ):
-        packet_server.logger = mock_logger
+        previous_logger = Mock()
+        packet_server.logger = previous_logger
         request_iterator = [packet_pb2.ValidatorNodeInfo()]
         response = packet_server.send_validator_node_info(request_iterator, None)
         assert response.status == "Received validator node info"
+        previous_logger.close.assert_called_once()
+        assert packet_server.logger is mock_logger
 
 
 def test_get_config():
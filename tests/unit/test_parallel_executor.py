@@ -0,0 +1,115 @@
+"""Tests for the parallel executor."""
+
+import os
+import shutil
+from unittest.mock import Mock, patch
+
+import pytest
+
+from rocket_controller.csv_logger import SpecCheckLogger
+from rocket_controller.parallel_executor import (
+    merge_results,
+    plan_workers,
+    prepare_interceptor_dir,
+    run_worker,
+)
+
+network_config = {
+    "number_of_nodes": 5,
+    "base_port_peer": 60000,
+    "base_port_ws": 61000,
+    "base_port_ws_admin": 62000,
+    "base_port_rpc": 63000,
+}
+
+
+def test_plan_workers():
+    """Test whether iterations are divided over the workers, which get separate ports and directories."""
+    workers = plan_workers(3, 10, network_config, "campaign")
+    assert [w.iterations for w in workers] == [4, 3, 3]
+    assert [w.controller_port for w in workers] == [50051, 50052, 50053]
+    assert workers[2].network_overrides == {
+        "base_port_peer": 60010,
+        "base_port_ws": 61010,
+        "base_port_ws_admin": 62010,
+        "base_port_rpc": 63010,
+    }
+    assert workers[1].log_dir == "campaign/worker-1"
+    assert workers[1].interceptor_dir == "./rocket_interceptor/worker-1"
+    assert len(workers[1].node_ports) == 4 * 5
+    assert workers[1].node_ports[:5] == (60005, 60006, 60007, 60008, 60009)
+    assert not set(workers[0].node_ports) & set(workers[1].node_ports)
+
+
+def test_plan_workers_more_workers_than_iterations():
+    """Test whether workers without iterations are left out."""
+    assert len(plan_workers(8, 3, network_config, "campaign")) == 3
+
+
+def test_plan_workers_invalid():
+    """Test whether overlapping port blocks and empty campaigns are rejected."""
+    with pytest.raises(ValueError):
+        plan_workers(201, 300, network_config, "campaign")
+    with pytest.raises(ValueError):
+        plan_workers(0, 10, network_config, "campaign")
+
+
+def test_prepare_interceptor_dir(tmp_path):
+    """Test whether the network files are copied and the executable is linked."""
+    source = tmp_path / "rocket_interceptor"
+    (source / "network").mkdir(parents=True)
+    (source / "network" / "ledger.json").write_text("{}")
+    (source / "rocket-interceptor").write_text("")
+    worker_dir = tmp_path / "worker-0"
+
+    with patch("rocket_controller.parallel_executor.platform", "linux"):
+        prepare_interceptor_dir(str(worker_dir), str(source))
+        prepare_interceptor_dir(str(worker_dir), str(source))
+    assert (worker_dir / "network" / "ledger.json").read_text() == "{}"
+    assert (worker_dir / "rocket-interceptor").is_symlink()
+
+
+def test_run_worker():
+    """Test whether a worker serves its strategy on its own port, with its own ports and log directory."""
+    worker = plan_workers(2, 2, network_config, "campaign")[1]
+    strategy_class = Mock()
+    with (
+        patch(
+            "rocket_controller.parallel_executor.str_to_strategy",
+            return_value=strategy_class,
+        ),
+        patch("rocket_controller.parallel_executor.serve") as mock_serve,
+    ):
+        run_worker(
+            "RandomFuzzer", {"network_overrides": {"number_of_nodes": 5}}, worker
+        )
+
+    params = strategy_class.call_args.kwargs
+    assert params["network_overrides"]["number_of_nodes"] == 5
+    assert params["network_overrides"]["base_port_peer"] == 60005
+    assert params["log_dir"] == "campaign/worker-1"
+    interceptor_manager = params["iteration_type"]._interceptor_manager
+    assert interceptor_manager.controller_port == 50052
+    assert not interceptor_manager.cleanup_containers
+    assert interceptor_manager.container_ports == worker.node_ports
+    mock_serve.assert_called_once_with(strategy_class.return_value, port=50052)
+
+
+def test_merge_results():
+    """Test whether the spec checks of all workers are merged and aggregated."""
+    log_dir = "test_parallel_executor"
+    workers = plan_workers(2, 4, network_config, log_dir)
+    first_worker_logger = SpecCheckLogger(workers[0].log_dir)
+    first_worker_logger.log_spec_check(1, True, True, True)
+    first_worker_logger.log_spec_check(2, False, True, True)
+    SpecCheckLogger(workers[1].log_dir).log_spec_check(1, True, False, True)
+    try:
+        results = merge_results(log_dir, workers)
+        assert results["total_iterations"] == 3
+        assert results["correct_runs"] == 1
+        assert results["failed_termination_iterations"] == ["worker-0/iteration-2"]
+        assert results["failed_agreement_iterations"] == ["worker-1/iteration-1"]
+    finally:
+        shutil.rmtree(f"./logs/{log_dir}")
+        if not os.listdir("./logs"):
+            os.rmdir("./logs")
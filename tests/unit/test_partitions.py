@@ -124,3 +124,35 @@ def test_apply_partition():
         network.check_communication(2, 2)
 
     assert network.check_communication(1, 0)
+
+
+def test_isolate_node():
+    """Test whether an isolated node can not communicate with any other node."""
+    network = NetworkManager()
+    network.update_network([node_0, node_1, node_2])
+    network.isolate_node(1)
+    assert network.communication_matrix == [
+        [False, False, True],
+        [False, False, False],
+        [True, False, False],
+    ]
+
+    with pytest.raises(ValueError):
+        network.isolate_node(-1)
+
+
+def test_schedule_topology_change():
+    """Test whether a scheduled change gets applied, and cancelled when the network is updated."""
+    network = NetworkManager()
+    network.update_network([node_0, node_1, node_2])
+    timer = network.schedule_topology_change(
+        0, network.partition_network, [[0], [1, 2]]
+    )
+    timer.join()
+    assert not network.check_communication(0, 1)
+    assert network.check_communication(1, 2)
+
+    timer = network.schedule_topology_change(60, network.isolate_node, 2)
+    network.update_network([node_0, node_1, node_2])
+    assert timer.finished.is_set()
+    assert network.check_communication(0, 1)
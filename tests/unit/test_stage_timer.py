@@ -0,0 +1,152 @@
+"""Tests for the StageTimer class."""
+
+import json
+import os
+import shutil
+import threading
+
+from rocket_controller.stage_timer import (
+    BUCKET_BOUNDS_NS,
+    LatencyHistogram,
+    NullStageTimer,
+    StageTimer,
+    message_type_name,
+)
+
+
+def test_histogram_buckets():
+    """Test whether durations are counted in the smallest bucket which fits them."""
+    histogram = LatencyHistogram()
+    for duration_ns in (0, 1000, 1001, 2000, 2001, 10**12):
+        histogram.add(duration_ns)
+    assert histogram.counts[0] == 2
+    assert histogram.counts[1] == 2
+    assert histogram.counts[2] == 1
+    assert histogram.counts[len(BUCKET_BOUNDS_NS)] == 1
+    assert histogram.count == 6
+    assert histogram.max_ns == 10**12
+
+
+def test_histogram_percentile():
+    """Test whether percentiles are estimated by the upper bound of their bucket, capped by the maximum."""
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) == 0
+    for _ in range(90):
+        histogram.add(500)
+    for _ in range(10):
+        histogram.add(3000)
+    assert histogram.percentile(50) == 1000
+    assert histogram.percentile(90) == 1000
+    assert histogram.percentile(99) == 3000
+    assert histogram.summary()["mean_us"] == 0.75
+
+
+def test_histogram_merge():
+    """Test whether merging adds the counts, sums and maximum of another histogram."""
+    histogram = LatencyHistogram()
+    histogram.add(500)
+    other = LatencyHistogram()
+    other.add(5000)
+    histogram.merge(other)
+    assert histogram.count == 2
+    assert histogram.total_ns == 5500
+    assert histogram.max_ns == 5000
+
+
+def test_record_and_summary():
+    """Test whether stages are recorded per message type and summarized in total."""
+    timer = StageTimer("RandomFuzzer", summary_interval=0)
+    timer.record("handle_packet", 34, timer.now())
+    timer.record("handle_packet", 33, timer.now())
+    timer.record("validate", 34, timer.now())
+    summary = timer.summary()
+    assert summary["strategy"] == "RandomFuzzer"
+    assert list(summary["stages"]) == ["validate", "handle_packet"]
+    handle_packet = summary["stages"]["handle_packet"]
+    assert handle_packet["total"]["count"] == 2
+    assert set(handle_packet["by_message_type"]) == {"TMProposeSet", "TMStatusChange"}
+
+    timer.reset()
+    assert timer.summary()["stages"] == {}
+
+
+def test_record_batch():
+    """Test whether the duration of a batch is divided over its packets, and every packet is counted once."""
+    timer = StageTimer("RandomFuzzer", summary_interval=0)
+    start = timer.now() - 3_000_000
+    timer.record_batch("process_packet", [34, 34, 33], start)
+    timer.record_batch("process_packet", [], start)
+    histograms = timer.histograms()
+    assert histograms[("process_packet", 34)].count == 2
+    assert histograms[("process_packet", 33)].count == 1
+    assert histograms[("process_packet", 33)].total_ns >= 1_000_000
+
+
+def test_start_iteration():
+    """Test whether the summary of an iteration is written when the next iteration starts."""
+    base_dir = "./logs/test_stage_timer"
+    timer = StageTimer(summary_interval=0)
+    timer.start_iteration(f"{base_dir}/stage_timing-1.json")
+    timer.record("process_packet", 34, timer.now())
+    timer.start_iteration(f"{base_dir}/stage_timing-2.json")
+    timer.close()
+    try:
+        with open(f"{base_dir}/stage_timing-1.json") as f:
+            first = json.load(f)
+        with open(f"{base_dir}/stage_timing-2.json") as f:
+            second = json.load(f)
+        assert first["stages"]["process_packet"]["total"]["count"] == 1
+        assert second["stages"] == {}
+    finally:
+        shutil.rmtree(base_dir)
+        if not os.listdir("./logs"):
+            os.rmdir("./logs")
+
+
+def test_start_iteration_concurrent(tmp_path):
+    """Test whether every duration recorded while iterations switch is written to exactly one summary."""
+    timer = StageTimer(summary_interval=0.001)
+    timer.start_iteration(str(tmp_path / "stage_timing-1.json"))
+    recorded = 0
+    done = threading.Event()
+
+    def record():
+        nonlocal recorded
+        while not done.is_set():
+            timer.record("process_packet", 34, timer.now())
+            recorded += 1
+
+    recorder = threading.Thread(target=record)
+    recorder.start()
+    for iteration in range(2, 20):
+        timer.start_iteration(str(tmp_path / f"stage_timing-{iteration}.json"))
+    done.set()
+    recorder.join()
+    timer.close()
+
+    counts = []
+    for iteration in range(1, 20):
+        with open(tmp_path / f"stage_timing-{iteration}.json") as f:
+            stages = json.load(f)["stages"]
+        counts.append(
+            stages.get("process_packet", {"total": {"count": 0}})["total"]["count"]
+        )
+    assert sum(counts) == recorded
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_null_stage_timer():
+    """Test whether the NullStageTimer records and writes nothing."""
+    timer = NullStageTimer()
+    assert not timer.enabled
+    timer.start_iteration("./logs/test_null_stage_timer/stage_timing-1.json")
+    timer.record("process_packet", 34, timer.now())
+    timer.close()
+    assert timer.summary()["stages"] == {}
+    assert not os.path.exists("./logs/test_null_stage_timer")
+
+
+def test_message_type_name():
+    """Test whether unknown message types are named by their number."""
+    assert message_type_name(34) == "TMStatusChange"
+    assert message_type_name(-1) == "-1"
@@ -3,11 +3,14 @@
 from encodings.utf_8 import encode
 from unittest.mock import MagicMock, Mock, patch
 
+import pytest
+
 from protos import packet_pb2
+from rocket_controller.cli_helper import str_to_strategy
 from rocket_controller.encoder_decoder import PacketEncoderDecoder
 from rocket_controller.helper import MAX_U32
 from rocket_controller.iteration_type import LedgerBasedIteration
-from rocket_controller.strategies import RandomFuzzer
+from rocket_controller.strategies import RandomFuzzer, Strategy
 from tests.default_test_variables import configs, node_0, node_1, node_2, status_msg_1
 
 
@@ -24,6 +27,34 @@ def test_init(mock_init_configs):
     assert strategy.auto_parse_identical
     assert strategy.network.prev_message_action_matrix == []
     assert strategy.keep_action_log
+    assert strategy.action_log_format == "csv"
+
+
+@patch(
+    "rocket_controller.strategies.random_fuzzer.Strategy.init_configs",
+    return_value=configs,
+)
+def test_init_invalid_action_log_format(mock_init_configs):
+    """Test whether an unsupported action log format is rejected."""
+
+    class LogFormatStrategy(Strategy):
+        def handle_packet(self, packet):
+            return packet.data, 0, 1
+
+        def setup(self):
+            pass
+
+    strategy = LogFormatStrategy(action_log_format="binary", iteration_type=Mock())
+    assert strategy.action_log_format == "binary"
+    with pytest.raises(ValueError):
+        LogFormatStrategy(action_log_format="parquet", iteration_type=Mock())
+
+    # Subclasses passing the original arguments positionally keep working
+    iteration_type = Mock()
+    strategy = LogFormatStrategy(None, None, True, True, True, False, iteration_type)
+    assert not strategy.keep_action_log
+    assert strategy.iteration_type is iteration_type
+    assert strategy.action_log_format == "csv"
 
 
 @patch(
@@ -163,5 +194,57 @@ def test_update_status_other_message(mock_init_configs):
     strategy = RandomFuzzer(iteration_type=iteration_type)
     mock_init_configs.assert_called_once()
 
-    strategy.update_status(packet)
+    # The message type is read from the header, the message itself is never decoded
+    with patch.object(PacketEncoderDecoder, "decode_packet") as mock_decode_packet:
+        strategy.update_status(packet)
+    mock_decode_packet.assert_not_called()
     iteration_type.on_status_change.assert_not_called()
+
+
+@patch(
+    "rocket_controller.strategies.random_fuzzer.Strategy.init_configs",
+    return_value=configs,
+)
+def test_process_packets(mock_init_configs):
+    """Test whether process_packets processes every packet of the batch in order."""
+    strategy = RandomFuzzer(iteration_type=Mock())
+    strategy.update_network([node_0, node_1, node_2])
+    strategy.process_packet = Mock(side_effect=lambda packet: (packet.data, 0, 1))
+    packets = [
+        packet_pb2.Packet(data=b"test1", from_port=10, to_port=11),
+        packet_pb2.Packet(data=b"test2", from_port=10, to_port=12),
+    ]
+    assert strategy.process_packets(packets) == [(b"test1", 0, 1), (b"test2", 0, 1)]
+    assert strategy.process_packet.call_count == 2
+
+
+@patch(
+    "rocket_controller.strategies.random_fuzzer.Strategy.init_configs",
+    return_value=configs,
+)
+def test_init_log_dir(mock_init_configs):
+    """Test whether the log directory is passed from a Strategy subclass to its iteration type."""
+    iteration_type = Mock()
+    strategy = RandomFuzzer(iteration_type=iteration_type, log_dir="campaign/worker-1")
+    assert strategy.log_dir == "campaign/worker-1"
+    iteration_type.set_log_dir.assert_called_once_with("campaign/worker-1")
+
+
+@pytest.mark.parametrize(
+    "strategy_name",
+    ["RandomFuzzer", "MutationExample", "EvoDelayStrategy", "EvoPriorityStrategy"],
+)
+def test_strategies_accept_log_dir(strategy_name):
+    """Test whether every bundled strategy can be built with a log directory, which parallel runs rely on."""
+    network_config, strategy_config = configs
+    encoded_configs = (network_config, {**strategy_config, "encoding": [0] * 42})
+    iteration_type = Mock()
+    with patch(
+        "rocket_controller.strategies.strategy.Strategy.init_configs",
+        return_value=encoded_configs,
+    ):
+        strategy = str_to_strategy(strategy_name)(
+            iteration_type=iteration_type, log_dir="campaign/worker-1"
+        )
+    assert strategy.log_dir == "campaign/worker-1"
+    iteration_type.set_log_dir.assert_called_once_with("campaign/worker-1")
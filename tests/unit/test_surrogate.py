@@ -0,0 +1,38 @@
+"""Tests for the surrogate models of the fitness of encodings."""
+
+import numpy as np
+import pytest
+
+from rocket_controller.surrogate import SURROGATES, KNearestSurrogate, screen
+
+
+def test_k_nearest_surrogate():
+    """Test whether the prediction is the mean fitness of the nearest encodings."""
+    surrogate = KNearestSurrogate(0, 10, neighbours=2)
+    encodings = np.array([[0, 0], [1, 1], [10, 10], [9, 9], [5, 5]])
+    surrogate.fit(encodings, np.array([1.0, 3.0, 10.0, 20.0, -np.inf]))
+
+    prediction, uncertainty = surrogate.predict(np.array([[0, 1], [10, 10], [5, 5]]))
+    assert prediction.tolist() == [2.0, 15.0, 11.5]
+    assert uncertainty[:2] == pytest.approx([np.sqrt(0.01 / 2)] * 2)
+    assert uncertainty[2] == pytest.approx(0.4)
+
+
+def test_k_nearest_surrogate_unfitted():
+    """Test whether an unfitted surrogate is uncertain about everything."""
+    surrogate = SURROGATES["knn"](0, 10)
+    prediction, uncertainty = surrogate.predict(np.zeros((3, 4)))
+    assert prediction.tolist() == [0.0] * 3
+    assert uncertainty.tolist() == [1.0] * 3
+
+    with pytest.raises(ValueError):
+        KNearestSurrogate(0, 10, neighbours=0)
+
+
+def test_screen():
+    """Test whether exploration trades off promising against uncertain encodings."""
+    prediction = np.array([1.0, 3.0, 2.0, 0.0])
+    uncertainty = np.array([0.0, 0.0, 0.5, 1.0])
+    assert screen(prediction, uncertainty, 2, 0.0).tolist() == [1, 2]
+    assert screen(prediction, uncertainty, 2, 10.0).tolist() == [2, 3]
+    assert screen(prediction, uncertainty, 10, 0.0).tolist() == [0, 1, 2, 3]